@@ -0,0 +1,102 @@
+"""
+Compare password validations per second with audit logging off and on.
+
+Three setups are timed on the same mix of valid and invalid passwords:
+no audit logging, the queued audit pipeline from
+``myutils.auth.audit_log``, and the original synchronous ``FileHandler``
+that wrote every line to disk on the calling thread. With one core the
+listener thread competes with the caller, so the queued setup is also
+reported including the time to drain the queue at shutdown.
+
+Usage:
+    python benchmarks/bench_audit_logging.py [--validations 50000]
+"""
+
+import argparse
+import logging
+import random
+import string
+import tempfile
+import time
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from myutils.auth.audit_log import (
+    DEFAULT_FORMAT,
+    audit_password_validation,
+    disable_audit_logging,
+    enable_audit_logging,
+)
+from myutils.auth.password_strength_checker import User
+
+
+def _passwords(count: int, seed: int) -> list:
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + string.digits + "!@#$%"
+    return [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(4, 16)))
+        for _ in range(count)
+    ]
+
+
+def _validate(passwords, log) -> float:
+    start = time.perf_counter()
+    for pwd in passwords:
+        try:
+            User(password=pwd)
+            log(True, None, None, len(pwd))
+        except ValidationError as e:
+            log(False, None, e.errors()[0]["msg"], len(pwd))
+    return time.perf_counter() - start
+
+
+def _report(label: str, elapsed: float, count: int) -> None:
+    print(f"{label:<32} {count / elapsed:12,.0f} validations/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--validations", type=int, default=50000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    passwords = _passwords(args.validations, args.seed)
+    count = len(passwords)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        elapsed = _validate(passwords, audit_password_validation)
+        _report("audit logging off", elapsed, count)
+
+        enable_audit_logging(Path(tmp) / "queued.log")
+        elapsed = _validate(passwords, audit_password_validation)
+        _report("queued audit logging", elapsed, count)
+        start = time.perf_counter()
+        disable_audit_logging()
+        drain = time.perf_counter() - start
+        print(f"{'  (drain at shutdown)':<32} {drain:12.3f} s")
+        _report("  (including the drain)", elapsed + drain, count)
+
+        # The original setup: a FileHandler on the calling thread.
+        logger = logging.getLogger("bench.sync")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        handler = logging.FileHandler(Path(tmp) / "sync.log", encoding="utf-8")
+        handler.setFormatter(logging.Formatter(DEFAULT_FORMAT))
+        logger.addHandler(handler)
+
+        def sync_log(accepted, username, reason, length):
+            if accepted:
+                logger.info("Valid password accepted | user=%s", username)
+            else:
+                logger.error("Invalid password attempt | Reason: %s", reason)
+
+        _report("synchronous FileHandler", _validate(passwords, sync_log), count)
+        handler.close()
+
+        lines = sum(1 for _ in open(Path(tmp) / "queued.log", encoding="utf-8"))
+        assert lines == count, (lines, count)
+
+
+if __name__ == "__main__":
+    main()
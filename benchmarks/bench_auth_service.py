@@ -0,0 +1,101 @@
+"""
+Measure login latency of the asyncio auth service under concurrent load.
+
+Users are registered once; then, for each concurrency level, that many
+clients log in and out in a loop through ``LocalTransport`` (JSON in and
+out, as over a network) until the requested number of logins is done.
+Every tenth login uses a wrong password. The script reports throughput
+and p50/p99 latency per level.
+
+Key derivation dominates a real login, so latency mostly reflects the
+hash cost and the number of cores. Lower ``--scrypt-n`` to measure the
+service overhead itself.
+
+Usage:
+    python benchmarks/bench_auth_service.py [--logins 2000]
+        [--concurrency 1 10 100 1000] [--scrypt-n 1024]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from myutils.auth.auth_service import AuthClient, AuthService, LocalTransport
+from myutils.auth.credential_store import CredentialStore, ScryptHasher
+
+
+def _percentile(sorted_values, fraction: float) -> float:
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+async def _client(client: AuthClient, users: int, logins, latencies: list):
+    while True:
+        try:
+            n = next(logins)
+        except StopIteration:
+            return
+        username = f"user{n % users}"
+        password = "wrong1" if n % 10 == 9 else f"secret{n % users}"
+        start = time.perf_counter()
+        result = await client.login(username, password)
+        latencies.append(time.perf_counter() - start)
+        if result.token:
+            await client.logout(result.token)
+
+
+async def _run(args) -> None:
+    hasher = ScryptHasher(n=args.scrypt_n, r=8, p=1)
+    store = CredentialStore(hasher=hasher, max_workers=args.workers)
+    # Allow every wrong password: this measures latency, not lockout.
+    service = AuthService(store, max_attempts=args.logins + 1)
+    client = AuthClient(LocalTransport(service))
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(client.register(f"user{i}", f"secret{i}") for i in range(args.users))
+    )
+    print(f"registered {args.users} users in {time.perf_counter() - start:.2f} s")
+    print(f"{'clients':>8} {'logins/s':>10} {'p50 ms':>9} {'p99 ms':>9}")
+
+    for concurrency in args.concurrency:
+        logins = iter(range(args.logins))
+        latencies: list = []
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(
+                _client(client, args.users, logins, latencies)
+                for _ in range(concurrency)
+            )
+        )
+        elapsed = time.perf_counter() - start
+        latencies.sort()
+        print(
+            f"{concurrency:>8} {len(latencies) / elapsed:10,.0f} "
+            f"{statistics.median(latencies) * 1000:9.2f} "
+            f"{_percentile(latencies, 0.99) * 1000:9.2f}"
+        )
+    store.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--logins", type=int, default=2000)
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[1, 10, 100, 1000]
+    )
+    parser.add_argument(
+        "--scrypt-n",
+        type=int,
+        default=1024,
+        help="scrypt cost for the benchmark (production default: 16384, p=5)",
+    )
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
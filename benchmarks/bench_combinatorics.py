@@ -0,0 +1,73 @@
+"""
+Compare binomial coefficient kernels with the inline factorial expression.
+
+The baseline is the expression from ``pascal_triangle.py``:
+``factorial(n) // (factorial(r) * factorial(n - r))``, reduced modulo a
+prime afterwards where a modulus is needed.
+
+Usage:
+    python benchmarks/bench_combinatorics.py [--queries 20000] [--max-n 2000]
+"""
+
+import argparse
+import random
+import time
+from math import factorial
+
+import numpy as np
+
+from myutils.math_ops.combinatorics import binom, binom_many, binom_mod
+
+MOD = 1_000_000_007
+
+
+def inline_binom(n: int, r: int) -> int:
+    """The original inline expression from ``pascal_triangle.py``."""
+    return factorial(n) // (factorial(r) * factorial(n - r))
+
+
+def _timed(label: str, func, queries) -> list:
+    start = time.perf_counter()
+    results = [func(n, r) for n, r in queries]
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:8.3f}s {elapsed / len(queries) * 1e6:10.2f} us/query")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--queries", type=int, default=20000)
+    parser.add_argument("--max-n", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    queries = []
+    for _ in range(args.queries):
+        n = rng.randrange(args.max_n)
+        queries.append((n, rng.randint(0, n)))
+
+    print("Exact coefficients")
+    expected = _timed("inline factorial", inline_binom, queries)
+    assert _timed("binom", binom, queries) == expected
+
+    print(f"\nModulo {MOD}")
+    expected = _timed(
+        "inline factorial % p", lambda n, r: inline_binom(n, r) % MOD, queries
+    )
+    assert _timed("binom_mod", lambda n, r: binom_mod(n, r, MOD), queries) == expected
+
+    ns = np.array([n for n, _ in queries])
+    rs = np.array([r for _, r in queries])
+    start = time.perf_counter()
+    vectorized = binom_many(ns, rs, MOD)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{'binom_many (vectorized)':<28} {elapsed:8.3f}s "
+        f"{elapsed / len(queries) * 1e6:10.2f} us/query"
+    )
+    assert vectorized.tolist() == expected
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Measure the cold import time of myutils and check it against a budget.
+
+Every run starts a fresh interpreter with ``python -X importtime`` that
+imports the package and all subpackages. The script fails (exit status 1)
+if the median total import time exceeds the budget, if importing prints
+anything or waits for input, or if a heavy dependency (NumPy, Pydantic)
+is loaded before any attribute is used.
+
+Usage:
+    python benchmarks/bench_import_time.py [--runs 7] [--budget-ms 25]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+import myutils
+
+HEAVY_MODULES = ("numpy", "pydantic")
+"""Dependencies that must not be loaded by a bare package import."""
+
+_PROBE = (
+    "import sys; sys.stderr.write('heavy=' + ','.join("
+    "m for m in {heavy!r} if m in sys.modules) + '\\n')"
+)
+
+
+def _parse(stderr: str):
+    """Return the top-level myutils entries and the heavy-module probe."""
+    cumulative = {}
+    heavy = ""
+    for line in stderr.splitlines():
+        if line.startswith("heavy="):
+            heavy = line[len("heavy=") :]
+            continue
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, total, name = line[len("import time:") :].split("|")
+        if total.strip().isdigit() and name.strip().startswith("myutils"):
+            # Nested imports are indented; count only the top-level ones
+            # so nothing is added twice.
+            if not name[1:].startswith(" "):
+                cumulative[name.strip()] = int(total)
+    return cumulative, heavy
+
+
+def _run(modules) -> tuple:
+    code = f"import {', '.join(modules)}; " + _PROBE.format(heavy=HEAVY_MODULES)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=True,
+    )
+    return completed.stdout, *_parse(completed.stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=25.0,
+        help="Maximum median time to import myutils and every subpackage",
+    )
+    parser.add_argument(
+        "--modules",
+        nargs="+",
+        default=["myutils"] + [f"myutils.{name}" for name in myutils.__all__],
+    )
+    args = parser.parse_args()
+
+    samples = {}
+    totals = []
+    problems = []
+    for _ in range(args.runs):
+        try:
+            stdout, cumulative, heavy = _run(args.modules)
+        except subprocess.TimeoutExpired:
+            sys.exit("Import blocked (waiting for input?)")
+        if stdout:
+            problems.append(f"importing printed output: {stdout.strip()[:80]!r}")
+        if heavy:
+            problems.append(f"heavy dependencies loaded at import: {heavy}")
+        for name, micros in cumulative.items():
+            samples.setdefault(name, []).append(micros)
+        totals.append(sum(cumulative.values()))
+
+    print(f"{'module':<28} {'median ms':>10} {'max ms':>10}")
+    for name, values in samples.items():
+        print(
+            f"{name:<28} {statistics.median(values) / 1000:10.2f} "
+            f"{max(values) / 1000:10.2f}"
+        )
+
+    median_total = statistics.median(totals) / 1000
+    print(f"\n{'total':<28} {median_total:10.2f} ms (budget {args.budget_ms} ms)")
+
+    for problem in dict.fromkeys(problems):
+        print(f"FAIL: {problem}")
+    if median_total > args.budget_ms:
+        print("FAIL: import time over budget")
+    if problems or median_total > args.budget_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Measure password strength estimations per second on one core.
+
+Passwords are scored with ``myutils.auth.password_strength`` in several
+workloads: typical 8-16 character passwords, patterned ones built from
+common words, years and keyboard walks, and 128-character inputs (the
+longest the password models accept), both random and patterned. The
+one-off cost of building the shared estimator is reported separately.
+
+Usage:
+    python benchmarks/bench_password_strength.py [--passwords 5000]
+"""
+
+import argparse
+import random
+import string
+import time
+
+from myutils.auth.password_strength import StrengthEstimator
+
+_PIECES = (
+    "password", "dragon", "Summer", "monkey", "qwerty", "asdf", "zxcvbn",
+    "2019", "1987", "13/05", "123", "abc", "!!", "@", "P@ss", "w0rd", "xX",
+)  # fmt: skip
+
+
+def _random(rng: random.Random, length: int) -> str:
+    alphabet = string.ascii_letters + string.digits + string.punctuation
+    return "".join(rng.choice(alphabet) for _ in range(length))
+
+
+def _patterned(rng: random.Random, length: int) -> str:
+    password = ""
+    while len(password) < length:
+        password += rng.choice(_PIECES)
+    return password[:length]
+
+
+def _workloads(count: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    return {
+        "random 8-16 chars": [_random(rng, rng.randint(8, 16)) for _ in range(count)],
+        "patterned 8-16 chars": [
+            _patterned(rng, rng.randint(8, 16)) for _ in range(count)
+        ],
+        "random 128 chars": [_random(rng, 128) for _ in range(count // 10)],
+        "patterned 128 chars": [_patterned(rng, 128) for _ in range(count // 10)],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--passwords", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    estimator = StrengthEstimator()
+    build = time.perf_counter() - start
+    print(f"{'build estimator (once)':<24} {build * 1000:12.1f} ms")
+
+    for label, passwords in _workloads(args.passwords, args.seed).items():
+        start = time.perf_counter()
+        estimates = estimator.estimate_many(passwords)
+        elapsed = time.perf_counter() - start
+        mean_score = sum(estimate.score for estimate in estimates) / len(estimates)
+        print(
+            f"{label:<24} {len(passwords) / elapsed:12,.0f} passwords/s "
+            f"{elapsed / len(passwords) * 1e6:10,.0f} us each "
+            f"(mean score {mean_score:.2f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Compare the primality backend with the original implementations.
+
+The two original checks are reproduced here as reference functions:
+trial division up to sqrt(n) and the O(n) loop from ``prime_no_check``.
+Slow implementations are skipped for magnitudes where a single call
+would take too long.
+
+Usage:
+    python benchmarks/bench_primality.py [--samples 200] [--seed 0]
+"""
+
+import argparse
+import random
+import time
+
+from myutils.math_ops.primality import is_prime
+
+BUCKETS = (10**3, 10**6, 10**9, 10**12, 10**15, 10**18, 2**64, 10**30)
+TRIAL_DIVISION_MAX = 10**12
+LINEAR_MAX = 10**6
+
+
+def legacy_trial_division(n: int) -> bool:
+    """Original ``prime_checker.is_prime``: trial division up to sqrt(n)."""
+    if n <= 1:
+        return False
+    for i in range(2, int(n**0.5) + 1):
+        if n % i == 0:
+            return False
+    return True
+
+
+def legacy_linear(n: int) -> bool:
+    """Original ``prime_no_check.isPrime``: trial division up to n."""
+    if n == 0 or n == 1:
+        return False
+    for i in range(2, n):
+        if n % i == 0:
+            return False
+    return True
+
+
+def _time_per_call(func, numbers) -> float:
+    start = time.perf_counter()
+    for n in numbers:
+        func(n)
+    return (time.perf_counter() - start) / len(numbers)
+
+
+def _format(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:10.2f} us"
+    return f"{seconds * 1e3:10.2f} ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    skipped = "skipped".rjust(13)
+
+    print(f"{'magnitude':>10} {'backend':>13} {'sqrt(n)':>13} {'O(n)':>13}")
+    for bucket in BUCKETS:
+        numbers = [rng.randrange(bucket, bucket * 10) | 1 for _ in range(args.samples)]
+
+        backend = _format(_time_per_call(is_prime, numbers))
+
+        if bucket <= TRIAL_DIVISION_MAX:
+            # Composites exit early, so time the worst case on primes.
+            primes = [n for n in numbers if is_prime(n)][:5] or numbers[:5]
+            for n in primes:
+                assert legacy_trial_division(n) == is_prime(n)
+            trial = _format(_time_per_call(legacy_trial_division, primes))
+        else:
+            trial = skipped
+
+        if bucket <= LINEAR_MAX:
+            linear = _format(_time_per_call(legacy_linear, numbers))
+        else:
+            linear = skipped
+
+        print(f"{'1e%d' % len(str(bucket)[1:]):>10} {backend} {trial} {linear}")
+
+
+if __name__ == "__main__":
+    main()
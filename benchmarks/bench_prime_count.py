@@ -0,0 +1,70 @@
+"""
+Check and time prime_count / prime_sum against sieve results.
+
+Up to ``--sieve-max`` both functions are compared with a full sieve,
+and the table reports timings for each method. Beyond that, prime_count
+is checked against published values of pi(x).
+
+Usage:
+    python benchmarks/bench_prime_count.py [--sieve-max 1e8] [--max 1e12]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from myutils.math_ops import prime_count, prime_sum
+from myutils.math_ops.prime_sieve import build_sieve, sieve_lookup
+
+KNOWN_PI = {
+    10**9: 50847534,
+    10**10: 455052511,
+    10**11: 4118054813,
+    10**12: 37607912018,
+    10**13: 346065536839,
+}
+
+
+def _sieve_count_and_sum(x: int):
+    bits = build_sieve(x)
+    values = np.arange(x + 1, dtype=np.int64)
+    primes = values[sieve_lookup(bits, values)]
+    return len(primes), int(primes.sum(dtype=object))
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sieve-max", type=float, default=1e8)
+    parser.add_argument("--max", type=float, default=1e12)
+    args = parser.parse_args()
+
+    print(f"{'x':>6} {'pi(x)':>14} {'sieve':>10} {'count':>10} {'sum':>10}")
+    x = 1000
+    while x <= args.max:
+        count, count_time = _timed(prime_count, x)
+        _, sum_time = _timed(prime_sum, x) if x <= args.sieve_max else (None, 0.0)
+
+        if x <= args.sieve_max:
+            (expected, expected_sum), sieve_time = _timed(_sieve_count_and_sum, x)
+            assert count == expected, f"prime_count({x}) = {count}, sieve {expected}"
+            assert prime_sum(x) == expected_sum, f"prime_sum({x}) mismatch"
+            sieve = f"{sieve_time:9.4f}s"
+        else:
+            if x in KNOWN_PI:
+                assert count == KNOWN_PI[x], f"prime_count({x}) = {count}"
+            sieve = "-".rjust(10)
+
+        summed = f"{sum_time:9.4f}s" if x <= args.sieve_max else "-".rjust(10)
+        print(f"1e{len(str(x)) - 1:<4} {count:>14} {sieve} {count_time:9.4f}s {summed}")
+        x *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,30 @@
 # Root package for reusable modules
 """
 Reusable utility package.
+
+Subpackages are imported lazily, on first attribute access, so
+``import myutils`` stays cheap and has no side effects.
 """
 
+from importlib import import_module
+
 __all__ = [
     "auth",
     "eligibility",
     "math_ops",
     "validation",
     "operations",
+    "rules",
     "storage",
     "text_ops",
 ]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
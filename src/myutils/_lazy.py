@@ -0,0 +1,51 @@
+"""
+Lazy attribute loading for package ``__init__`` modules (PEP 562).
+
+A package declares which names it exports and where they live; the
+submodule is only imported the first time one of its names is accessed.
+This keeps ``import myutils`` (and every subpackage import) cheap: heavy
+dependencies such as NumPy or Pydantic load only when actually used.
+The module itself avoids ``typing`` for the same reason.
+"""
+
+import sys
+from importlib import import_module
+
+
+def attach(package: str, exports: dict) -> tuple:
+    """
+    Build the module-level ``__getattr__``, ``__dir__`` and ``__all__``.
+
+    Usage in a package ``__init__``::
+
+        __getattr__, __dir__, __all__ = attach(
+            __name__, {"add": ".calc", "PasswordUser": ".checker:User"}
+        )
+
+    :param package: ``__name__`` of the package
+    :param exports: Mapping of exported name to ``".module"`` (same name
+        in the submodule) or ``".module:attribute"`` (renamed export). An
+        export must not share its name with a submodule: importing the
+        submodule would bind it on the package in place of the export.
+    :return: ``(__getattr__, __dir__, __all__)`` for the package
+    """
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str):
+        try:
+            target = exports[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {package!r} has no attribute {name!r}"
+            ) from None
+
+        module_name, _, attribute = target.partition(":")
+        value = getattr(import_module(module_name, package), attribute or name)
+        # Cache on the package so later lookups skip __getattr__ entirely.
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__, list(exports)
@@ -2,6 +2,36 @@
 Authentication-related validation and utilities.
 """
 
-from .password_strength_checker import User as PasswordUser
+from .._lazy import attach
 
-__all__ = ["PasswordUser"]
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "PasswordUser": ".password_strength_checker:User",
+        "PasswordPolicy": ".password_policy",
+        "PasswordViolation": ".password_policy",
+        "validate_passwords": ".password_policy",
+        "StrengthEstimator": ".password_strength",
+        "estimate_strength": ".password_strength",
+        "estimate_strengths": ".password_strength",
+        "AuthService": ".auth_service",
+        "AuthClient": ".auth_service",
+        "LocalTransport": ".auth_service",
+        "LoginResult": ".auth_service",
+        "LoginStatus": ".auth_service",
+        "CredentialStore": ".credential_store",
+        "MemoryBackend": ".credential_store",
+        "SQLiteBackend": ".credential_store",
+        "ScryptHasher": ".credential_store",
+        "Pbkdf2Hasher": ".credential_store",
+        "verify_password": ".credential_store",
+        "LoginThrottle": ".throttle",
+        "ThrottleDecision": ".throttle",
+        "TimerWheel": ".throttle",
+        "BreachFilter": ".breach_filter",
+        "use_breach_filter": ".breach_filter",
+        "enable_audit_logging": ".audit_log",
+        "disable_audit_logging": ".audit_log",
+        "audit_password_validation": ".audit_log",
+    },
+)
@@ -0,0 +1,133 @@
+"""
+Ranked word lists used by :mod:`myutils.auth.password_strength`.
+
+Each list runs from most to least common, so a word's rank is its
+1-based position. The lists are plain whitespace-separated strings,
+which keeps importing this module cheap; they are split once, when the
+estimator is built.
+"""
+
+PASSWORDS = """
+123456 password 12345678 qwerty 123456789 12345 1234 111111 1234567 dragon
+123123 baseball abc123 football monkey letmein 696969 shadow master 666666
+qwertyuiop 123321 mustang 1234567890 michael 654321 superman 1qaz2wsx
+7777777 121212 000000 qazwsx 123qwe killer trustno1 jordan jennifer zxcvbnm
+asdfgh hunter buster soccer harley batman andrew tigger sunshine iloveyou
+2000 charlie robert thomas hockey ranger daniel starwars klaster 112233
+george computer michelle jessica pepper 1111 zxcvbn 555555 11111111 131313
+freedom 777777 pass maggie 159753 aaaaaa ginger princess joshua cheese
+amanda summer love ashley nicole chelsea biteme matthew access yankees
+987654321 dallas austin thunder taylor matrix mobilemail mom monitor
+monitoring montana moon moscow william corvette hello martin heather secret
+merlin diamond 1234qwer gfhjkm hammer silver 222222 88888888 anthony justin
+test bailey q1w2e3r4t5 patrick internet scooter orange 11111 golfer cookie
+richard samantha bigdog guitar jackson whatever mickey chicken sparky
+snoopy maverick phoenix camaro peanut morgan welcome falcon cowboy ferrari
+samsung andrea smokey steelers joseph mercedes dakota arsenal eagles melissa
+boomer booboo spider nascar monster tigers yellow xxxxxx 123123123 gateway
+marina diablo bulldog qwer1234 compaq purple hardcore banana junior hannah
+123654 porsche lakers iceman money cowboys 987654 london tennis 999999
+ncc1701 coffee scooby 0000 miller boston q1w2e3r4 brandon yamaha chester
+mother forever johnny edward 333333 oliver redsox player nikita knight
+fender barney midnight please brandy chicago badboy slayer rangers charles
+angel flower bigdaddy rabbit wizard bear jasper enter rachel chris steven
+winner adidas victoria natasha 1q2w3e4r jasmine winter prince panties
+marine ghbdtn fishing cocacola casper james 232323 raiders 888888 marlboro
+gandalf asdfasdf crystal 87654321 12344321 golden 8675309 panther lauren
+angela bitch spanky thx1138 angels madison winston shannon mike toyota
+blowjob jordan23 canada sophie apples dick tiger razz 123abc pokemon qazxsw
+55555 qwaszx muffin johnson murphy cooper jonathan liverpoo david danielle
+159357 jackie 1990 123456a 789456 turtle horny abcd1234 scorpion qazwsxedc
+101010 butter carlos password1 dennis slipknot qwerty123 booger asdf 1991
+black startrek 12341234 cameron newyork rainbow nathan john 1992 rocket
+viking redskins butthead asdfghjkl 1212 sierra peaches gemini doctor wilson
+sandra helpme qwertyui victor florida dolphin pookie captain tucker blue
+liverpool theman bandit dolphins maddog packers jaguar lovers nicholas
+united tiffany maxwell zzzzzz nirvana jeremy suckit stupid porn monica
+elephant giants jackass hotdog rosebud success debbie mountain 444444
+xxxxxxxx warrior 1q2w3e4r5t q1w2e3 123456q albert metallic lucky azerty
+7777 shithead alex bond007 alexis 1111111 samson 5150 willie scorpio
+bonnie gators benjamin voodoo driver dexter 2112 jason calvin freddy 212121
+creative 12345a sydney rush2112 1989 asdfghjk red123 bubba 4815162342
+passw0rd trouble gunner happy fucker gordon legend jessie stella qwert
+eminem arthur apple nissan bullshit bear123 emily p@ssw0rd p@ssword
+admin admin123 root toor changeme letmein1 welcome1 iloveyou1 monkey1
+dragon1 abc12345 qwerty1 password123 password12 1qazxsw2 zaq12wsx
+""".split()
+"""Leaked passwords, most common first."""
+
+ENGLISH = """
+you the to it and that of is in what we me this he for my on have your do
+was no not be can are know all with but just there so get they like here
+about now out if up right she go want him her what's yeah come one at well
+how see oh his okay think let's who from really good as or say time back
+them would when tell did could then been going where why because gonna
+thing man an mean look take need nothing any little were make down two us
+maybe our something sure much something sorry find off never again very
+yes over way love people got too into only call life help stop last give
+thank thanks first leave wait hey work talk better long some feel great
+day nice night home before after other new night name world house made
+mother father money car kind friend kill year dead fine eat fire head
+always money place girl boy remember happy woman three hand must big old
+believe live hard guy mind once keep school dad mom real every might
+tonight matter cause god done heart trust baby dear miss black white
+family always everything morning guess best family sister brother anyone
+death while love hell hope lady room part word happen shut change face
+water lost found lot without care problem might anything away later
+doctor police stay together open beautiful music game left gone story
+bring book play power light dark sweet young game watch blood week heard
+seen strong lucky ready shot door hurt turn move run walk stand both soon
+show true start city sleep mouth news red green blue gold silver star
+king queen prince princess angel devil dragon tiger lion eagle wolf bear
+shark snake horse monkey spider dog cat fish bird summer winter spring
+autumn sun moon sky rain snow storm thunder river ocean sea island
+mountain forest garden flower rose apple orange banana cherry lemon
+pepper coffee chocolate cookie candy sugar honey butter cheese pizza
+dream magic secret hidden shadow ghost spirit soul heaven paradise
+freedom peace hope faith glory honor hero legend master warrior knight
+hunter soldier captain doctor pilot driver runner player winner killer
+lover friend buddy sunshine rainbow crystal diamond pearl ruby silver
+golden iron steel stone rock metal fire ice earth wind storm lightning
+correct horse battery staple password secure login admin welcome access
+letter number love happy smile laugh crazy cool super awesome perfect
+simple little small large giant mighty fast slow quick jump fly swim
+dance sing song baby honey sweetie darling pretty lovely beauty cute
+school college student teacher office market money bank cash credit
+travel holiday party birthday christmas easter sunday monday friday
+january february march april may june july august september october
+november december today tomorrow yesterday forever always never nothing
+computer internet network system server phone mobile window screen
+keyboard mouse digital google yahoo apple samsung android windows linux
+""".split()
+"""Common English words, most frequent first."""
+
+NAMES = """
+james john robert michael william david richard joseph thomas charles
+christopher daniel matthew anthony mark donald steven paul andrew joshua
+kenneth kevin brian george timothy ronald edward jason jeffrey ryan jacob
+gary nicholas eric jonathan stephen larry justin scott brandon benjamin
+samuel gregory alexander frank patrick raymond jack dennis jerry tyler
+aaron jose adam nathan henry douglas zachary peter kyle ethan walter noah
+jeremy christian keith roger terry gerald harold sean austin carl arthur
+lawrence dylan jesse jordan bryan billy joe bruce gabriel logan albert
+willie alan juan wayne elijah randy roy vincent ralph eugene russell bobby
+mason philip louis mary patricia jennifer linda elizabeth barbara susan
+jessica sarah karen lisa nancy betty margaret sandra ashley kimberly
+emily donna michelle carol amanda dorothy melissa deborah stephanie
+rebecca sharon laura cynthia kathleen amy angela shirley anna brenda pamela
+emma nicole helen samantha katherine christine debra rachel carolyn janet
+catherine maria heather diane ruth julie olivia joyce virginia victoria
+kelly lauren christina joan evelyn judith megan andrea cheryl hannah
+jacqueline martha gloria teresa ann sara madison frances kathryn janice
+jean abigail alice judy sophia grace denise amber doris marilyn danielle
+beverly isabella theresa diana natalie brittany charlotte marie kayla
+alexis lori smith johnson williams brown jones garcia miller davis
+rodriguez martinez hernandez lopez gonzalez wilson anderson taylor moore
+jackson martin lee perez thompson white harris sanchez clark ramirez lewis
+robinson walker young allen king wright scott torres nguyen hill flores
+green adams nelson baker hall rivera campbell mitchell carter roberts
+""".split()
+"""Common first names and surnames, most common first."""
+
+DICTIONARIES = {"passwords": PASSWORDS, "english": ENGLISH, "names": NAMES}
+"""Ranked word lists by dictionary name."""
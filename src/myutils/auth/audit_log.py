@@ -0,0 +1,318 @@
+"""
+Opt-in, non-blocking audit logging for password validation.
+
+Nothing is configured at import: the audit logger has no handler and does
+not propagate, so audit events cost one flag check until
+:func:`enable_audit_logging` is called. Once enabled, callers only put a
+``(time, level, message, args)`` tuple on an in-memory queue; a
+background listener thread turns the tuples into log records, batches
+them and writes them to a size-rotated file (or any handler you pass in).
+
+Passwords are never logged, only the username, the outcome, the reason
+for a rejection and the password length.
+"""
+
+import atexit
+import logging
+import queue
+import time
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+)
+from pathlib import Path
+from typing import Optional, Union
+
+AUDIT_LOGGER_NAME = "myutils.auth.audit"
+"""Name of the logger audit events are sent to."""
+
+DEFAULT_LOG_FILE = "password_validation.log"
+"""Audit log file used when no destination is given (relative to the cwd)."""
+
+DEFAULT_FORMAT = "%(asctime)s | %(levelname)s | %(message)s"
+"""Line format of the audit log, as used by the original file logging."""
+
+audit_logger = logging.getLogger(AUDIT_LOGGER_NAME)
+audit_logger.propagate = False
+audit_logger.addHandler(logging.NullHandler())
+
+_active: Optional["AuditLog"] = None
+
+
+class _AuditQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records untouched.
+
+    The stock handler copies and formats every record on the calling
+    thread. Audit records only carry immutable arguments, so formatting
+    is left to the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _BatchBuffer(MemoryHandler):
+    """MemoryHandler that flushes its target once per batch, not per record."""
+
+    def flush(self) -> None:
+        with self.lock:
+            if self.target is None or not self.buffer:
+                return
+            for record in self.buffer:
+                self.target.handle(record)
+            self.buffer.clear()
+            self.target.flush()
+
+
+class _AuditFormatter(logging.Formatter):
+    """Formatter that formats the date and time once per second, not per line."""
+
+    _second = None
+    _stamp = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt=None) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        if second != self._second:
+            converted = self.converter(second)
+            self._stamp = time.strftime(self.default_time_format, converted)
+            self._second = second
+        return self.default_msec_format % (self._stamp, record.msecs)
+
+
+class _BatchRotatingFileHandler(RotatingFileHandler):
+    """
+    Size-rotated log file written in batches.
+
+    Unlike RotatingFileHandler it neither flushes nor seeks per record: it
+    keeps count of the bytes written, and the batch buffer flushes the file
+    once per batch.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            line = self.format(record) + self.terminator
+            size = len(line.encode(self.encoding or "utf-8"))
+            if self.stream is None:
+                self.stream = self._open()
+                self.bytes_written = self.stream.tell()
+            full = self.bytes_written and self.bytes_written + size > self.maxBytes
+            if self.maxBytes and full:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+                self.bytes_written = 0
+            self.stream.write(line)
+            self.bytes_written += size
+        except Exception:
+            self.handleError(record)
+
+
+class _BatchingListener(QueueListener):
+    """
+    QueueListener that builds records from event tuples and flushes its
+    handlers when the queue goes idle.
+
+    Records are created by filling a template, which skips the caller
+    lookup and process details of ``LogRecord.__init__``; the caller's
+    file, line and thread are not recorded. Records logged to the audit
+    logger directly arrive complete and are passed on as they are.
+    """
+
+    def __init__(self, log_queue, handler: logging.Handler, flush_interval: float):
+        super().__init__(log_queue, handler, respect_handler_level=True)
+        self.flush_interval = flush_interval
+        template = logging.LogRecord(
+            AUDIT_LOGGER_NAME, logging.INFO, __file__, 0, "", (), None
+        )
+        self._template = template.__dict__
+        self._start = template.created - template.relativeCreated / 1000
+
+    def prepare(self, event):
+        if isinstance(event, logging.LogRecord):
+            return event
+        created, level, msg, args = event
+        record = logging.LogRecord.__new__(logging.LogRecord)
+        record.__dict__.update(self._template)
+        record.created = created
+        record.msecs = (created - int(created)) * 1000
+        record.relativeCreated = (created - self._start) * 1000
+        record.levelno = level
+        record.levelname = logging.getLevelName(level)
+        record.msg = msg
+        record.args = args
+        return record
+
+    def dequeue(self, block: bool):
+        while True:
+            try:
+                return self.queue.get(block, timeout=self.flush_interval)
+            except queue.Empty:
+                # Nothing arrived for a while: write out the partial batch.
+                for handler in self.handlers:
+                    handler.flush()
+
+
+class AuditLog:
+    """
+    Handle on a running audit-logging pipeline.
+
+    Created by :func:`enable_audit_logging`; call :meth:`stop` (or use it
+    as a context manager) to drain the queue and close the destination.
+    """
+
+    def __init__(
+        self,
+        handler: logging.Handler,
+        batch_size: int,
+        flush_interval: float,
+        level: int,
+    ):
+        self.target = handler
+        self.buffer = _BatchBuffer(
+            batch_size, flushLevel=logging.CRITICAL, target=handler
+        )
+        # Event tuples from submit(), or records logged to audit_logger.
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.queue_handler = _AuditQueueHandler(self.queue)
+        self.listener = _BatchingListener(self.queue, self.buffer, flush_interval)
+        self.level = level
+        self.running = False
+
+    def submit(self, level: int, msg: str, args: tuple) -> None:
+        """Queue one event; the listener thread makes it a log record."""
+        if level >= self.level:
+            self.queue.put((time.time(), level, msg, args))
+
+    def __enter__(self) -> "AuditLog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Attach to the audit logger and start the listener thread."""
+        audit_logger.addHandler(self.queue_handler)
+        audit_logger.setLevel(self.level)
+        self.listener.start()
+        self.running = True
+
+    def stop(self) -> None:
+        """Stop accepting events, write everything queued and close files."""
+        global _active
+
+        if not self.running:
+            return
+        self.running = False
+        audit_logger.removeHandler(self.queue_handler)
+        self.listener.stop()
+        self.buffer.close()
+        self.target.close()
+        if _active is self:
+            _active = None
+
+
+def enable_audit_logging(
+    destination: Union[str, Path, logging.Handler, None] = None,
+    max_bytes: int = 10 * 1024 * 1024,
+    backup_count: int = 5,
+    batch_size: int = 256,
+    flush_interval: float = 1.0,
+    level: int = logging.INFO,
+    fmt: str = DEFAULT_FORMAT,
+) -> AuditLog:
+    """
+    Start writing audit events in the background.
+
+    Any pipeline started earlier is stopped first. The pipeline is also
+    stopped at interpreter exit, so queued events are not lost.
+
+    Args:
+        destination: Log file path, or a ready-made handler to write to.
+            Defaults to :data:`DEFAULT_LOG_FILE` in the current directory.
+        max_bytes: Rotate the log file when it would grow past this size.
+        backup_count: Number of rotated files to keep.
+        batch_size: Events buffered before they are written together.
+        flush_interval: Seconds of inactivity after which a partial batch
+            is written.
+        level: Minimum level of events to record.
+        fmt: Format of a log line, used for file destinations.
+
+    Returns:
+        AuditLog: Handle to stop the pipeline.
+    """
+    global _active
+
+    if _active is not None:
+        _active.stop()
+
+    if isinstance(destination, logging.Handler):
+        handler = destination
+    else:
+        path = Path(destination or DEFAULT_LOG_FILE)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handler = _BatchRotatingFileHandler(
+            path,
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding="utf-8",
+            delay=True,
+        )
+        handler.setFormatter(_AuditFormatter(fmt))
+
+    _active = AuditLog(handler, batch_size, flush_interval, level)
+    _active.start()
+    return _active
+
+
+def disable_audit_logging() -> None:
+    """Stop the running audit pipeline, if any, writing out queued events."""
+    if _active is not None:
+        _active.stop()
+
+
+def audit_enabled() -> bool:
+    """Return True if audit events are currently being recorded."""
+    return _active is not None
+
+
+def audit_password_validation(
+    accepted: bool,
+    username: Optional[str] = None,
+    reason: Optional[str] = None,
+    length: Optional[int] = None,
+) -> None:
+    """
+    Record the outcome of a password validation.
+
+    Costs a single check when audit logging is off. The password itself
+    is deliberately not a parameter.
+
+    Args:
+        accepted: Whether the password passed validation.
+        username: Username or email the password belongs to, if known.
+        reason: Why the password was rejected.
+        length: Length of the password.
+    """
+    active = _active
+    if active is None:
+        return
+    if accepted:
+        active.submit(
+            logging.INFO,
+            "Valid password accepted | user=%s | length=%s",
+            (username, length),
+        )
+    else:
+        active.submit(
+            logging.WARNING,
+            "Invalid password attempt | user=%s | length=%s | Reason: %s",
+            (username, length, reason),
+        )
+
+
+atexit.register(disable_audit_logging)
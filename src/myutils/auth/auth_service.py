@@ -0,0 +1,361 @@
+"""
+Asynchronous authentication service: register, log in and log out.
+
+:class:`AuthService` is the programmatic counterpart of the ``input()``
+driven demos in :mod:`~myutils.auth.login_simulator` and
+:mod:`~myutils.auth.login_with_retry`. It applies the same
+:func:`~myutils.auth.login_simulator.is_valid_password` rule and the same
+``max_attempts`` limit, keeps passwords in a
+:class:`~myutils.auth.credential_store.CredentialStore`, and serves many
+concurrent sessions on one event loop. Key derivation runs on the
+store's thread pool, so a slow hash never blocks other requests.
+
+Requests and responses are plain JSON-compatible dicts (see
+:meth:`AuthService.handle`), so any transport can carry them;
+:class:`LocalTransport` does so within the process, for tests and
+benchmarks, and :class:`AuthClient` wraps a transport in coroutines.
+"""
+
+import asyncio
+import json
+import secrets
+import time
+from enum import IntEnum
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+from .credential_store import CredentialStore
+from .login_simulator import is_valid_password
+from .throttle import LoginThrottle, TimerWheel
+
+DEFAULT_MAX_ATTEMPTS = 3
+"""Failed logins allowed before a username is locked, as in the demo."""
+
+DEFAULT_LOCKOUT_SECONDS = 300.0
+"""How long a username stays locked after too many failed logins."""
+
+DEFAULT_SESSION_TTL = 8 * 3600.0
+"""Seconds a session stays valid after login, unless logged out sooner."""
+
+PASSWORD_RULE_MESSAGE = (
+    "Password must be at least 6 characters long and contain both letters "
+    "and numbers."
+)
+
+
+class LoginStatus(IntEnum):
+    """Outcome of a login attempt."""
+
+    SUCCESS = 0
+    INVALID_CREDENTIALS = 1
+    """Unknown username or wrong password; deliberately not told apart."""
+    LOCKED = 2
+
+
+LOGIN_MESSAGES = {
+    LoginStatus.SUCCESS: "Login successful! Welcome, {username}.",
+    LoginStatus.INVALID_CREDENTIALS: "Incorrect username or password.",
+    LoginStatus.LOCKED: "Too many failed login attempts. Please try again later.",
+}
+"""Messages by status, worded as in the original login demo. Failed logins
+share one message, so responses do not reveal which usernames exist."""
+
+
+class LoginResult(NamedTuple):
+    """Result of :meth:`AuthService.login`."""
+
+    status: LoginStatus
+    token: Optional[str]
+    attempts_remaining: int
+    message: str
+
+    @property
+    def ok(self) -> bool:
+        return self.status is LoginStatus.SUCCESS
+
+
+class AuthService:
+    """
+    Account registration and session handling for many concurrent users.
+
+    Failed logins are counted per username across calls (the demo only
+    counted within one call), and per source when the caller passes one.
+    After ``max_attempts`` failures within the throttle's window the
+    username is locked for ``lockout_seconds``; a successful login resets
+    the count. Attempts in flight count as failures until they succeed, so
+    parallel guesses cannot exceed the limit.
+
+    Sessions end at logout or ``session_ttl`` seconds after login; expired
+    tokens are dropped by a timer wheel, so abandoned sessions do not
+    accumulate.
+
+    Args:
+        store (CredentialStore | None): Where password hashes live; a new
+            in-memory store if omitted.
+        max_attempts (int): Failed logins allowed before locking.
+        lockout_seconds (float): How long a locked username stays locked.
+        password_rule (Callable[[str], bool]): Validity check for new
+            passwords.
+        throttle (LoginThrottle | None): Attempt limiter; by default one
+            built from ``max_attempts`` and ``lockout_seconds``.
+        session_ttl (float): Seconds a session stays valid.
+        clock (Callable[[], float]): Monotonic time source for sessions
+            and the default throttle.
+    """
+
+    def __init__(
+        self,
+        store: Optional[CredentialStore] = None,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        lockout_seconds: float = DEFAULT_LOCKOUT_SECONDS,
+        password_rule: Callable[[str], bool] = is_valid_password,
+        throttle: Optional[LoginThrottle] = None,
+        session_ttl: float = DEFAULT_SESSION_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.store = CredentialStore() if store is None else store
+        self.max_attempts = max_attempts
+        self.lockout_seconds = lockout_seconds
+        self.password_rule = password_rule
+        if session_ttl <= 0:
+            raise ValueError("session_ttl must be positive")
+        if throttle is None:
+            throttle = LoginThrottle(
+                user_attempts=max_attempts, lockout=lockout_seconds, clock=clock
+            )
+        self.throttle = throttle
+        self.session_ttl = session_ttl
+        self.clock = clock
+        # Token to (username, expiry time).
+        self._sessions: Dict[str, Tuple[str, float]] = {}
+        self._session_expiry = TimerWheel(
+            resolution=max(session_ttl / 64, 1e-3), now=clock()
+        )
+
+    async def register(self, username: str, password: str) -> None:
+        """
+        Register a new user.
+
+        Raises:
+            ValueError: If the username is empty or taken, or the password
+                does not satisfy the password rule.
+        """
+        username = username.strip()
+        if not username:
+            raise ValueError("Username must not be empty.")
+        if not self.password_rule(password):
+            raise ValueError(PASSWORD_RULE_MESSAGE)
+        # Backend lookups run on the store's threads, like key derivation,
+        # so a slow backend does not block the event loop.
+        if await asyncio.wrap_future(self.store.submit_contains(username)):
+            raise ValueError(
+                "Username already exists. Please try a different username."
+            )
+        await asyncio.wrap_future(self.store.submit_register(username, password))
+
+    async def login(
+        self, username: str, password: str, source: Optional[str] = None
+    ) -> LoginResult:
+        """
+        Check credentials and open a session.
+
+        Args:
+            username (str): Username to log in as.
+            password (str): Password to check.
+            source (str | None): Where the attempt comes from, such as the
+                client's address, for per-source throttling.
+
+        Returns:
+            LoginResult: On success ``token`` identifies the new session.
+            An unknown username and a wrong password both give
+            ``INVALID_CREDENTIALS``, in about the same time.
+        """
+        username = username.strip()
+        # The throttle counts the attempt before we wait on the hash; with
+        # attempts in flight, the limit may be reached before any fails.
+        decision = self.throttle.attempt(username, source)
+        if not decision.allowed:
+            return self._result(LoginStatus.LOCKED, username, 0)
+        verified = await asyncio.wrap_future(
+            self.store.submit_verify(username, password)
+        )
+
+        if verified:
+            self.throttle.succeeded(username, source)
+            token = secrets.token_urlsafe(32)
+            expires = self._expire_sessions() + self.session_ttl
+            self._sessions[token] = (username, expires)
+            self._session_expiry.schedule(expires, token)
+            return self._result(
+                LoginStatus.SUCCESS, username, self.max_attempts, token
+            )
+
+        if not decision.remaining:
+            return self._result(LoginStatus.LOCKED, username, 0)
+        return self._result(
+            LoginStatus.INVALID_CREDENTIALS, username, decision.remaining
+        )
+
+    async def logout(self, token: str) -> bool:
+        """Close a session; return False if the token was not active."""
+        now = self._expire_sessions()
+        session = self._sessions.pop(token, None)
+        return session is not None and session[1] > now
+
+    def session_user(self, token: str) -> Optional[str]:
+        """Return the username of an active session, or None."""
+        now = self._expire_sessions()
+        session = self._sessions.get(token)
+        if session is None or session[1] <= now:
+            return None
+        return session[0]
+
+    @property
+    def active_sessions(self) -> int:
+        """Number of open sessions; expired ones may linger for one tick."""
+        self._expire_sessions()
+        return len(self._sessions)
+
+    def _expire_sessions(self) -> float:
+        """Drop sessions whose timer fired; return the current time."""
+        now = self.clock()
+        for _, token in self._session_expiry.advance(now):
+            self._sessions.pop(token, None)
+        return now
+
+    def _result(
+        self,
+        status: LoginStatus,
+        username: str,
+        remaining: int,
+        token: Optional[str] = None,
+    ) -> LoginResult:
+        message = LOGIN_MESSAGES[status].format(username=username)
+        return LoginResult(status, token, remaining, message)
+
+    async def handle(self, request: dict) -> dict:
+        """
+        Serve one request given as a JSON-compatible dict.
+
+        Requests name an ``op`` (``register``, ``login`` or ``logout``) and
+        its arguments, all strings; ``login`` takes an optional ``source``.
+        Responses carry ``ok`` and either the result or an ``error``
+        message, also for malformed requests.
+        """
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "Request must be a JSON object"}
+        op = request.get("op")
+        try:
+            if op == "register":
+                username, password = _fields(request, "username", "password")
+                await self.register(username, password)
+                return {"ok": True}
+            if op == "login":
+                username, password = _fields(request, "username", "password")
+                source = request.get("source")
+                if source is not None and not isinstance(source, str):
+                    raise ValueError("Field 'source' must be a string")
+                result = await self.login(username, password, source)
+                return {
+                    "ok": result.ok,
+                    "status": result.status.name,
+                    "token": result.token,
+                    "attempts_remaining": result.attempts_remaining,
+                    "message": result.message,
+                }
+            if op == "logout":
+                (token,) = _fields(request, "token")
+                return {"ok": await self.logout(token)}
+        except KeyError as e:
+            return {"ok": False, "error": f"Missing field: {e.args[0]}"}
+        except ValueError as e:
+            return {"ok": False, "error": str(e)}
+        return {"ok": False, "error": f"Unknown operation: {op!r}"}
+
+
+def _fields(request: dict, *names: str) -> Tuple[str, ...]:
+    """
+    Return the named string fields of a request.
+
+    Raises:
+        KeyError: If a field is missing.
+        ValueError: If a field is not a string.
+    """
+    values = tuple(request[name] for name in names)
+    for name, value in zip(names, values):
+        if not isinstance(value, str):
+            raise ValueError(f"Field {name!r} must be a string")
+    return values
+
+
+class LocalTransport:
+    """
+    Carries serialised requests to a service in the same process.
+
+    Messages go through JSON exactly as they would over a network, so
+    tests exercise the real request format without sockets.
+    """
+
+    def __init__(self, service: AuthService):
+        self.service = service
+
+    async def send(self, message: bytes) -> bytes:
+        try:
+            request = json.loads(message)
+        except ValueError as e:
+            response = {"ok": False, "error": f"Malformed request: {e}"}
+        else:
+            response = await self.service.handle(request)
+        return json.dumps(response).encode("utf-8")
+
+
+class AuthClient:
+    """
+    Coroutine API over a transport.
+
+    Args:
+        transport: Object with an ``async send(bytes) -> bytes`` method,
+            such as :class:`LocalTransport`.
+    """
+
+    def __init__(self, transport):
+        self.transport = transport
+
+    async def _call(self, **request) -> dict:
+        reply = await self.transport.send(json.dumps(request).encode("utf-8"))
+        return json.loads(reply)
+
+    async def register(self, username: str, password: str) -> None:
+        """
+        Register a new user.
+
+        Raises:
+            ValueError: With the service's message if registration failed.
+        """
+        response = await self._call(
+            op="register", username=username, password=password
+        )
+        if not response["ok"]:
+            raise ValueError(response["error"])
+
+    async def login(
+        self, username: str, password: str, source: Optional[str] = None
+    ) -> LoginResult:
+        """Log in; see :meth:`AuthService.login`."""
+        response = await self._call(
+            op="login", username=username, password=password, source=source
+        )
+        if "error" in response:
+            raise ValueError(response["error"])
+        return LoginResult(
+            LoginStatus[response["status"]],
+            response["token"],
+            response["attempts_remaining"],
+            response["message"],
+        )
+
+    async def logout(self, token: str) -> bool:
+        """Close a session; return False if the token was not active."""
+        response = await self._call(op="logout", token=token)
+        return response["ok"]
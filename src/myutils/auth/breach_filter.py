@@ -0,0 +1,307 @@
+"""
+Memory-mapped Bloom filter for screening breached passwords.
+
+Leaked-password lists run to hundreds of millions of entries, far too
+many for a Python ``set``. :meth:`BreachFilter.build` compiles such a
+list into a blocked Bloom filter file with a chosen false-positive rate
+(about 6 bytes per password at one in a million). Opening the file
+maps it read-only: startup is instant, processes share it through the
+page cache, and every lookup reads a single 64-byte block, so it costs
+at most one page fault and never a read call.
+
+Passwords are hashed with BLAKE2b. The first 8 bytes of the digest pick
+the block and each following 9 bits give one bit position inside it,
+so positions are independent (double hashing over a 512-bit block has
+too few distinct patterns to reach low error rates). Lookups are exact
+for passwords that are in the list and wrong with probability about
+``fp_rate`` for passwords that are not.
+
+File layout (little-endian)::
+
+    header   64 bytes    magic, version, hashes, block count, items, fp rate
+    blocks   64 bytes * blocks   512-bit Bloom filter blocks
+"""
+
+import math
+import mmap
+import os
+import struct
+from hashlib import blake2b
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+MAGIC = b"MUBREACH"
+VERSION = 1
+DEFAULT_FP_RATE = 1e-6
+"""False-positive rate used when none is given."""
+
+BLOCK_BITS = 512
+"""Bits per filter block: one cache line, so a lookup touches one page."""
+
+_HEADER = struct.Struct("<8sIIQQd")
+_HEADER_SIZE = 64
+_BLOCK_BYTES = BLOCK_BITS // 8
+_WORDS_PER_BLOCK = BLOCK_BITS // 64
+_POSITION_BITS = 9
+_MAX_HASHES = 32
+_DIGEST_SIZE = 8 + _MAX_HASHES * _POSITION_BITS // 8
+_BUILD_CHUNK = 1 << 16
+
+Password = Union[str, bytes]
+
+
+def _digest(password: Password) -> bytes:
+    if isinstance(password, str):
+        password = password.encode("utf-8")
+    return blake2b(password, digest_size=_DIGEST_SIZE).digest()
+
+
+def _blocked_fp_rate(items: int, blocks: int, hashes: int) -> float:
+    """
+    Expected false-positive rate of a blocked Bloom filter.
+
+    Items spread over blocks roughly as a Poisson distribution, and a
+    fuller-than-average block is much more likely to give a false
+    positive, so the classic formula underestimates the rate.
+    """
+    load = items / blocks
+    spread = 10 * math.sqrt(load) + 20
+    rate = 0.0
+    for count in range(max(0, int(load - spread)), int(load + spread) + 1):
+        log_weight = count * math.log(load) - load - math.lgamma(count + 1)
+        filled = 1 - (1 - 1 / BLOCK_BITS) ** (hashes * count)
+        rate += math.exp(log_weight) * filled**hashes
+    return rate
+
+
+def _dimensions(items: int, fp_rate: float):
+    """Return ``(blocks, hashes)`` meeting ``fp_rate`` for ``items``."""
+    items = max(items, 1)
+    bits = -items * math.log(fp_rate) / math.log(2) ** 2
+    while True:
+        blocks = max(1, math.ceil(bits / BLOCK_BITS))
+        hashes = max(1, min(_MAX_HASHES, round(bits / items * math.log(2))))
+        if _blocked_fp_rate(items, blocks, hashes) <= fp_rate:
+            return blocks, hashes
+        bits *= 1.05
+
+
+def _read_lines(path: Path) -> Iterable[bytes]:
+    """Yield the non-empty lines of a password list as raw bytes."""
+    with path.open("rb") as file:
+        for line in file:
+            line = line.rstrip(b"\r\n")
+            if line:
+                yield line
+
+
+def _count_lines(path: Path) -> int:
+    count = 0
+    with path.open("rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            count += chunk.count(b"\n")
+    return count + 1
+
+
+class BreachFilter:
+    """
+    Read-only membership test over a memory-mapped Bloom filter.
+
+    Use :meth:`build` to compile a password list and :meth:`open` to map
+    an existing filter. Instances can be used as context managers, and
+    ``password in breach_filter`` tells whether a password is listed.
+
+    Attributes:
+        items (int): Number of passwords the filter was built from.
+        hashes (int): Bits set per password.
+        fp_rate (float): False-positive rate the filter was sized for.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with self.path.open("rb") as file:
+            header = file.read(_HEADER_SIZE)
+            if len(header) < _HEADER_SIZE or not header.startswith(MAGIC):
+                raise ValueError(f"{self.path} is not a breach filter file")
+            magic, version, hashes, blocks, items, fp_rate = _HEADER.unpack_from(
+                header
+            )
+            if version != VERSION:
+                raise ValueError(f"Unsupported breach filter version: {version}")
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) != _HEADER_SIZE + blocks * _BLOCK_BYTES:
+            self._mmap.close()
+            raise ValueError(f"{self.path} is truncated or corrupt")
+
+        self.hashes = hashes
+        self.items = items
+        self.fp_rate = fp_rate
+        self._blocks = blocks
+
+    @classmethod
+    def build(
+        cls,
+        path: Union[str, Path],
+        passwords: Union[str, Path, Iterable[Password]],
+        fp_rate: float = DEFAULT_FP_RATE,
+        expected_items: Optional[int] = None,
+    ) -> "BreachFilter":
+        """
+        Compile a password list into a filter file and open it.
+
+        The filter is written straight into a memory-mapped file next to
+        its destination and renamed into place, so memory use stays flat
+        and readers never observe a partially written filter.
+
+        Args:
+            path (str | Path): Destination of the filter file.
+            passwords: Path to a text file with one password per line
+                (read as raw bytes), or an iterable of passwords.
+            fp_rate (float): Target false-positive rate, e.g. ``1e-6``.
+            expected_items (int | None): Number of passwords, used to size
+                the filter. Counted automatically for files and sized
+                collections; required for other iterables.
+
+        Returns:
+            BreachFilter: The freshly built filter, opened read-only.
+
+        Raises:
+            ValueError: If ``fp_rate`` is not between 0 and 1, or the
+                number of passwords cannot be determined.
+        """
+        if not 0 < fp_rate < 1:
+            raise ValueError("False-positive rate must be between 0 and 1")
+
+        if isinstance(passwords, (str, Path)):
+            source = Path(passwords)
+            if expected_items is None:
+                expected_items = _count_lines(source)
+            passwords = _read_lines(source)
+        elif expected_items is None:
+            if not hasattr(passwords, "__len__"):
+                raise ValueError("expected_items is required for iterators")
+            expected_items = len(passwords)
+
+        blocks, hashes = _dimensions(expected_items, fp_rate)
+        weights = np.left_shift(1, np.arange(_POSITION_BITS, dtype=np.uint64))
+
+        path = Path(path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with tmp_path.open("wb") as file:
+            file.truncate(_HEADER_SIZE + blocks * _BLOCK_BYTES)
+
+        words = np.memmap(
+            tmp_path,
+            dtype="<u8",
+            mode="r+",
+            offset=_HEADER_SIZE,
+            shape=(blocks * _WORDS_PER_BLOCK,),
+        )
+        items = 0
+        iterator = iter(passwords)
+        while True:
+            chunk = list(islice(iterator, _BUILD_CHUNK))
+            if not chunk:
+                break
+            items += len(chunk)
+            digests = np.frombuffer(
+                b"".join(_digest(password) for password in chunk), dtype=np.uint8
+            ).reshape(-1, _DIGEST_SIZE)
+
+            block = digests[:, :8].copy().view("<u8")[:, 0] % np.uint64(blocks)
+            position_bits = np.unpackbits(digests[:, 8:], axis=1, bitorder="little")
+            positions = (
+                position_bits[:, : hashes * _POSITION_BITS]
+                .reshape(len(chunk), hashes, _POSITION_BITS)
+                .astype(np.uint64)
+                @ weights
+            )
+            word = block[:, None] * np.uint64(_WORDS_PER_BLOCK) + (
+                positions >> np.uint64(6)
+            )
+            bit = np.left_shift(np.uint64(1), positions & np.uint64(63))
+            np.bitwise_or.at(words, word.ravel(), bit.ravel())
+
+        words.flush()
+        del words
+
+        with tmp_path.open("r+b") as file:
+            file.write(_HEADER.pack(MAGIC, VERSION, hashes, blocks, items, fp_rate))
+        os.replace(tmp_path, path)
+
+        return cls(path)
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> "BreachFilter":
+        """Open an existing filter file read-only."""
+        return cls(path)
+
+    def close(self) -> None:
+        """Release the memory mapping."""
+        self._mmap.close()
+
+    def __enter__(self) -> "BreachFilter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.items
+
+    def __repr__(self) -> str:
+        return (
+            f"BreachFilter({str(self.path)!r}, items={self.items}, "
+            f"fp_rate={self.fp_rate:g})"
+        )
+
+    @property
+    def size_bytes(self) -> int:
+        """Size of the filter bits in bytes."""
+        return self._blocks * _BLOCK_BYTES
+
+    def __contains__(self, password: Password) -> bool:
+        digest = _digest(password)
+        block = int.from_bytes(digest[:8], "little") % self._blocks
+        positions = int.from_bytes(digest[8:], "little")
+        data = self._mmap
+        offset = _HEADER_SIZE + block * _BLOCK_BYTES
+        for _ in range(self.hashes):
+            position = positions & (BLOCK_BITS - 1)
+            # Most unlisted passwords miss on the first or second probe.
+            if not data[offset + (position >> 3)] >> (position & 7) & 1:
+                return False
+            positions >>= _POSITION_BITS
+        return True
+
+
+def use_breach_filter(
+    breach_filter: Union[str, Path, BreachFilter, None], policy=None
+) -> Optional[BreachFilter]:
+    """
+    Make password validation reject passwords found in a breach filter.
+
+    Affects both password ``User`` models, which validate through
+    :data:`~myutils.auth.password_policy.DEFAULT_POLICY` and
+    :data:`~myutils.auth.password_policy.REGEX_POLICY`.
+
+    Args:
+        breach_filter: Filter (or path to a filter file) to consult, or
+            None to turn screening off.
+        policy: Policy to attach the filter to; defaults to both of the
+            above.
+
+    Returns:
+        BreachFilter | None: The filter now in use.
+    """
+    from .password_policy import DEFAULT_POLICY, REGEX_POLICY
+
+    if isinstance(breach_filter, (str, Path)):
+        breach_filter = BreachFilter.open(breach_filter)
+    for target in [policy] if policy else [DEFAULT_POLICY, REGEX_POLICY]:
+        target.breach_filter = breach_filter
+    return breach_filter
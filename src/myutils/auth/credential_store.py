@@ -0,0 +1,532 @@
+"""
+Salted, slow password hashing and a credential store built on it.
+
+Passwords are never stored, only self-describing hash strings in the
+PHC style, e.g. ``scrypt$ln=14,r=8,p=5$<salt>$<hash>``. The string
+records the algorithm and cost parameters, so hashes made with older
+settings keep verifying after the costs are raised. The store then
+rehashes them with the current settings on the user's next successful
+login.
+
+Key derivation is deliberately expensive. :class:`CredentialStore` runs
+it in a bounded thread pool: ``hashlib`` releases the GIL while it
+derives keys, so concurrent logins use all cores while the calling
+threads (or an event loop, via :meth:`CredentialStore.submit_verify`)
+stay responsive.
+"""
+
+import base64
+import hmac
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from hashlib import pbkdf2_hmac, scrypt
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Type, Union
+
+DEFAULT_MAX_WORKERS = os.cpu_count() or 1
+"""Threads deriving keys concurrently: one per core."""
+
+
+def _encode(raw: bytes) -> str:
+    return base64.b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode(text: str) -> bytes:
+    return base64.b64decode(text + "=" * (-len(text) % 4))
+
+
+class PasswordHasher(ABC):
+    """
+    Base class of the key-derivation functions.
+
+    Subclasses set :attr:`algorithm`, implement :meth:`params`,
+    :meth:`from_params` and :meth:`derive`, and register in
+    :data:`HASHERS` so their hashes can be verified.
+
+    Args:
+        salt_size (int): Bytes of random salt per password.
+        key_size (int): Bytes of derived key stored.
+    """
+
+    algorithm = ""
+
+    def __init__(self, salt_size: int = 16, key_size: int = 32):
+        self.salt_size = salt_size
+        self.key_size = key_size
+
+    @abstractmethod
+    def params(self) -> Dict[str, int]:
+        """Return the cost parameters recorded in each hash."""
+        raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def from_params(cls, params: Dict[str, int]) -> "PasswordHasher":
+        """Create a hasher with the cost parameters read from a hash."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def derive(self, password: bytes, salt: bytes, size: int) -> bytes:
+        """Derive a ``size``-byte key from ``password`` and ``salt``."""
+        raise NotImplementedError
+
+    def hash(self, password: str) -> str:
+        """
+        Hash a password with a fresh random salt.
+
+        Args:
+            password (str): Password to hash.
+
+        Returns:
+            str: Self-describing hash string to store.
+        """
+        salt = os.urandom(self.salt_size)
+        key = self.derive(password.encode("utf-8"), salt, self.key_size)
+        return self._format(salt, key)
+
+    def dummy_hash(self) -> str:
+        """
+        Return a hash with this hasher's settings that no password matches.
+
+        Salt and key are random, so nothing is derived to make it, while
+        verifying a password against it costs as much as against a real
+        hash.
+        """
+        return self._format(os.urandom(self.salt_size), os.urandom(self.key_size))
+
+    def _format(self, salt: bytes, key: bytes) -> str:
+        params = ",".join(f"{name}={value}" for name, value in self.params().items())
+        return f"{self.algorithm}${params}${_encode(salt)}${_encode(key)}"
+
+    def needs_rehash(self, encoded: str) -> bool:
+        """
+        Tell whether a stored hash was made with other settings.
+
+        Args:
+            encoded (str): Stored hash string.
+
+        Returns:
+            bool: True if the hash should be replaced by :meth:`hash`.
+        """
+        hasher, salt, key = _parse(encoded)
+        return (
+            hasher.algorithm != self.algorithm
+            or hasher.params() != self.params()
+            or len(salt) != self.salt_size
+            or len(key) != self.key_size
+        )
+
+
+class ScryptHasher(PasswordHasher):
+    """
+    Memory-hard scrypt, the default.
+
+    The defaults (N=2**14, r=8, p=5) are one of the OWASP-recommended
+    settings and use 16 MiB per hash.
+
+    Args:
+        n (int): CPU/memory cost, a power of two.
+        r (int): Block size.
+        p (int): Parallelization.
+    """
+
+    algorithm = "scrypt"
+
+    def __init__(self, n: int = 2**14, r: int = 8, p: int = 5, **kwargs):
+        if n < 2 or n & (n - 1):
+            raise ValueError("scrypt n must be a power of two greater than 1")
+        super().__init__(**kwargs)
+        self.n = n
+        self.r = r
+        self.p = p
+
+    def params(self) -> Dict[str, int]:
+        return {"ln": self.n.bit_length() - 1, "r": self.r, "p": self.p}
+
+    @classmethod
+    def from_params(cls, params: Dict[str, int]) -> "ScryptHasher":
+        return cls(n=1 << params["ln"], r=params["r"], p=params["p"])
+
+    def derive(self, password: bytes, salt: bytes, size: int) -> bytes:
+        # scrypt needs 128 * r * n bytes; leave headroom over the default cap.
+        maxmem = 256 * self.r * self.n + 1024 * 1024
+        return scrypt(
+            password,
+            salt=salt,
+            n=self.n,
+            r=self.r,
+            p=self.p,
+            maxmem=maxmem,
+            dklen=size,
+        )
+
+
+class Pbkdf2Hasher(PasswordHasher):
+    """
+    PBKDF2-HMAC, for deployments that require a FIPS-approved function.
+
+    Args:
+        iterations (int): Number of HMAC iterations.
+    """
+
+    algorithm = "pbkdf2_sha256"
+
+    def __init__(self, iterations: int = 600_000, **kwargs):
+        super().__init__(**kwargs)
+        self.iterations = iterations
+
+    def params(self) -> Dict[str, int]:
+        return {"i": self.iterations}
+
+    @classmethod
+    def from_params(cls, params: Dict[str, int]) -> "Pbkdf2Hasher":
+        return cls(iterations=params["i"])
+
+    def derive(self, password: bytes, salt: bytes, size: int) -> bytes:
+        return pbkdf2_hmac("sha256", password, salt, self.iterations, size)
+
+
+HASHERS: Dict[str, Type[PasswordHasher]] = {
+    ScryptHasher.algorithm: ScryptHasher,
+    Pbkdf2Hasher.algorithm: Pbkdf2Hasher,
+}
+"""Hasher classes by the algorithm name that starts their hash strings."""
+
+
+def _parse(encoded: str) -> Tuple[PasswordHasher, bytes, bytes]:
+    try:
+        algorithm, params, salt, key = encoded.split("$")
+        values = dict(item.split("=") for item in params.split(","))
+        hasher = HASHERS[algorithm].from_params(
+            {name: int(value) for name, value in values.items()}
+        )
+        return hasher, _decode(salt), _decode(key)
+    except (KeyError, ValueError) as e:
+        raise ValueError(f"Unrecognised password hash: {encoded[:20]!r}") from e
+
+
+def verify_password(password: str, encoded: str) -> bool:
+    """
+    Check a password against a stored hash in constant time.
+
+    Args:
+        password (str): Password to check.
+        encoded (str): Stored hash string, from any registered hasher.
+
+    Returns:
+        bool: True if the password matches.
+
+    Raises:
+        ValueError: If the hash string is malformed or its algorithm is
+            unknown.
+    """
+    hasher, salt, key = _parse(encoded)
+    derived = hasher.derive(password.encode("utf-8"), salt, len(key))
+    return hmac.compare_digest(derived, key)
+
+
+class CredentialBackend(ABC):
+    """
+    Storage interface of :class:`CredentialStore`.
+
+    Backends map usernames to hash strings and must be safe to call from
+    several threads.
+    """
+
+    @abstractmethod
+    def get(self, username: str) -> Optional[str]:
+        """Return the stored hash of ``username``, or None."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def add(self, username: str, password_hash: str) -> bool:
+        """Store a new user; return False if the username is taken."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def replace(
+        self, username: str, password_hash: str, expected: Optional[str] = None
+    ) -> bool:
+        """
+        Replace a user's hash; return False if the user does not exist.
+
+        If ``expected`` is given the hash is only replaced while it still
+        equals ``expected``, so a rehash never undoes a password change.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, username: str) -> bool:
+        """Remove a user; return False if the user does not exist."""
+        raise NotImplementedError
+
+    def __contains__(self, username: str) -> bool:
+        return self.get(username) is not None
+
+    @abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release resources held by the backend."""
+
+
+class MemoryBackend(CredentialBackend):
+    """Credentials kept in a dict, for tests and single-process use."""
+
+    def __init__(self):
+        self._hashes: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def get(self, username: str) -> Optional[str]:
+        return self._hashes.get(username)
+
+    def add(self, username: str, password_hash: str) -> bool:
+        with self._lock:
+            if username in self._hashes:
+                return False
+            self._hashes[username] = password_hash
+            return True
+
+    def replace(
+        self, username: str, password_hash: str, expected: Optional[str] = None
+    ) -> bool:
+        with self._lock:
+            current = self._hashes.get(username)
+            if current is None or (expected is not None and current != expected):
+                return False
+            self._hashes[username] = password_hash
+            return True
+
+    def delete(self, username: str) -> bool:
+        with self._lock:
+            return self._hashes.pop(username, None) is not None
+
+    def __contains__(self, username: str) -> bool:
+        return username in self._hashes
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+
+class SQLiteBackend(CredentialBackend):
+    """
+    Credentials kept in a local SQLite file.
+
+    One connection is shared by all threads and serialised by a lock;
+    the statements are tiny next to the key derivation. File databases
+    use write-ahead logging so other processes can read concurrently.
+
+    Args:
+        path (str | Path): Database file, or ``":memory:"``.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        if self.path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS credentials ("
+            "username TEXT PRIMARY KEY, password_hash TEXT NOT NULL)"
+        )
+
+    def _execute(self, sql: str, *args) -> sqlite3.Cursor:
+        with self._lock:
+            return self._connection.execute(sql, args)
+
+    def get(self, username: str) -> Optional[str]:
+        row = self._execute(
+            "SELECT password_hash FROM credentials WHERE username = ?", username
+        ).fetchone()
+        return row[0] if row else None
+
+    def add(self, username: str, password_hash: str) -> bool:
+        cursor = self._execute(
+            "INSERT OR IGNORE INTO credentials VALUES (?, ?)", username, password_hash
+        )
+        return cursor.rowcount == 1
+
+    def replace(
+        self, username: str, password_hash: str, expected: Optional[str] = None
+    ) -> bool:
+        if expected is None:
+            cursor = self._execute(
+                "UPDATE credentials SET password_hash = ? WHERE username = ?",
+                password_hash,
+                username,
+            )
+        else:
+            cursor = self._execute(
+                "UPDATE credentials SET password_hash = ? "
+                "WHERE username = ? AND password_hash = ?",
+                password_hash,
+                username,
+                expected,
+            )
+        return cursor.rowcount == 1
+
+    def delete(self, username: str) -> bool:
+        cursor = self._execute("DELETE FROM credentials WHERE username = ?", username)
+        return cursor.rowcount == 1
+
+    def __len__(self) -> int:
+        return self._execute("SELECT COUNT(*) FROM credentials").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+class CredentialStore:
+    """
+    Username to password-hash store with key derivation off the caller.
+
+    The ``submit_*`` methods return futures, so many registrations and
+    logins can be in flight at once (``asyncio.wrap_future`` turns them
+    into awaitables); the plain methods wait for the result.
+
+    Args:
+        backend: Where hashes are kept; an in-memory store by default.
+            Use :class:`SQLiteBackend` to persist them.
+        hasher (PasswordHasher | None): Hasher for new hashes; scrypt with
+            default costs if omitted. Stored hashes made with other
+            settings are upgraded on the next successful login.
+        max_workers (int | None): Threads deriving keys; one per core by
+            default.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CredentialBackend] = None,
+        hasher: Optional[PasswordHasher] = None,
+        max_workers: Optional[int] = None,
+    ):
+        self.backend = MemoryBackend() if backend is None else backend
+        self.hasher = ScryptHasher() if hasher is None else hasher
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or DEFAULT_MAX_WORKERS,
+            thread_name_prefix="myutils-kdf",
+        )
+
+    @property
+    def hasher(self) -> PasswordHasher:
+        """Hasher for new hashes; setting it also replaces the dummy hash."""
+        return self._hasher
+
+    @hasher.setter
+    def hasher(self, hasher: PasswordHasher) -> None:
+        self._hasher = hasher
+        self._dummy_hash = hasher.dummy_hash()
+
+    def __enter__(self) -> "CredentialStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __contains__(self, username: str) -> bool:
+        return username in self.backend
+
+    def __len__(self) -> int:
+        return len(self.backend)
+
+    def close(self) -> None:
+        """Finish queued work, stop the worker threads and the backend."""
+        self._executor.shutdown(wait=True)
+        self.backend.close()
+
+    def _register(self, username: str, password: str) -> None:
+        if username in self.backend:
+            raise ValueError("Username already exists")
+        if not self.backend.add(username, self.hasher.hash(password)):
+            raise ValueError("Username already exists")
+
+    def _verify(self, username: str, password: str) -> bool:
+        encoded = self.backend.get(username)
+        if encoded is None:
+            # Spend the same time as for a real user, so response times do
+            # not reveal which usernames exist.
+            verify_password(password, self._dummy_hash)
+            return False
+
+        if not verify_password(password, encoded):
+            return False
+        if self.hasher.needs_rehash(encoded):
+            self.backend.replace(username, self.hasher.hash(password), encoded)
+        return True
+
+    def _set_password(self, username: str, password: str) -> None:
+        if not self.backend.replace(username, self.hasher.hash(password)):
+            raise KeyError(username)
+
+    def submit_contains(self, username: str) -> "Future[bool]":
+        """
+        Check in the background whether a user exists.
+
+        Args:
+            username (str): Username to look up.
+
+        Returns:
+            Future[bool]: True if the user is registered.
+        """
+        return self._executor.submit(self.backend.__contains__, username)
+
+    def submit_register(self, username: str, password: str) -> "Future[None]":
+        """
+        Hash and store a new user's password in the background.
+
+        Args:
+            username (str): New username.
+            password (str): The user's password; validate it beforehand.
+
+        Returns:
+            Future[None]: Fails with ValueError if the username is taken.
+        """
+        return self._executor.submit(self._register, username, password)
+
+    def submit_verify(self, username: str, password: str) -> "Future[bool]":
+        """
+        Check a login in the background, upgrading an outdated hash.
+
+        Args:
+            username (str): Username to log in.
+            password (str): Password given.
+
+        Returns:
+            Future[bool]: True if the user exists and the password matches.
+        """
+        return self._executor.submit(self._verify, username, password)
+
+    def register(self, username: str, password: str) -> None:
+        """
+        Hash and store a new user's password.
+
+        Raises:
+            ValueError: If the username is already registered.
+        """
+        self.submit_register(username, password).result()
+
+    def verify(self, username: str, password: str) -> bool:
+        """Return True if the user exists and the password matches."""
+        return self.submit_verify(username, password).result()
+
+    def set_password(self, username: str, password: str) -> None:
+        """
+        Replace an existing user's password.
+
+        Raises:
+            KeyError: If the user does not exist.
+        """
+        self._executor.submit(self._set_password, username, password).result()
+
+    def remove(self, username: str) -> bool:
+        """Delete a user; return False if the user did not exist."""
+        return self.backend.delete(username)
@@ -1,7 +1,9 @@
 import re
 
-# Simple in-memory "database"
-users_db = {}
+from .credential_store import CredentialStore
+
+# In-memory credential store: salted password hashes, never plaintext
+users_db = CredentialStore()
 
 
 def is_valid_password(password: str) -> bool:
@@ -35,7 +37,7 @@ def register_user():
         )
         return
 
-    users_db[username] = password
+    users_db.register(username, password)
     print(f"User '{username}' registered successfully!")
 
 
@@ -47,7 +49,7 @@ def login_simulator():
     password = input("Enter password: ").strip()
 
     if username in users_db:
-        if users_db[username] == password:
+        if users_db.verify(username, password):
             print(f"Login successful! Welcome, {username}.")
         else:
             print("Incorrect password. Try again.")
@@ -55,17 +57,18 @@ def login_simulator():
         print("Username not found. Please register first.")
 
 
-# Demo flow
-while True:
-    choice = input(
-        "\nChoose an option:\n" "1. Register\n" "2. Login\n" "3. Exit\n" "Enter: "
-    ).strip()
-    if choice == "1":
-        register_user()
-    elif choice == "2":
-        login_simulator()
-    elif choice == "3":
-        print("Exiting...")
-        break
-    else:
-        print("Invalid option. Try again.")
+if __name__ == "__main__":
+    # Demo flow
+    while True:
+        choice = input(
+            "\nChoose an option:\n" "1. Register\n" "2. Login\n" "3. Exit\n" "Enter: "
+        ).strip()
+        if choice == "1":
+            register_user()
+        elif choice == "2":
+            login_simulator()
+        elif choice == "3":
+            print("Exiting...")
+            break
+        else:
+            print("Invalid option. Try again.")
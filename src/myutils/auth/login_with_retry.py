@@ -1,11 +1,23 @@
 import re
+from typing import Dict
 
-# Simple in-memory "database"
-users_db = {
+from .credential_store import CredentialStore
+from .throttle import LoginThrottle
+
+# In-memory credential store: salted password hashes, never plaintext
+users_db = CredentialStore()
+
+# Failed attempts per username, kept across calls to login_simulator(),
+# with one throttle per max_attempts value
+_login_throttles: Dict[int, LoginThrottle] = {}
+
+DEMO_USERS = {
     "khush": "khush123",
     "swaraj": "swaraj123",
     "joy": "joy789",
 }
+"""Accounts registered by the demo below (hashing them at import would
+make importing this module slow)."""
 
 
 def is_valid_password(password: str) -> bool:
@@ -39,14 +51,31 @@ def register_user():
         )
         return
 
-    users_db[username] = password
+    users_db.register(username, password)
     print(f"User '{username}' registered successfully!")
 
 
+def get_login_throttle(max_attempts: int) -> LoginThrottle:
+    """
+    Return the throttle shared by login_simulator() calls that allow
+    ``max_attempts`` attempts per username.
+    """
+    throttle = _login_throttles.get(max_attempts)
+    if throttle is None:
+        throttle = LoginThrottle(user_attempts=max_attempts)
+        _login_throttles[max_attempts] = throttle
+    return throttle
+
+
 def login_simulator(max_attempts: int = 3):
     """
     Simulates login for existing users with retry logic.
 
+    Attempts also go through a throttle sized from ``max_attempts`` (see
+    get_login_throttle()), so calling the function again does not reset
+    the count: a locked username stays locked for the throttle's lockout
+    period.
+
     Args:
         max_attempts (int): Maximum number of allowed login attempts.
     """
@@ -56,8 +85,14 @@ def login_simulator(max_attempts: int = 3):
         username = input("Enter username: ").strip()
         password = input("Enter password: ").strip()
 
+        login_throttle = get_login_throttle(max_attempts)
+        decision = login_throttle.attempt(username)
+        if not decision.allowed:
+            break
+
         if username in users_db:
-            if users_db[username] == password:
+            if users_db.verify(username, password):
+                login_throttle.succeeded(username)
                 print(f"Login successful! Welcome, {username}.")
                 return
             else:
@@ -66,25 +101,30 @@ def login_simulator(max_attempts: int = 3):
             print("Username not found.")
 
         attempts += 1
-        remaining = max_attempts - attempts
-        if remaining:
-            print(f"Attempts remaining: {remaining}\n")
+        remaining = min(max_attempts - attempts, decision.remaining)
+        if not remaining:
+            break
+        print(f"Attempts remaining: {remaining}\n")
 
     print("Too many failed login attempts. Please try again later.")
 
 
-# Demo flow
-while True:
-    choice = input(
-        "\nChoose an option:\n" "1. Register\n" "2. Login\n" "3. Exit\n" "Enter: "
-    ).strip()
-
-    if choice == "1":
-        register_user()
-    elif choice == "2":
-        login_simulator()
-    elif choice == "3":
-        print("Exiting...")
-        break
-    else:
-        print("Invalid option. Try again.")
+if __name__ == "__main__":
+    for demo_username, demo_password in DEMO_USERS.items():
+        users_db.register(demo_username, demo_password)
+
+    # Demo flow
+    while True:
+        choice = input(
+            "\nChoose an option:\n" "1. Register\n" "2. Login\n" "3. Exit\n" "Enter: "
+        ).strip()
+
+        if choice == "1":
+            register_user()
+        elif choice == "2":
+            login_simulator()
+        elif choice == "3":
+            print("Exiting...")
+            break
+        else:
+            print("Invalid option. Try again.")
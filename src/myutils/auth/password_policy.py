@@ -0,0 +1,268 @@
+"""
+Declarative password policy compiled into a single-pass classifier.
+
+A :class:`PasswordPolicy` precomputes a ``str.translate`` table that maps
+every character to a bit for its character class (lowercase, uppercase,
+digit, special, whitespace). Checking a password is one C-level
+``translate`` pass plus a set of the few distinct class codes, which a
+cached table turns into violation bits. No
+regular expressions, no per-rule rescans and no model construction.
+"""
+
+import string
+from enum import IntFlag
+from typing import Container, Dict, Iterable, List, Optional
+
+_LOWER = 1
+_UPPER = 2
+_DIGIT = 4
+_SPECIAL = 8
+_SPACE = 16
+_CLASS_COMBINATIONS = 32
+
+
+class PasswordViolation(IntFlag):
+    """Rules a password breaks, combined as a bitmask (0 means valid)."""
+
+    NONE = 0
+    EMPTY = 1
+    TOO_SHORT = 2
+    TOO_LONG = 4
+    WHITESPACE = 8
+    NO_LOWERCASE = 16
+    NO_UPPERCASE = 32
+    NO_DIGIT = 64
+    NO_SPECIAL = 128
+    BREACHED = 256
+
+
+_TOO_SHORT = int(PasswordViolation.TOO_SHORT)
+_TOO_LONG = int(PasswordViolation.TOO_LONG)
+_BREACHED = int(PasswordViolation.BREACHED)
+_EMPTY_MASK = int(PasswordViolation.EMPTY | PasswordViolation.TOO_SHORT)
+
+
+class _ClassTable(dict):
+    """
+    Translate table from code point to class-bit character.
+
+    ASCII is filled in up front; any other character is classified on
+    first sight and cached, so Unicode passwords stay single-pass too.
+    With ``regex_classes``, letters and digits are classified as the
+    regular expression classes ``[a-z]``, ``[A-Z]`` and ``\\d`` match them.
+    """
+
+    def __init__(self, special_chars: str, regex_classes: bool = False):
+        super().__init__()
+        self.special_chars = frozenset(special_chars)
+        self.regex_classes = regex_classes
+        for code in range(128):
+            self[code] = self._classify(chr(code))
+
+    def _classify(self, char: str) -> str:
+        bits = 0
+        if self.regex_classes:
+            if "a" <= char <= "z":
+                bits |= _LOWER
+            elif "A" <= char <= "Z":
+                bits |= _UPPER
+            elif char.isdecimal():
+                bits |= _DIGIT
+        else:
+            if char.islower():
+                bits |= _LOWER
+            if char.isupper():
+                bits |= _UPPER
+            if char.isdigit():
+                bits |= _DIGIT
+        if char in self.special_chars:
+            bits |= _SPECIAL
+        if char.isspace():
+            bits |= _SPACE
+        return chr(bits)
+
+    def __missing__(self, code: int) -> str:
+        value = self[code] = self._classify(chr(code))
+        return value
+
+
+class _ViolationTable(dict):
+    """
+    Violation bits keyed by the set of class-bit characters in a password.
+
+    There are at most 32 distinct class characters, so this fills up
+    quickly and then every lookup is a single hash probe.
+    """
+
+    def __init__(self, class_violations: List[int]):
+        super().__init__()
+        self.class_violations = class_violations
+
+    def __missing__(self, codes: frozenset) -> int:
+        classes = 0
+        for code in codes:
+            classes |= ord(code)
+        value = self[codes] = self.class_violations[classes]
+        return value
+
+
+class PasswordPolicy:
+    """
+    A password policy compiled for fast checking.
+
+    :param min_length: Minimum number of characters
+    :param max_length: Maximum number of characters
+    :param require_lowercase: Require at least one lowercase letter
+    :param require_uppercase: Require at least one uppercase letter
+    :param require_digit: Require at least one digit
+    :param require_special: Require at least one of ``special_chars``
+    :param allow_whitespace: Accept whitespace characters
+    :param special_chars: Characters that count as special
+    :param breach_filter: Optional set-like collection of breached passwords
+        (usually a :class:`~myutils.auth.breach_filter.BreachFilter`);
+        passwords found in it are reported as ``BREACHED``
+    :param regex_classes: Count only ``[a-z]`` as lowercase, ``[A-Z]`` as
+        uppercase and ``\\d`` (Unicode decimal digits) as digits, as a
+        regular expression does, instead of using ``str.islower``,
+        ``str.isupper`` and ``str.isdigit``
+    """
+
+    def __init__(
+        self,
+        min_length: int = 8,
+        max_length: int = 128,
+        require_lowercase: bool = True,
+        require_uppercase: bool = True,
+        require_digit: bool = True,
+        require_special: bool = True,
+        allow_whitespace: bool = False,
+        special_chars: str = string.punctuation,
+        breach_filter: Optional[Container[str]] = None,
+        regex_classes: bool = False,
+    ):
+        self.min_length = min_length
+        self.max_length = max_length
+        self.special_chars = special_chars
+        self.breach_filter = breach_filter
+        self._table = _ClassTable(special_chars, regex_classes)
+
+        required = [
+            (require_lowercase, _LOWER, PasswordViolation.NO_LOWERCASE),
+            (require_uppercase, _UPPER, PasswordViolation.NO_UPPERCASE),
+            (require_digit, _DIGIT, PasswordViolation.NO_DIGIT),
+            (require_special, _SPECIAL, PasswordViolation.NO_SPECIAL),
+        ]
+        # Violation bits for every combination of character classes present.
+        self._class_violations = []
+        for classes in range(_CLASS_COMBINATIONS):
+            violations = 0
+            for enabled, bit, violation in required:
+                if enabled and not classes & bit:
+                    violations |= violation
+            if not allow_whitespace and classes & _SPACE:
+                violations |= PasswordViolation.WHITESPACE
+            self._class_violations.append(int(violations))
+        self._violations = _ViolationTable(self._class_violations)
+
+        # Most specific first, in the order the User models report them.
+        self.messages: Dict[PasswordViolation, str] = {
+            PasswordViolation.EMPTY: "Password must be a valid string",
+            PasswordViolation.TOO_SHORT: (
+                f"Password must be at least {min_length} characters long"
+            ),
+            PasswordViolation.TOO_LONG: (
+                f"Password must be at most {max_length} characters long"
+            ),
+            PasswordViolation.WHITESPACE: "Password cannot contain whitespaces",
+            PasswordViolation.NO_LOWERCASE: (
+                "Password must contain at least one lowercase character"
+            ),
+            PasswordViolation.NO_UPPERCASE: (
+                "Password must contain at least one uppercase character"
+            ),
+            PasswordViolation.NO_DIGIT: "Password must contain at least one number",
+            PasswordViolation.NO_SPECIAL: (
+                "Password must contain at least one special character from: "
+                f"{special_chars}"
+            ),
+            PasswordViolation.BREACHED: (
+                "Password has appeared in a data breach, choose another one"
+            ),
+        }
+        self._flags: Dict[int, PasswordViolation] = {}
+
+    def _mask(self, password: str) -> int:
+        # Plain ints throughout: IntFlag arithmetic is far slower.
+        length = len(password)
+        if not length:
+            return _EMPTY_MASK | self._class_violations[0]
+        violations = self._violations[frozenset(password.translate(self._table))]
+        if length < self.min_length:
+            violations |= _TOO_SHORT
+        elif length > self.max_length:
+            violations |= _TOO_LONG
+        breach_filter = self.breach_filter
+        if breach_filter is not None and password in breach_filter:
+            violations |= _BREACHED
+        return violations
+
+    def _flag(self, mask: int) -> PasswordViolation:
+        flag = self._flags.get(mask)
+        if flag is None:
+            flag = self._flags[mask] = PasswordViolation(mask)
+        return flag
+
+    def check(self, password: str) -> PasswordViolation:
+        """
+        Return every rule ``password`` breaks.
+
+        :param password: Password to check
+        :return: PasswordViolation bitmask, ``NONE`` if the password is valid
+        """
+        return self._flag(self._mask(password))
+
+    def check_many(self, passwords: Iterable[str]) -> List[PasswordViolation]:
+        """
+        Check many passwords at once.
+
+        :param passwords: Iterable of passwords
+        :return: One PasswordViolation bitmask per password, in order
+        """
+        mask, flag = self._mask, self._flag
+        return [flag(mask(password)) for password in passwords]
+
+    def message(self, violations: PasswordViolation) -> str:
+        """
+        Return the message of the most important violation.
+
+        :param violations: Non-empty bitmask from :meth:`check`
+        :return: Human-readable message
+        """
+        for violation, text in self.messages.items():
+            if violations & violation:
+                return text
+        raise ValueError("No violations to describe")
+
+
+DEFAULT_POLICY = PasswordPolicy()
+"""Policy of the :mod:`~myutils.auth.password_strength_checker` User model:
+8-128 characters, no whitespace, at least one lowercase, uppercase, digit
+and special character."""
+
+REGEX_POLICY = PasswordPolicy(regex_classes=True)
+"""The same rules with the character classes of
+:data:`~myutils.auth.password_strength_checker_re.PASSWORD_REGEX`, for the
+:mod:`~myutils.auth.password_strength_checker_re` User model."""
+
+
+def validate_passwords(
+    passwords: Iterable[str], policy: PasswordPolicy = DEFAULT_POLICY
+) -> List[PasswordViolation]:
+    """
+    Validate many passwords without building a model per password.
+
+    :param passwords: Iterable of passwords
+    :param policy: Policy to apply
+    :return: One PasswordViolation bitmask per password (``NONE`` when valid)
+    """
+    return policy.check_many(passwords)
@@ -0,0 +1,742 @@
+"""
+Guessability-based password strength estimation.
+
+The pass/fail checkers only look at character classes, so ``QwErTy12!``
+and ``aaaaBBBB1111!!!!`` pass although an attacker would guess them
+quickly. This module estimates how many guesses a password takes, in
+the manner of zxcvbn:
+
+1. Find every pattern in the password: dictionary words (also reversed
+   and l33t-spelled), keyboard walks, repeats, stretched strings (every
+   character written several times), sequences and dates.
+2. Estimate the guesses for each match.
+3. Pick the cheapest way to cover the whole password with matches and
+   brute-forced characters by dynamic programming.
+
+Dictionary matching runs one Aho-Corasick automaton over the password,
+so its cost does not depend on the size of the word lists. The
+automaton and the keyboard adjacency tables are built once, when the
+estimator is created; :func:`estimate_strength` shares one instance.
+"""
+
+import math
+import re
+import time
+from collections import deque
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from ._strength_data import DICTIONARIES
+
+SEGMENT_GUESSES = 100
+"""Extra guesses for each additional segment after the first.
+
+zxcvbn uses 10000, which alone puts any password of four segments in the
+top score band however trivial the segments are. A smaller value keeps
+the segment count from dominating the estimate."""
+
+BRUTEFORCE_CARDINALITY = 10
+"""Guesses per brute-forced character."""
+
+MIN_SUBMATCH_GUESSES_SINGLE_CHAR = 10
+MIN_SUBMATCH_GUESSES_MULTI_CHAR = 50
+MIN_YEAR_SPACE = 20
+DATE_MIN_YEAR = 1000
+DATE_MAX_YEAR = 2050
+REFERENCE_YEAR = time.localtime().tm_year
+"""Year that date and year guesses are measured from."""
+
+SCORE_THRESHOLDS = (3, 6, 8, 10)
+"""log10(guesses) a password must reach for scores 1, 2, 3 and 4."""
+
+L33T_TABLE = str.maketrans(
+    {
+        "4": "a",
+        "@": "a",
+        "8": "b",
+        "(": "c",
+        "{": "c",
+        "3": "e",
+        "6": "g",
+        "9": "g",
+        "1": "i",
+        "!": "i",
+        "|": "i",
+        "0": "o",
+        "$": "s",
+        "5": "s",
+        "7": "t",
+        "+": "t",
+        "2": "z",
+        "%": "x",
+    }
+)
+"""Common l33t substitutions, mapped back to the letter they replace."""
+
+QWERTY = (
+    (0, "`~ 1! 2@ 3# 4$ 5% 6^ 7& 8* 9( 0) -_ =+"),
+    (3, "qQ wW eE rR tT yY uU iI oO pP [{ ]} \\|"),
+    (4, "aA sS dD fF gG hH jJ kK lL ;: '\""),
+    (5, "zZ xX cC vV bB nN mM ,< .> /?"),
+)
+"""US keyboard rows: (offset in half keys, keys as unshifted+shifted)."""
+
+KEYPAD = (
+    (2, "/ * -"),
+    (0, "7 8 9 +"),
+    (0, "4 5 6"),
+    (0, "1 2 3"),
+    (0, "0 _ ."),
+)
+"""Numeric keypad rows; ``_`` marks a gap."""
+
+_DATE_SPLITS = {
+    4: ((1, 2), (2, 3)),
+    5: ((1, 3), (2, 3)),
+    6: ((1, 2), (2, 4), (4, 5)),
+    7: ((1, 3), (2, 3), (4, 5), (4, 6)),
+    8: ((2, 4), (4, 6)),
+}
+_DATE_WITH_SEPARATOR = re.compile(r"(?=((\d{1,4})([\s/\\_.-])(\d{1,2})\3(\d{1,4})))")
+_DIGIT_RUN = re.compile(r"\d{4,8}")
+_RECENT_YEAR = re.compile(r"19\d\d|20\d\d")
+_REPEAT_GREEDY = re.compile(r"(.+)\1+", re.DOTALL)
+_REPEAT_LAZY = re.compile(r"(.+?)\1+", re.DOTALL)
+_REPEAT_BASE = re.compile(r"^(.+?)\1+$", re.DOTALL)
+_CHAR_RUN = re.compile(r"(.)\1*", re.DOTALL)
+_OBVIOUS_SEQUENCE_STARTS = frozenset("aAzZ019")
+_LOG10_SEGMENT = math.log10(SEGMENT_GUESSES)
+_LOG10_2 = math.log10(2)
+_LOG10_BRUTEFORCE = math.log10(BRUTEFORCE_CARDINALITY)
+
+
+class PatternMatch(NamedTuple):
+    """One segment of the cheapest decomposition of a password."""
+
+    pattern: str
+    """``dictionary``, ``spatial``, ``repeat``, ``stretch``, ``sequence``,
+    ``date``, ``year`` or ``bruteforce``."""
+    start: int
+    end: int
+    token: str
+    guesses_log10: float
+    detail: str = ""
+
+
+class StrengthEstimate(NamedTuple):
+    """Estimated guessability of a password."""
+
+    guesses_log10: float
+    score: int
+    """0 (too guessable) to 4 (very unguessable), as in zxcvbn."""
+    sequence: Tuple[PatternMatch, ...]
+
+    @property
+    def guesses(self) -> float:
+        """Estimated number of guesses to find the password."""
+        return 10**self.guesses_log10
+
+
+def _binomial_sum(total: int, limit: int) -> int:
+    return sum(math.comb(total, i) for i in range(1, limit + 1))
+
+
+def _variations(upper: int, lower: int) -> int:
+    """Ways to place ``upper`` marked characters among ``upper + lower``."""
+    if not upper or not lower:
+        return 2 if upper else 1
+    return _binomial_sum(upper + lower, min(upper, lower))
+
+
+def _uppercase_variations(token: str) -> int:
+    if token.islower() or not any(char.isupper() for char in token):
+        return 1
+    if token.isupper() or (token[0].isupper() and token[1:].islower()):
+        return 2
+    if token[-1].isupper() and token[:-1].islower():
+        return 2
+    upper = sum(char.isupper() for char in token)
+    lower = sum(char.islower() for char in token)
+    return _variations(upper, lower) if lower else 1
+
+
+def _l33t_variations(token: str, plain: str) -> int:
+    variations = 1
+    for char in set(token):
+        letter = plain[token.index(char)]
+        if char.lower() == letter:
+            continue
+        subbed = token.count(char)
+        unsubbed = token.lower().count(letter)
+        variations *= 2 if not unsubbed else _variations(subbed, unsubbed)
+    return variations
+
+
+def _year_space(year: int) -> int:
+    return max(abs(year - REFERENCE_YEAR), MIN_YEAR_SPACE)
+
+
+def _four_digit_year(year: int) -> int:
+    if year > 99:
+        return year
+    return 1900 + year if year > 50 else 2000 + year
+
+
+def _day_month(a: int, b: int) -> bool:
+    return (1 <= a <= 31 and 1 <= b <= 12) or (1 <= b <= 31 and 1 <= a <= 12)
+
+
+def _date_year(ints: Tuple[int, int, int]) -> Optional[int]:
+    """Return the year of a plausible day/month/year triple, else None."""
+    if not 1 <= ints[1] <= 31:
+        return None
+    over_12 = over_31 = under_1 = 0
+    for value in ints:
+        if 99 < value < DATE_MIN_YEAR or value > DATE_MAX_YEAR:
+            return None
+        over_31 += value > 31
+        over_12 += value > 12
+        under_1 += value <= 0
+    if over_31 >= 2 or over_12 == 3 or under_1 >= 2:
+        return None
+
+    splits = ((ints[2], ints[0], ints[1]), (ints[0], ints[1], ints[2]))
+    for year, a, b in splits:
+        if DATE_MIN_YEAR <= year <= DATE_MAX_YEAR:
+            return year if _day_month(a, b) else None
+    for year, a, b in splits:
+        if _day_month(a, b):
+            return _four_digit_year(year)
+    return None
+
+
+def _spatial_graph(rows, slanted: bool):
+    """
+    Build ``(char -> (key, shifted), key -> {neighbour: direction})``.
+
+    Keys sit at ``offset + 2 * column`` half-key units. On a slanted
+    keyboard the keys of neighbouring rows are half a key apart.
+    """
+    positions = {}
+    keys = {}
+    for row, (offset, line) in enumerate(rows):
+        for column, key in enumerate(line.split()):
+            if key == "_":
+                continue
+            positions[key] = (offset + 2 * column, row)
+            for index, char in enumerate(key):
+                keys[char] = (key, index > 0)
+
+    graph = {}
+    for key, (x, y) in positions.items():
+        neighbours = {}
+        for other, (other_x, other_y) in positions.items():
+            dx, dy = other_x - x, other_y - y
+            if other == key or abs(dy) > 1:
+                continue
+            adjacent = abs(dx) == 2 if not dy else abs(dx) <= (1 if slanted else 2)
+            if adjacent:
+                neighbours[other] = (dx, dy)
+        graph[key] = neighbours
+    return keys, graph
+
+
+class _Keyboard:
+    """Adjacency table of one keyboard layout, for keyboard-walk guesses."""
+
+    def __init__(self, name: str, rows, slanted: bool):
+        self.name = name
+        self.keys, self.graph = _spatial_graph(rows, slanted)
+        self.starting_positions = len(self.graph)
+        self.average_degree = (
+            sum(len(neighbours) for neighbours in self.graph.values())
+            / self.starting_positions
+        )
+
+    def walks(self, password: str) -> Iterable[Tuple[int, int, int, int]]:
+        """Yield ``(start, end, turns, shifted)`` for walks of 3+ keys."""
+        keys, graph = self.keys, self.graph
+        length = len(password)
+        i = 0
+        while i < length - 1:
+            first = keys.get(password[i])
+            if first is None:
+                i += 1
+                continue
+            previous = first[0]
+            shifted = int(first[1])
+            direction = None
+            turns = 0
+            j = i + 1
+            while j < length:
+                current = keys.get(password[j])
+                if current is None or current[0] not in graph[previous]:
+                    break
+                step = graph[previous][current[0]]
+                if step != direction:
+                    turns += 1
+                    direction = step
+                shifted += current[1]
+                previous = current[0]
+                j += 1
+            if j - i > 2:
+                yield i, j, turns, shifted
+            i = j if j - i > 1 else i + 1
+
+    def guesses(self, length: int, turns: int, shifted: int) -> float:
+        starts, degree = self.starting_positions, self.average_degree
+        guesses = 0.0
+        for i in range(2, length + 1):
+            for j in range(1, min(turns, i - 1) + 1):
+                guesses += math.comb(i - 1, j - 1) * starts * degree**j
+        return guesses * _variations(shifted, length - shifted)
+
+
+class _Automaton:
+    """
+    Aho-Corasick automaton over every dictionary word.
+
+    Each node stores the words ending there, already merged along the
+    failure links, so matching is one transition per character plus one
+    step per reported match.
+    """
+
+    def __init__(self, words: Dict[str, Tuple[str, int]]):
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[tuple] = [()]
+        for word, entry in words.items():
+            node = 0
+            for char in word:
+                child = goto[node].get(char)
+                if child is None:
+                    child = len(goto)
+                    goto[node][char] = child
+                    goto.append({})
+                    outputs.append(())
+                node = child
+            outputs[node] = ((len(word), entry),)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in goto[node].items():
+                queue.append(child)
+                state = fail[node]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                fail[child] = goto[state].get(char, 0)
+                outputs[child] += outputs[fail[child]]
+
+        self.goto = goto
+        self.fail = fail
+        self.outputs = outputs
+
+    def find(self, text: str) -> Iterable[Tuple[int, int, Tuple[str, int]]]:
+        """Yield ``(start, end, (dictionary, rank))`` for every word in text."""
+        goto, fail, outputs = self.goto, self.fail, self.outputs
+        node = 0
+        for end, char in enumerate(text, 1):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for length, entry in outputs[node]:
+                yield end - length, end, entry
+
+
+class StrengthEstimator:
+    """
+    Password strength estimator with its dictionaries compiled once.
+
+    :param dictionaries: Ranked word lists by name (most common first);
+        defaults to the bundled passwords, English words and names
+    :param user_inputs: Extra words to treat as very guessable, such as
+        the user's name or the site's name
+    """
+
+    def __init__(
+        self,
+        dictionaries: Optional[Dict[str, List[str]]] = None,
+        user_inputs: Iterable[str] = (),
+    ):
+        dictionaries = dict(DICTIONARIES if dictionaries is None else dictionaries)
+        dictionaries["user_inputs"] = [word for word in user_inputs if word]
+
+        words: Dict[str, Tuple[str, int]] = {}
+        for name, ranked in dictionaries.items():
+            for rank, word in enumerate(ranked, 1):
+                word = word.lower()
+                if word not in words or rank < words[word][1]:
+                    words[word] = (name, rank)
+        self._automaton = _Automaton(words)
+        self._keyboards = (
+            _Keyboard("qwerty", QWERTY, slanted=True),
+            _Keyboard("keypad", KEYPAD, slanted=False),
+        )
+        self._repeat_bases: Dict[str, float] = {}
+
+    def _dictionary_matches(self, password: str, matches: list) -> None:
+        lower = password.lower()
+        length = len(password)
+        find = self._automaton.find
+
+        for start, end, (name, rank) in find(lower):
+            token = password[start:end]
+            guesses = rank * _uppercase_variations(token)
+            matches.append(("dictionary", start, end, guesses, f"{name}#{rank}"))
+
+        for start, end, (name, rank) in find(lower[::-1]):
+            start, end = length - end, length - start
+            token = password[start:end]
+            if end - start < 3 or token.lower() == token.lower()[::-1]:
+                continue
+            guesses = rank * _uppercase_variations(token) * 2
+            matches.append(("dictionary", start, end, guesses, f"{name}#{rank} rev"))
+
+        plain = lower.translate(L33T_TABLE)
+        if plain != lower:
+            for start, end, (name, rank) in find(plain):
+                token = password[start:end]
+                if token.lower() == plain[start:end] or end - start < 2:
+                    continue
+                guesses = (
+                    rank
+                    * _uppercase_variations(token)
+                    * _l33t_variations(token, plain[start:end])
+                )
+                detail = f"{name}#{rank} l33t"
+                matches.append(("dictionary", start, end, guesses, detail))
+
+    def _spatial_matches(self, password: str, matches: list) -> None:
+        for keyboard in self._keyboards:
+            for start, end, turns, shifted in keyboard.walks(password):
+                guesses = keyboard.guesses(end - start, turns, shifted)
+                matches.append(("spatial", start, end, guesses, keyboard.name))
+
+    def _repeat_matches(self, password: str, matches: list) -> None:
+        position = 0
+        while position < len(password):
+            greedy = _REPEAT_GREEDY.search(password, position)
+            if greedy is None:
+                break
+            lazy = _REPEAT_LAZY.search(password, position)
+            if len(greedy.group(0)) > len(lazy.group(0)):
+                match = greedy
+                base = _REPEAT_BASE.match(match.group(0)).group(1)
+            else:
+                match = lazy
+                base = match.group(1)
+            start, end = match.span()
+            repeats = (end - start) // len(base)
+            guesses = 10 ** self._base_log10(base) * repeats
+            matches.append(("repeat", start, end, guesses, f"{base!r} x{repeats}"))
+            position = end
+
+    def _stretch_matches(self, password: str, matches: list) -> None:
+        # Runs of equal length k >= 2, such as "aaaaBBBB1111", are the
+        # base "aB1" with every character written k times (a standard
+        # cracking rule), not several independent repeats.
+        runs = [match.span() for match in _CHAR_RUN.finditer(password)]
+        first = 0
+        while first < len(runs):
+            width = runs[first][1] - runs[first][0]
+            last = first + 1
+            while last < len(runs) and runs[last][1] - runs[last][0] == width:
+                last += 1
+            if width > 1 and last - first > 1:
+                start, end = runs[first][0], runs[last - 1][1]
+                base = password[start:end:width]
+                guesses = 10 ** self._base_log10(base) * width
+                matches.append(("stretch", start, end, guesses, f"{base!r} x{width}"))
+            first = last
+
+    def _base_log10(self, base: str) -> float:
+        """Return log10 guesses of the base of a repeat or stretch, cached."""
+        base_log10 = self._repeat_bases.get(base)
+        if base_log10 is None:
+            base_log10 = self.estimate(base).guesses_log10
+            if len(self._repeat_bases) < 1024:
+                self._repeat_bases[base] = base_log10
+        return base_log10
+
+    def _sequence_matches(self, password: str, matches: list) -> None:
+        length = len(password)
+        start = 0
+        while start < length - 2:
+            delta = ord(password[start + 1]) - ord(password[start])
+            end = start + 2
+            while end < length and ord(password[end]) - ord(password[end - 1]) == delta:
+                end += 1
+            if end - start >= 3 and 0 < abs(delta) <= 5:
+                first = password[start]
+                if first in _OBVIOUS_SEQUENCE_STARTS:
+                    base = 4
+                elif first.isdigit():
+                    base = 10
+                else:
+                    base = 26
+                if delta < 0:
+                    base *= 2
+                guesses = base * (end - start)
+                matches.append(("sequence", start, end, guesses, f"step {delta}"))
+                start = end - 1
+            else:
+                start += 1
+
+    def _date_matches(self, password: str, matches: list) -> None:
+        for run in _DIGIT_RUN.finditer(password):
+            digits = run.group(0)
+            for start in range(len(digits) - 3):
+                for end in range(start + 4, min(start + 8, len(digits)) + 1):
+                    token = digits[start:end]
+                    years = []
+                    for k, m in _DATE_SPLITS[len(token)]:
+                        ints = (int(token[:k]), int(token[k:m]), int(token[m:]))
+                        year = _date_year(ints)
+                        if year is not None:
+                            years.append(year)
+                    if years:
+                        year = min(years, key=lambda y: abs(y - REFERENCE_YEAR))
+                        offset = run.start()
+                        guesses = _year_space(year) * 365
+                        matches.append(
+                            ("date", offset + start, offset + end, guesses, str(year))
+                        )
+
+        for found in _DATE_WITH_SEPARATOR.finditer(password):
+            token, first, _, second, third = found.groups()
+            year = _date_year((int(first), int(second), int(third)))
+            if year is not None:
+                start = found.start()
+                guesses = _year_space(year) * 365 * 4
+                matches.append(("date", start, start + len(token), guesses, str(year)))
+
+        for found in _RECENT_YEAR.finditer(password):
+            guesses = _year_space(int(found.group(0)))
+            matches.append(("year", found.start(), found.end(), guesses, ""))
+
+    def _matches(self, password: str) -> list:
+        matches: list = []
+        self._dictionary_matches(password, matches)
+        self._spatial_matches(password, matches)
+        self._repeat_matches(password, matches)
+        self._stretch_matches(password, matches)
+        self._sequence_matches(password, matches)
+        self._date_matches(password, matches)
+        return matches
+
+    def estimate(self, password: str) -> StrengthEstimate:
+        """
+        Estimate how many guesses it takes to find ``password``.
+
+        :param password: Password to score
+        :return: StrengthEstimate with log10 guesses, a 0-4 score and the
+            cheapest decomposition into patterns
+        """
+        length = len(password)
+        if not length:
+            return StrengthEstimate(0.0, 0, ())
+
+        # Matches ending at each position, as (start, log10 guesses, match).
+        ending: List[list] = [[] for _ in range(length + 1)]
+        for pattern, start, end, guesses, detail in self._matches(password):
+            if end - start < length:
+                floor = (
+                    MIN_SUBMATCH_GUESSES_SINGLE_CHAR
+                    if end - start == 1
+                    else MIN_SUBMATCH_GUESSES_MULTI_CHAR
+                )
+                guesses = max(guesses, floor)
+            log10 = math.log10(max(guesses, 1))
+            ending[end].append((start, log10, pattern, detail))
+
+        # Cheapest cover of each suffix [k, n), ignoring the segment
+        # penalties: a lower bound on what any prefix state still has to
+        # pay, used below to discard states early.
+        suffix = _suffix_bounds(length, ending)
+        factorials = _log10_factorials(2 * length + 1)
+
+        # best[k] maps (segments, ends in brute force) to
+        # (log10 product of guesses, back pointer) for the prefix [0, k).
+        best: List[dict] = [{} for _ in range(length + 1)]
+        best[0][(0, False)] = (0.0, None)
+        bound = math.inf
+        for k in range(1, length + 1):
+            states = best[k]
+            for (segments, brute), (log10, _) in best[k - 1].items():
+                key = (segments if brute else segments + 1, True)
+                cost = log10 + _LOG10_BRUTEFORCE
+                if key not in states or cost < states[key][0]:
+                    states[key] = (cost, (k - 1, (segments, brute), None))
+            for start, match_log10, pattern, detail in ending[k]:
+                for (segments, brute), (log10, _) in best[start].items():
+                    key = (segments + 1, False)
+                    cost = log10 + match_log10
+                    if key not in states or cost < states[key][0]:
+                        match = (pattern, start, detail, match_log10)
+                        states[key] = (cost, (start, (segments, brute), match))
+            if len(states) > 1:
+                best[k], bound = _prune(states, suffix[k], factorials, bound)
+
+        def total(item):
+            (segments, _), (log10, _) = item
+            product = log10 + factorials[segments]
+            return _log10_sum(product, (segments - 1) * _LOG10_SEGMENT)
+
+        key, _ = min(best[length].items(), key=total)
+        guesses_log10 = total((key, best[length][key]))
+        sequence = _unwind(password, best, key)
+        score = sum(guesses_log10 >= threshold for threshold in SCORE_THRESHOLDS)
+        return StrengthEstimate(guesses_log10, score, sequence)
+
+    def estimate_many(self, passwords: Iterable[str]) -> List[StrengthEstimate]:
+        """
+        Estimate many passwords.
+
+        :param passwords: Iterable of passwords
+        :return: One StrengthEstimate per password, in order
+        """
+        estimate = self.estimate
+        return [estimate(password) for password in passwords]
+
+
+_LOG10_FACTORIALS = [0.0]
+
+
+def _log10_factorials(n: int) -> List[float]:
+    """Return a table of ``log10(i!)`` covering ``i <= n``."""
+    table = _LOG10_FACTORIALS
+    while len(table) <= n:
+        table.append(table[-1] + math.log10(len(table)))
+    return table
+
+
+def _suffix_bounds(length: int, ending: List[list]) -> List[Tuple[float, int]]:
+    """
+    Return, for each position k, the cheapest cover of ``[k, length)``.
+
+    Each entry is ``(log10 product of guesses, segments)``, ignoring the
+    factorial and per-segment terms, so the cost is a lower bound for any
+    completion and the segment count gives one concrete completion.
+    """
+    starting: List[list] = [[] for _ in range(length + 1)]
+    for end in range(length + 1):
+        for start, log10, _, _ in ending[end]:
+            starting[start].append((end, log10))
+
+    # (cost, segments, starts with brute force) per position.
+    suffix = [(0.0, 0, False)] * (length + 1)
+    for k in range(length - 1, -1, -1):
+        cost, segments, brute = suffix[k + 1]
+        best = (cost + _LOG10_BRUTEFORCE, segments if brute else segments + 1, True)
+        for end, log10 in starting[k]:
+            cost, segments, _ = suffix[end]
+            if cost + log10 < best[0]:
+                best = (cost + log10, segments + 1, False)
+        suffix[k] = best
+    return [(cost, segments) for cost, segments, _ in suffix]
+
+
+def _brute_first(key: Tuple[int, bool]) -> Tuple[int, bool]:
+    return key[0], not key[1]
+
+
+def _prune(
+    states: dict, suffix: Tuple[float, int], factorials: List[float], bound: float
+) -> Tuple[dict, float]:
+    """
+    Drop states that cannot lead to the cheapest decomposition.
+
+    A state is dropped when another one has no more segments and no higher
+    cost, or when even the cheapest completion of it costs more than
+    ``bound``, the best total of a complete decomposition seen so far.
+    Returns the kept states and the updated bound.
+    """
+    rest, rest_segments = suffix
+    for (segments, _), (log10, _) in states.items():
+        # An actual completion: this state followed by the suffix's cover.
+        # log10(a + b) <= max(a, b) + log10(2).
+        segments += rest_segments
+        total = max(
+            log10 + rest + factorials[segments], (segments - 1) * _LOG10_SEGMENT
+        )
+        if total + _LOG10_2 < bound:
+            bound = total + _LOG10_2
+
+    # Walking by segment count (brute force first), keep a state only if
+    # it is cheaper than every state already kept: those can do whatever
+    # it can for no more. A state ending in brute force with no more
+    # segments extends brute force and matches just as well, and one
+    # ending in a match with fewer segments ends up with no more segments.
+    kept = {}
+    lowest = math.inf
+    for key in sorted(states, key=_brute_first):
+        log10 = states[key][0]
+        if log10 < lowest and log10 + rest + factorials[key[0]] <= bound:
+            lowest = log10
+            kept[key] = states[key]
+    return kept, bound
+
+
+def _log10_sum(a: float, b: float) -> float:
+    """Return ``log10(10**a + 10**b)`` without overflowing."""
+    high, low = (a, b) if a > b else (b, a)
+    return high + math.log10(1 + 10 ** (low - high))
+
+
+def _unwind(password: str, best: List[dict], key) -> Tuple[PatternMatch, ...]:
+    """Rebuild the chosen decomposition, merging brute-forced characters."""
+    sequence: List[PatternMatch] = []
+    brute_end = None
+    k = len(password)
+    while k:
+        _, (start, previous, match) = best[k][key]
+        if match is None:
+            if brute_end is None:
+                brute_end = k
+            if not previous[1]:
+                log10 = (brute_end - start) * _LOG10_BRUTEFORCE
+                token = password[start:brute_end]
+                sequence.append(
+                    PatternMatch("bruteforce", start, brute_end, token, log10)
+                )
+                brute_end = None
+        else:
+            pattern, start, detail, log10 = match
+            token = password[start:k]
+            sequence.append(PatternMatch(pattern, start, k, token, log10, detail))
+        k, key = start, previous
+    return tuple(reversed(sequence))
+
+
+_default_estimator: Optional[StrengthEstimator] = None
+
+
+def _default() -> StrengthEstimator:
+    global _default_estimator
+
+    if _default_estimator is None:
+        _default_estimator = StrengthEstimator()
+    return _default_estimator
+
+
+def estimate_strength(password: str) -> StrengthEstimate:
+    """
+    Estimate the guessability of ``password`` with the bundled dictionaries.
+
+    The shared estimator is built on first use and reused afterwards.
+
+    :param password: Password to score
+    :return: StrengthEstimate with log10 guesses, a 0-4 score and the
+        cheapest decomposition into patterns
+    """
+    return _default().estimate(password)
+
+
+def estimate_strengths(passwords: Iterable[str]) -> List[StrengthEstimate]:
+    """
+    Estimate the guessability of many passwords.
+
+    :param passwords: Iterable of passwords
+    :return: One StrengthEstimate per password, in order
+    """
+    return _default().estimate_many(passwords)
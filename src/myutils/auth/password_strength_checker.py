@@ -2,16 +2,10 @@ from pydantic import BaseModel, field_validator, Field, ValidationError
 from typing import Optional, Annotated
 import string
 from pathlib import Path
-import logging
 
-LOG_FILE_PATH = Path(__file__).parent / "password_validation.log"
+from .password_policy import DEFAULT_POLICY
 
-logging.basicConfig(
-    filename=LOG_FILE_PATH,
-    filemode="a",  # append mode
-    level=logging.INFO,
-    format="%(asctime)s | %(levelname)s | %(message)s",
-)
+LOG_FILE_PATH = Path(__file__).parent / "password_validation.log"
 
 
 # Set of allowed special characters for password validation.
@@ -48,7 +42,8 @@ class User(BaseModel):
         Validate the strength and structure of a password.
 
         This validator enforces a set of password security rules
-        without relying on regular expressions. The password must:
+        without relying on regular expressions, using the compiled
+        single-pass :data:`DEFAULT_POLICY`. The password must:
 
         - Be a non-empty string
         - Contain no whitespace characters
@@ -58,6 +53,8 @@ class User(BaseModel):
         - Include at least one special character from `string.punctuation`
         - Respect length constraints defined at the field level
           (8–128 characters)
+        - Not be a known breached password, when a breach filter is in
+          use (see :func:`~myutils.auth.breach_filter.use_breach_filter`)
 
         Args:
             pwd (str): The password value provided by the user.
@@ -68,30 +65,21 @@ class User(BaseModel):
         Raises:
             ValueError: If the password violates any of the validation rules.
         """
-        if not pwd:
-            raise ValueError("Password must be a valid string")
-
-        if any(ch.isspace() for ch in pwd):
-            raise ValueError("Password cannot contain whitespaces")
-
-        if not any(ch.islower() for ch in pwd):
-            raise ValueError("Password must contain at least one lowercase character")
-
-        if not any(ch.isupper() for ch in pwd):
-            raise ValueError("Password must contain at least one uppercase character")
-
-        if not any(ch.isdigit() for ch in pwd):
-            raise ValueError("Password must contain at least one number")
-
-        if not any(ch in SPECIAL_CHARS for ch in pwd):
-            raise ValueError(
-                f"Password must contain at least one special character from: {SPECIAL_CHARS}"
-            )
+        violations = DEFAULT_POLICY.check(pwd)
+        if violations:
+            raise ValueError(DEFAULT_POLICY.message(violations))
 
         return pwd
 
 
 if __name__ == "__main__":
+    from myutils.auth.audit_log import (
+        audit_password_validation,
+        enable_audit_logging,
+    )
+
+    enable_audit_logging(LOG_FILE_PATH)
+
     passwords = [
         "Pass word123!",
         "abc123",
@@ -103,9 +91,9 @@ if __name__ == "__main__":
     for pwd in passwords:
         try:
             user = User(password=pwd)
-            logging.info(f"Valid password accepted: {user.password}")
+            audit_password_validation(True, user.username, length=len(pwd))
 
         except ValidationError as e:
-            logging.error(
-                f"Invalid password attempt: {pwd} | Reason: {e.errors()[0]['msg']}"
+            audit_password_validation(
+                False, reason=e.errors()[0]["msg"], length=len(pwd)
             )
@@ -3,6 +3,8 @@ import string
 from pydantic import ValidationError, BaseModel, Field, field_validator
 from typing import Optional, Annotated
 
+from .password_policy import REGEX_POLICY, PasswordViolation
+
 SPECIAL_CHARS = re.escape(string.punctuation)
 """
 Escaped string of punctuation characters used to define the allowed
@@ -65,8 +67,12 @@ class User(BaseModel):
 
         The validation process ensures that the password:
         - Is a non-empty string
-        - Meets the defined complexity requirements using a regex-based policy
+        - Meets the complexity requirements of :data:`PASSWORD_REGEX`,
+          checked in a single pass by the compiled ``REGEX_POLICY``, which
+          uses the same character classes
         - Contains no whitespace characters
+        - Is not a known breached password, when a breach filter is in
+          use (see :func:`~myutils.auth.breach_filter.use_breach_filter`)
 
         Args:
             pwd (str): The password provided by the user.
@@ -81,12 +87,15 @@ class User(BaseModel):
         if not pwd:
             raise ValueError("Password must be a valid string")
 
-        if not PASSWORD_REGEX.match(pwd):
+        violations = REGEX_POLICY.check(pwd)
+        if violations & ~PasswordViolation.BREACHED:
             raise ValueError(
                 "Password must contain at least one uppercase letter, "
                 "one lowercase letter, one digit, one special character, "
                 "must not contain whitespace, and be 8–128 characters long."
             )
+        if violations:
+            raise ValueError(REGEX_POLICY.message(violations))
 
         return pwd
 
@@ -100,9 +109,9 @@ if __name__ == "__main__":
         "QwErTy12!",
     ]
 
-for pwd in passwords:
-    try:
-        user = User(password=pwd)
-        print(f"Valid Password: {user.password}")
-    except ValidationError as e:
-        print(f"Invalid Password: {pwd} | {e.errors()[0]['msg']}")
+    for pwd in passwords:
+        try:
+            user = User(password=pwd)
+            print(f"Valid Password: {user.password}")
+        except ValidationError as e:
+            print(f"Invalid Password: {pwd} | {e.errors()[0]['msg']}")
@@ -0,0 +1,332 @@
+"""
+Brute-force and credential-stuffing protection for logins.
+
+:class:`LoginThrottle` limits login attempts per username and per source
+(an IP address, a client id, ...). Each key has a sliding-window counter
+(the previous and current fixed windows, weighted by how far the current
+one has run), so every check is O(1) and each key costs a few fields,
+however many attempts it sees. A key that reaches its limit is locked
+out for a while.
+
+Tracked keys are dropped once idle, so a stuffing attack that tries
+millions of usernames does not grow memory without bound. Expiry is
+driven by a hierarchical :class:`TimerWheel`: scheduling and firing are
+O(1), and an entry that was used again since it was scheduled is simply
+rescheduled when its timer fires, so checks never touch the wheel.
+"""
+
+import math
+import time
+from typing import Callable, Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+DEFAULT_WINDOW = 900.0
+"""Seconds over which attempts are counted."""
+
+DEFAULT_LOCKOUT = 300.0
+"""Seconds a key stays locked after reaching its limit."""
+
+DEFAULT_USER_ATTEMPTS = 3
+"""Attempts per username and window, as the login demo's max_attempts."""
+
+DEFAULT_SOURCE_ATTEMPTS = 100
+"""Attempts per source and window, across all usernames."""
+
+
+class TimerWheel:
+    """
+    Hierarchical timing wheel.
+
+    Level 0 has one slot per tick; each level above covers ``slots`` times
+    the span of the one below. An item sits at the lowest level that can
+    tell its tick apart from the current one, and moves down a level each
+    time the level below wraps around, so scheduling is O(1) and each item
+    is moved at most ``levels`` times before it fires. Items further away
+    than the wheel spans are parked at the top and placed again later.
+
+    Args:
+        resolution (float): Seconds per tick; timers fire up to one tick
+            late.
+        slot_bits (int): log2 of the slots per level.
+        levels (int): Number of levels. The defaults span 2**24 ticks,
+            about 194 days at one tick per second.
+        now (float): Current time.
+    """
+
+    def __init__(
+        self,
+        resolution: float = 1.0,
+        slot_bits: int = 6,
+        levels: int = 4,
+        now: float = 0.0,
+    ):
+        self.resolution = resolution
+        self._bits = slot_bits
+        self._mask = (1 << slot_bits) - 1
+        self._wheels: List[List[list]] = [
+            [[] for _ in range(1 << slot_bits)] for _ in range(levels)
+        ]
+        self._tick = int(now // resolution)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _place(self, tick: int, when: float, item) -> None:
+        current = self._tick
+        bits = self._bits
+        top = len(self._wheels) - 1
+        for level in range(top):
+            shift = bits * (level + 1)
+            if tick >> shift == current >> shift:
+                index = (tick >> (bits * level)) & self._mask
+                self._wheels[level][index].append((when, item))
+                return
+        shift = bits * top
+        if (tick >> shift) - (current >> shift) > self._mask:
+            # Beyond the wheel's span: park in the slot that cascades last.
+            tick = current
+        self._wheels[top][(tick >> shift) & self._mask].append((when, item))
+
+    def schedule(self, when: float, item) -> None:
+        """
+        Fire ``item`` once the time reaches ``when``.
+
+        Args:
+            when (float): Absolute time, in the units of ``now``.
+            item: Anything; returned by :meth:`advance` when due.
+        """
+        tick = max(math.ceil(when / self.resolution), self._tick + 1)
+        self._place(tick, when, item)
+        self._count += 1
+
+    def advance(self, now: float) -> List[Tuple[float, Hashable]]:
+        """
+        Move the wheel to ``now``.
+
+        Returns:
+            list: ``(when, item)`` for every timer that came due.
+        """
+        target = int(now // self.resolution)
+        if target <= self._tick:
+            return []
+        if not self._count:
+            self._tick = target
+            return []
+
+        due = []
+        bits, mask, wheels = self._bits, self._mask, self._wheels
+        while self._tick < target:
+            self._tick = tick = self._tick + 1
+            # Cascade from the highest level that wrapped down to level 1,
+            # so items fall through several levels within one tick.
+            level = 1
+            while level < len(wheels) and not tick & ((1 << (bits * level)) - 1):
+                level += 1
+            for cascade in range(level - 1, 0, -1):
+                slot = wheels[cascade][(tick >> (bits * cascade)) & mask]
+                if slot:
+                    items = slot[:]
+                    slot.clear()
+                    for when, item in items:
+                        self._place(
+                            max(math.ceil(when / self.resolution), tick), when, item
+                        )
+
+            slot = wheels[0][tick & mask]
+            if slot:
+                due.extend(slot)
+                self._count -= len(slot)
+                slot.clear()
+        return due
+
+
+class ThrottleDecision(NamedTuple):
+    """Result of :meth:`LoginThrottle.attempt`."""
+
+    allowed: bool
+    remaining: int
+    """Attempts left before a lockout, counting this one as used."""
+    retry_after: float
+    """Seconds until attempts are accepted again; 0 when allowed."""
+
+
+class _Counter:
+    """Sliding-window attempt counter of one key."""
+
+    __slots__ = (
+        "start", "current", "previous", "locked_until", "last_seen", "expiry",
+    )  # fmt: skip
+
+    def __init__(self, now: float):
+        self.start = now
+        self.current = 0
+        self.previous = 0
+        self.locked_until = 0.0
+        self.last_seen = now
+        self.expiry = 0.0
+
+    def roll(self, now: float, window: float) -> None:
+        """Move the windows forward so that ``now`` is in the current one."""
+        elapsed = now - self.start
+        if elapsed >= window:
+            if elapsed >= 2 * window:
+                self.previous = 0
+            else:
+                self.previous = self.current
+            self.current = 0
+            self.start += (elapsed // window) * window
+
+    def estimate(self, now: float, window: float) -> float:
+        """Return the attempt count over the window ending at ``now``."""
+        self.roll(now, window)
+        return self.previous * (1 - (now - self.start) / window) + self.current
+
+
+class LoginThrottle:
+    """
+    Per-username and per-source attempt limits with lockout.
+
+    Call :meth:`attempt` before checking a password and
+    :meth:`succeeded` after a successful login. An attempt counts as a
+    failure until it is reported as a success, so concurrent attempts
+    cannot exceed the limits.
+
+    Args:
+        user_attempts (int): Attempts per username and window.
+        source_attempts (int): Attempts per source and window.
+        window (float): Seconds over which attempts are counted.
+        lockout (float): Seconds a key stays locked after reaching its
+            limit; it then starts afresh.
+        idle_timeout (float | None): Seconds after which an unused key is
+            forgotten; defaults to the longest time its state matters.
+        clock (Callable[[], float]): Monotonic time source.
+    """
+
+    def __init__(
+        self,
+        user_attempts: int = DEFAULT_USER_ATTEMPTS,
+        source_attempts: int = DEFAULT_SOURCE_ATTEMPTS,
+        window: float = DEFAULT_WINDOW,
+        lockout: float = DEFAULT_LOCKOUT,
+        idle_timeout: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if user_attempts < 1 or source_attempts < 1:
+            raise ValueError("Attempt limits must be at least 1")
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.user_attempts = user_attempts
+        self.source_attempts = source_attempts
+        self.window = window
+        self.lockout = lockout
+        self.idle_timeout = (
+            max(2 * window, lockout) if idle_timeout is None else idle_timeout
+        )
+        self.clock = clock
+        self._counters: Dict[str, _Counter] = {}
+        self._wheel = TimerWheel(
+            resolution=max(self.idle_timeout / 64, 1e-3), now=clock()
+        )
+
+    def __len__(self) -> int:
+        """Number of usernames and sources currently tracked."""
+        return len(self._counters)
+
+    def _expire(self, now: float) -> None:
+        counters = self._counters
+        for when, key in self._wheel.advance(now):
+            counter = counters.get(key)
+            if counter is None or counter.expiry != when:
+                continue
+            idle_until = max(
+                counter.last_seen + self.idle_timeout, counter.locked_until
+            )
+            if idle_until <= now:
+                del counters[key]
+            else:
+                counter.expiry = idle_until
+                self._wheel.schedule(idle_until, key)
+
+    def _counter(self, key: str, now: float) -> _Counter:
+        counter = self._counters.get(key)
+        if counter is None:
+            counter = self._counters[key] = _Counter(now)
+            counter.expiry = now + self.idle_timeout
+            self._wheel.schedule(counter.expiry, key)
+        return counter
+
+    def _count(self, counter: _Counter, now: float, limit: int) -> int:
+        """Count one attempt; return attempts left, locking at zero."""
+        counter.last_seen = now
+        # Roll first, so the attempt lands in the window it was made in.
+        counter.roll(now, self.window)
+        counter.current += 1
+        remaining = limit - math.ceil(counter.estimate(now, self.window))
+        if remaining <= 0:
+            counter.locked_until = now + self.lockout
+            counter.current = counter.previous = 0
+            remaining = 0
+        return remaining
+
+    def attempt(self, username: str, source: Optional[str] = None) -> ThrottleDecision:
+        """
+        Ask to check a password for ``username`` from ``source``.
+
+        The attempt is counted if allowed. The attempt that reaches a limit
+        is still allowed, and locks the key for later ones.
+
+        Args:
+            username (str): Username being logged in to.
+            source (str | None): Where the attempt comes from; None skips
+                the per-source limit.
+
+        Returns:
+            ThrottleDecision: Whether to go ahead, and when to retry if not.
+        """
+        now = self.clock()
+        self._expire(now)
+
+        user = self._counter("u:" + username, now)
+        locked_until = user.locked_until
+        if source is not None:
+            by_source = self._counter("s:" + source, now)
+            locked_until = max(locked_until, by_source.locked_until)
+        if locked_until > now:
+            user.last_seen = now
+            return ThrottleDecision(False, 0, locked_until - now)
+
+        remaining = self._count(user, now, self.user_attempts)
+        if source is not None:
+            remaining = min(
+                remaining, self._count(by_source, now, self.source_attempts)
+            )
+        return ThrottleDecision(True, remaining, 0.0)
+
+    def succeeded(self, username: str, source: Optional[str] = None) -> None:
+        """
+        Report a successful login: clear the username's failures and lock,
+        and stop counting the attempt against its source.
+        """
+        user = self._counters.get("u:" + username)
+        if user is not None:
+            user.current = user.previous = 0
+            user.locked_until = 0.0
+        if source is not None:
+            counter = self._counters.get("s:" + source)
+            if counter is not None:
+                # The attempt may have rolled into the previous window.
+                counter.roll(self.clock(), self.window)
+                if counter.current:
+                    counter.current -= 1
+                elif counter.previous:
+                    counter.previous -= 1
+
+    def retry_after(self, username: str, source: Optional[str] = None) -> float:
+        """Return seconds until ``username`` may try again (0 if it may now)."""
+        keys = ["u:" + username] if source is None else ["u:" + username, "s:" + source]
+        counters = [self._counters.get(key) for key in keys]
+        locked_until = max(
+            (counter.locked_until for counter in counters if counter is not None),
+            default=0.0,
+        )
+        return max(0.0, locked_until - self.clock())
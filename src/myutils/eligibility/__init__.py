@@ -1,4 +1,17 @@
-from .eligibilty_check import irctc_age_checker
-from .grading_system import calculate_grade
+from .._lazy import attach
 
-__all__ = ["irctc_age_checker", "calculate_grade"]
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "irctc_age_checker": ".eligibilty_check",
+        "AgeCategory": ".eligibilty_check",
+        "classify_age": ".eligibilty_check",
+        "classify_ages": ".eligibilty_check",
+        "classify_manifest": ".eligibilty_check",
+        "count_manifest": ".eligibilty_check",
+        "calculate_grade": ".grading_system",
+        "calculate_grades": ".grading_system",
+        "GradingScheme": ".grading_system",
+        "GradeStatistics": ".grade_stats",
+    },
+)
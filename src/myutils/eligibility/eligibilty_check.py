@@ -1,24 +1,204 @@
-def irctc_age_checker(age: int):
+import csv
+from enum import IntEnum
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, List, Mapping, NamedTuple, Union
+
+import numpy as np
+
+from ..rules import Interval, compile_table
+
+
+class AgeCategory(IntEnum):
+    """IRCTC passenger category by age."""
+
+    INVALID = -1
+    INFANT = 0
+    CHILD = 1
+    ADULT = 2
+    SENIOR = 3
+
+
+AGE_MESSAGES = {
+    AgeCategory.INVALID: "Invalid age entered.",
+    AgeCategory.INFANT: "Berth not allotted explicitly. Do you want to book?",
+    AgeCategory.CHILD: "Eligible to book a partial ticket.",
+    AgeCategory.ADULT: "Eligible for full ticket without concession.",
+    AgeCategory.SENIOR: "Eligible for 50% concession on ticket fare.",
+}
+"""Message shown by :func:`irctc_age_checker` for every category."""
+
+FARE_MULTIPLIERS = {
+    AgeCategory.INVALID: float("nan"),
+    AgeCategory.INFANT: 0.0,
+    AgeCategory.CHILD: 0.5,
+    AgeCategory.ADULT: 1.0,
+    AgeCategory.SENIOR: 0.5,
+}
+"""Share of the full fare paid by each category (NaN for invalid ages)."""
+
+AGE_TABLE = compile_table(
+    [
+        Interval(0, AgeCategory.INFANT),
+        Interval(5, AgeCategory.CHILD, lower_inclusive=False),
+        Interval(10, AgeCategory.ADULT, lower_inclusive=False),
+        Interval(60, AgeCategory.SENIOR),
+    ],
+    default=AgeCategory.INVALID,
+)
+"""Compiled interval table mapping an age in years to its AgeCategory."""
+
+_FARE_TABLE = np.array([FARE_MULTIPLIERS[category] for category in AgeCategory])
+_CATEGORY_COUNT = len(AgeCategory)
+
+
+def classify_age(age: float) -> AgeCategory:
+    """
+    Classify a passenger by age for IRCTC booking.
+
+    :param age: Age of the passenger in years
+    :return: The passenger's AgeCategory
+    """
+    return AGE_TABLE.lookup(age)
+
+
+def irctc_age_checker(age: int) -> AgeCategory:
     """
     Checks age-based eligibility for booking train tickets on IRCTC.
 
     :param age: Age of the passenger in years
+    :return: The passenger's AgeCategory (the message is also printed)
+    """
+    category = classify_age(age)
+    print(AGE_MESSAGES[category])
+    return category
+
+
+def classify_ages(ages) -> np.ndarray:
+    """
+    Classify a whole array of ages in one vectorized pass.
+
+    :param ages: Array-like of ages in years; NaN marks a missing age
+    :return: ``int8`` array of AgeCategory codes (INVALID for negative or
+        missing ages)
     """
-    if age < 0:
-        print("Invalid age entered.")
+    return AGE_TABLE.lookup_many(ages, dtype=np.int8)
+
+
+class ManifestChunk(NamedTuple):
+    """
+    Classification of one chunk of a passenger manifest.
+
+    Attributes:
+        category (np.ndarray): ``int8`` AgeCategory code per passenger.
+        fare_multiplier (np.ndarray): Share of the full fare per
+            passenger, NaN for invalid ages.
+        counts (np.ndarray): Passengers per category in this chunk,
+            indexed by ``code + 1`` (INVALID first).
+    """
+
+    category: np.ndarray
+    fare_multiplier: np.ndarray
+    counts: np.ndarray
+
+
+def classify_passengers(ages) -> ManifestChunk:
+    """
+    Classify an array of ages and compute fare multipliers and counts.
+
+    :param ages: Array-like of ages in years
+    :return: ManifestChunk for the given ages
+    """
+    category = classify_ages(ages)
+    index = category.astype(np.intp) + 1
+    return ManifestChunk(
+        category,
+        _FARE_TABLE[index],
+        np.bincount(index, minlength=_CATEGORY_COUNT),
+    )
+
+
+def _parse_ages(values: List) -> np.ndarray:
+    """Convert manifest fields to floats, using NaN for unparsable ones."""
+    try:
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        parsed = np.empty(len(values))
+        for i, value in enumerate(values):
+            try:
+                parsed[i] = float(value)
+            except (TypeError, ValueError):
+                parsed[i] = np.nan
+        return parsed
+
+
+def _manifest_ages(
+    manifest: Union[str, Path, Iterable], age_column: str
+) -> Iterator[object]:
+    """Yield the raw age field of every passenger in a manifest."""
+    if isinstance(manifest, (str, Path)):
+        with Path(manifest).open(newline="", encoding="utf-8") as csv_file:
+            reader = csv.reader(csv_file)
+            header = next(reader, [])
+            try:
+                column = header.index(age_column)
+            except ValueError:
+                raise ValueError("CSV file has missing or invalid headers") from None
+            for row in reader:
+                yield row[column] if len(row) > column else None
         return
 
-    if age <= 5:
-        print("Berth not allotted explicitly. Do you want to book?")
-    elif 5 < age <= 10:
-        print("Eligible to book a partial ticket.")
-    elif age >= 60:
-        print("Eligible for 50% concession on ticket fare.")
-    else:
-        print("Eligible for full ticket without concession.")
+    for record in manifest:
+        yield record.get(age_column) if isinstance(record, Mapping) else record
+
+
+def classify_manifest(
+    manifest: Union[str, Path, Iterable],
+    age_column: str = "age",
+    chunk_size: int = 1_000_000,
+) -> Iterator[ManifestChunk]:
+    """
+    Stream the classification of a passenger manifest, chunk by chunk.
+
+    Only ``chunk_size`` passengers are held in memory at once, so
+    manifests of any length can be processed.
+
+    :param manifest: Path to a CSV file with a header row, or an iterable
+        of records (mappings with an ``age_column`` key, or bare ages)
+    :param age_column: Name of the age column or key
+    :param chunk_size: Number of passengers per yielded chunk
+    :return: Iterator of ManifestChunk results, in manifest order
+    """
+    ages = _manifest_ages(manifest, age_column)
+    while True:
+        chunk = list(islice(ages, chunk_size))
+        if not chunk:
+            return
+        yield classify_passengers(_parse_ages(chunk))
+
+
+def count_manifest(
+    manifest: Union[str, Path, Iterable],
+    age_column: str = "age",
+    chunk_size: int = 1_000_000,
+) -> dict:
+    """
+    Count the passengers of a manifest per category.
+
+    :param manifest: CSV path or iterable of records, as for
+        :func:`classify_manifest`
+    :param age_column: Name of the age column or key
+    :param chunk_size: Number of passengers classified per step
+    :return: Mapping of AgeCategory to passenger count
+    """
+    counts = np.zeros(_CATEGORY_COUNT, dtype=np.int64)
+    for chunk in classify_manifest(manifest, age_column, chunk_size):
+        counts += chunk.counts
+    return dict(zip(AgeCategory, counts.tolist()))
 
 
-irctc_age_checker(3)
-irctc_age_checker(8)
-irctc_age_checker(65)
-irctc_age_checker(30)
+if __name__ == "__main__":
+    irctc_age_checker(3)
+    irctc_age_checker(8)
+    irctc_age_checker(65)
+    irctc_age_checker(30)
@@ -0,0 +1,261 @@
+"""
+Constant-memory cohort statistics for marks.
+
+Marks are folded into fixed-size histograms per group (school, subject,
+...), so memory is O(groups) however many marks are consumed, and
+percentiles are exact at the histogram resolution. Aggregates built in
+separate processes can be combined with :meth:`GradeStatistics.merge`.
+"""
+
+from itertools import islice
+from typing import Dict, Hashable, Iterable, Optional, Tuple
+
+import numpy as np
+
+from .grading_system import CBSE_SCHEME, GradingScheme
+
+CHUNK_SIZE = 1 << 16
+"""Number of records taken from a stream per vectorized step."""
+
+
+class GroupStats:
+    """
+    Running statistics of one group of marks.
+
+    :param scheme: Grading scheme the marks are graded with
+    :param bins_per_mark: Histogram bins per mark; marks are rounded to
+        the nearest ``1 / bins_per_mark`` for percentiles
+    """
+
+    def __init__(self, scheme: GradingScheme, bins_per_mark: int = 1):
+        self.scheme = scheme
+        self.bins_per_mark = bins_per_mark
+        size = int(round((scheme.max_marks - scheme.min_marks) * bins_per_mark)) + 1
+        self.histogram = np.zeros(size, dtype=np.int64)
+        self.grade_counts = np.zeros(len(scheme.bands), dtype=np.int64)
+        self.invalid = 0
+        self.marks_sum = 0.0
+        self.points_sum = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"GroupStats(count={self.count}, mean_marks={self.mean_marks}, "
+            f"pass_rate={self.pass_rate}, invalid={self.invalid})"
+        )
+
+    @property
+    def count(self) -> int:
+        """Number of valid marks seen."""
+        return int(self.grade_counts.sum())
+
+    @property
+    def mean_marks(self) -> Optional[float]:
+        """Average of the valid marks, or None if there are none."""
+        return self.marks_sum / self.count if self.count else None
+
+    @property
+    def mean_grade_point(self) -> Optional[float]:
+        """Average grade point, or None if there are no valid marks."""
+        return self.points_sum / self.count if self.count else None
+
+    @property
+    def pass_rate(self) -> Optional[float]:
+        """Share of valid marks above the lowest (failing) band."""
+        return 1 - int(self.grade_counts[0]) / self.count if self.count else None
+
+    def grade_distribution(self) -> Dict[str, int]:
+        """Return the number of marks per grade, lowest grade first."""
+        return dict(zip(self.scheme.grades, self.grade_counts.tolist()))
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Return the nearest-rank percentile of the valid marks.
+
+        This is the smallest mark such that at least ``q`` percent of the
+        marks are less than or equal to it.
+
+        :param q: Percentile between 0 and 100
+        :return: The mark, or None if there are no valid marks
+        """
+        if not 0 <= q <= 100:
+            raise ValueError("Percentile must be between 0 and 100")
+        if not self.count:
+            return None
+
+        rank = max(int(np.ceil(q / 100 * self.count)), 1)
+        index = int(np.searchsorted(np.cumsum(self.histogram), rank))
+        return self.scheme.min_marks + index / self.bins_per_mark
+
+    def merge(self, other: "GroupStats") -> "GroupStats":
+        """
+        Add the statistics of another part of the same group.
+
+        :param other: Statistics built with the same scheme and resolution
+        :return: self, updated in place
+        """
+        if (
+            other.scheme.bands != self.scheme.bands
+            or other.bins_per_mark != self.bins_per_mark
+            or len(other.histogram) != len(self.histogram)
+        ):
+            raise ValueError("Cannot merge statistics of different schemes")
+        self.histogram += other.histogram
+        self.grade_counts += other.grade_counts
+        self.invalid += other.invalid
+        self.marks_sum += other.marks_sum
+        self.points_sum += other.points_sum
+        return self
+
+
+class GradeStatistics:
+    """
+    Per-group grade statistics over a stream of marks.
+
+    Marks can be fed as NumPy chunks with :meth:`update` or as a stream of
+    ``(group, marks)`` records with :meth:`consume`. Each chunk is graded
+    in one vectorized pass and scattered into the group histograms with
+    ``bincount``. Instances are picklable, so workers can aggregate their
+    share of the data and the parent can :meth:`merge` the results.
+
+    :param scheme: Grading scheme to apply
+    :param bins_per_mark: Histogram bins per mark (1 gives exact
+        percentiles for whole marks, 2 for half marks, ...)
+    """
+
+    def __init__(
+        self, scheme: GradingScheme = CBSE_SCHEME, bins_per_mark: int = 1
+    ):
+        if bins_per_mark < 1:
+            raise ValueError("bins_per_mark must be a positive integer")
+        self.scheme = scheme
+        self.bins_per_mark = bins_per_mark
+        self.groups: Dict[Hashable, GroupStats] = {}
+
+    def __getitem__(self, group: Hashable) -> GroupStats:
+        return self.groups[group]
+
+    def __iter__(self):
+        return iter(self.groups)
+
+    def __len__(self) -> int:
+        return len(self.groups)
+
+    def _group(self, group: Hashable) -> GroupStats:
+        stats = self.groups.get(group)
+        if stats is None:
+            stats = self.groups[group] = GroupStats(self.scheme, self.bins_per_mark)
+        return stats
+
+    def update(self, marks, groups=None) -> "GradeStatistics":
+        """
+        Fold a chunk of marks into the statistics.
+
+        :param marks: Array-like of marks
+        :param groups: A single group key for the whole chunk, or an
+            array-like of keys parallel to ``marks``; None uses the
+            ``None`` group
+        :return: self, so calls can be chained
+        """
+        marks = np.asarray(marks, dtype=np.float64).ravel()
+        if not marks.size:
+            return self
+
+        if groups is None or np.ndim(groups) == 0:
+            keys, inverse = [groups], np.zeros(marks.size, dtype=np.intp)
+        else:
+            keys, inverse = np.unique(np.asarray(groups), return_inverse=True)
+            keys, inverse = keys.tolist(), inverse.ravel()
+            if inverse.size != marks.size:
+                raise ValueError("marks and groups must have the same length")
+
+        self._update_indexed(marks, keys, inverse)
+        return self
+
+    def _update_indexed(self, marks: np.ndarray, keys: list, inverse: np.ndarray):
+        """Fold ``marks`` in, where ``keys[inverse[i]]`` owns ``marks[i]``."""
+        batch = self.scheme.grade_many(marks)
+        valid = batch.valid
+        owners = inverse[valid]
+        codes = batch.codes[valid].astype(np.intp)
+        bins = np.rint(
+            (marks[valid] - self.scheme.min_marks) * self.bins_per_mark
+        ).astype(np.intp)
+
+        n_keys = len(keys)
+        stats = [self._group(key) for key in keys]
+        n_bins = len(stats[0].histogram)
+        n_grades = len(self.scheme.bands)
+
+        histograms = np.bincount(
+            owners * n_bins + bins, minlength=n_keys * n_bins
+        ).reshape(n_keys, n_bins)
+        grade_counts = np.bincount(
+            owners * n_grades + codes, minlength=n_keys * n_grades
+        ).reshape(n_keys, n_grades)
+        invalid = np.bincount(inverse[~valid], minlength=n_keys)
+        marks_sums = np.bincount(owners, weights=marks[valid], minlength=n_keys)
+        points_sums = np.bincount(
+            owners, weights=batch.points[valid], minlength=n_keys
+        )
+
+        for i, group in enumerate(stats):
+            group.histogram += histograms[i]
+            group.grade_counts += grade_counts[i]
+            group.invalid += int(invalid[i])
+            group.marks_sum += float(marks_sums[i])
+            group.points_sum += float(points_sums[i])
+
+    def consume(
+        self, records: Iterable[Tuple[Hashable, float]], chunk_size: int = CHUNK_SIZE
+    ) -> "GradeStatistics":
+        """
+        Fold a stream of ``(group, marks)`` records into the statistics.
+
+        Only ``chunk_size`` records are held in memory at a time.
+
+        :param records: Iterable of ``(group, marks)`` pairs
+        :param chunk_size: Records per vectorized step
+        :return: self, so calls can be chained
+        """
+        iterator = iter(records)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return self
+            groups, marks = zip(*chunk)
+            keys = list(dict.fromkeys(groups))
+            index = {key: i for i, key in enumerate(keys)}
+            codes = np.fromiter((index[g] for g in groups), np.intp, len(groups))
+            self._update_indexed(np.asarray(marks, dtype=np.float64), keys, codes)
+
+    def merge(self, other: "GradeStatistics") -> "GradeStatistics":
+        """
+        Add the statistics gathered by another aggregator.
+
+        :param other: Aggregator built with the same scheme and resolution
+        :return: self, updated in place
+        """
+        for key, stats in other.groups.items():
+            self._group(key).merge(stats)
+        return self
+
+    def summary(self) -> Dict[Hashable, dict]:
+        """
+        Return the headline statistics of every group.
+
+        :return: Mapping of group to a dict with the count, invalid count,
+            mean marks, mean grade point, pass rate, median and grade
+            distribution
+        """
+        return {
+            key: {
+                "count": stats.count,
+                "invalid": stats.invalid,
+                "mean_marks": stats.mean_marks,
+                "mean_grade_point": stats.mean_grade_point,
+                "pass_rate": stats.pass_rate,
+                "median": stats.percentile(50),
+                "grades": stats.grade_distribution(),
+            }
+            for key, stats in self.groups.items()
+        }
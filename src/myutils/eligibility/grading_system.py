@@ -1,55 +1,169 @@
-def calculate_grade(marks: int) -> dict:
+import json
+from pathlib import Path
+from types import MappingProxyType
+from typing import Iterable, Mapping, NamedTuple, Union
+
+import numpy as np
+
+from ..rules import compile_table
+
+
+class GradeBand(NamedTuple):
     """
-    Returns grade, grading point, and remark based on marks.
+    One row of a grading scheme.
 
-    :param marks: Marks obtained by the student (0-100)
-    :return: Dictionary containing grade, grading point, and remark
+    Attributes:
+        min_marks (float): Lowest mark that earns this grade.
+        grade (str): Grade label, e.g. "A1".
+        grading_point (float): Grade point awarded.
+        remark (str): Remark shown with the grade.
     """
-    if marks < 0 or marks > 100:
-        return {"error": "Invalid marks. Please enter a value between 0 and 100."}
 
-    grades = {}
+    min_marks: float
+    grade: str
+    grading_point: float
+    remark: str
 
-    if marks >= 91:
-        grades.update(
-            {"grade": "A1", "grading_point": 10.0, "remark": "Outstanding performance!"}
-        )
-    elif marks >= 81:
-        grades.update(
-            {"grade": "A2", "grading_point": 9.0, "remark": "Excellent performance!"}
-        )
-    elif marks >= 71:
-        grades.update(
-            {"grade": "B1", "grading_point": 8.0, "remark": "Very good performance"}
-        )
-    elif marks >= 61:
-        grades.update(
-            {"grade": "B2", "grading_point": 7.0, "remark": "Good performance"}
-        )
-    elif marks >= 51:
-        grades.update(
-            {"grade": "C1", "grading_point": 6.0, "remark": "Fair performance"}
-        )
-    elif marks >= 41:
-        grades.update(
-            {"grade": "C2", "grading_point": 5.0, "remark": "Average performance"}
+
+class GradeBatch(NamedTuple):
+    """
+    Grades for a batch of marks.
+
+    Attributes:
+        codes (np.ndarray): ``int8`` index into the scheme's bands (lowest
+            band first), or -1 for invalid marks.
+        points (np.ndarray): Grade points, NaN for invalid marks.
+        valid (np.ndarray): False where the marks are out of range.
+    """
+
+    codes: np.ndarray
+    points: np.ndarray
+    valid: np.ndarray
+
+
+class GradingScheme:
+    """
+    A table-driven grading scheme.
+
+    Bands are compiled into a :mod:`myutils.rules` interval table, so a
+    grade is an O(log k) lookup over the band thresholds. Results are
+    shared, read-only mappings, so grading never builds a new dict per
+    call.
+
+    :param bands: GradeBand rows (or equivalent tuples/dicts) in any order
+    :param max_marks: Highest valid mark
+    """
+
+    def __init__(
+        self, bands: Iterable[Union[GradeBand, tuple, dict]], max_marks: float = 100
+    ):
+        rows = [
+            GradeBand(**band) if isinstance(band, dict) else GradeBand(*band)
+            for band in bands
+        ]
+        if not rows:
+            raise ValueError("A grading scheme needs at least one band")
+
+        self.bands = tuple(sorted(rows, key=lambda band: band.min_marks))
+        self.min_marks = self.bands[0].min_marks
+        self.max_marks = max_marks
+        self.grades = tuple(band.grade for band in self.bands)
+
+        self.records = tuple(
+            MappingProxyType(
+                {
+                    "grade": band.grade,
+                    "grading_point": band.grading_point,
+                    "remark": band.remark,
+                }
+            )
+            for band in self.bands
         )
-    elif marks >= 33:
-        grades.update(
+        self.invalid_record = MappingProxyType(
             {
-                "grade": "D",
-                "grading_point": 4.0,
-                "remark": "Below Average / Marginal Pass",
+                "error": f"Invalid marks. Please enter a value between "
+                f"{self.min_marks:g} and {self.max_marks:g}."
             }
         )
-    else:  # marks < 33
-        grades.update(
-            {"grade": "E2", "grading_point": 0.0, "remark": "Needs Improvement (Fail)"}
+
+        self.table = compile_table(
+            ((band.min_marks, band.grade) for band in self.bands), upper=max_marks
+        )
+        self._points = np.array(
+            [band.grading_point for band in self.bands], dtype=np.float64
         )
 
-    return grades
+    def __reduce__(self):
+        # The read-only records cannot be pickled; rebuild them from the bands.
+        return type(self), (self.bands, self.max_marks)
+
+    @classmethod
+    def from_json(cls, path: Union[str, Path]) -> "GradingScheme":
+        """
+        Load a scheme from a JSON file.
+
+        The file holds ``{"max_marks": 100, "bands": [...]}`` where each
+        band is an object with the GradeBand fields.
+        """
+        with Path(path).open(encoding="utf-8") as file:
+            data = json.load(file)
+        return cls(data["bands"], data.get("max_marks", 100))
+
+    def grade(self, marks: float) -> Mapping:
+        """Return the shared result record for ``marks``."""
+        index = self.table.index(marks)
+        return self.records[index] if index >= 0 else self.invalid_record
+
+    def grade_many(self, marks) -> GradeBatch:
+        """Grade a whole array of marks at once."""
+        codes = self.table.index_many(marks).astype(np.int8)
+        valid = codes >= 0
+
+        points = self._points[np.where(valid, codes, 0)]
+        points[~valid] = np.nan
+        return GradeBatch(codes, points, valid)
+
+
+CBSE_SCHEME = GradingScheme(
+    [
+        GradeBand(0, "E2", 0.0, "Needs Improvement (Fail)"),
+        GradeBand(33, "D", 4.0, "Below Average / Marginal Pass"),
+        GradeBand(41, "C2", 5.0, "Average performance"),
+        GradeBand(51, "C1", 6.0, "Fair performance"),
+        GradeBand(61, "B2", 7.0, "Good performance"),
+        GradeBand(71, "B1", 8.0, "Very good performance"),
+        GradeBand(81, "A2", 9.0, "Excellent performance!"),
+        GradeBand(91, "A1", 10.0, "Outstanding performance!"),
+    ]
+)
+"""The default nine-point grading scheme used by :func:`calculate_grade`."""
+
+
+def calculate_grade(marks: int, scheme: GradingScheme = CBSE_SCHEME) -> Mapping:
+    """
+    Returns grade, grading point, and remark based on marks.
+
+    :param marks: Marks obtained by the student (0-100)
+    :param scheme: Grading scheme to apply
+    :return: Read-only mapping containing grade, grading point, and remark
+        (shared between calls, so it must not be modified)
+    """
+    return scheme.grade(marks)
+
+
+def calculate_grades(marks_array, scheme: GradingScheme = CBSE_SCHEME) -> GradeBatch:
+    """
+    Grade an array of marks in one vectorized pass.
+
+    :param marks_array: Array-like of marks
+    :param scheme: Grading scheme to apply
+    :return: GradeBatch with grade codes (indices into ``scheme.grades``),
+        grade points and a validity mask
+    """
+    return scheme.grade_many(marks_array)
 
 
-print(calculate_grade(87))
-print(calculate_grade(29))
-print(calculate_grade(105))  # Invalid marks
+if __name__ == "__main__":
+    print(calculate_grade(87))
+    print(calculate_grade(29))
+    print(calculate_grade(105))  # Invalid marks
@@ -1,20 +1,39 @@
-from .calc import add, subtract, multiply, divide
-from .adv_calc import power, modulus
-from .bmi import calculate_bmi
-from .prime_checker import isPrime
-from .sum_natural_nums import summation
+from .._lazy import attach
 
-__all__ = [
-    "add",
-    "subtract",
-    "multiply",
-    "divide",
-    "power",
-    "modulus",
-    "calculate_bmi",
-    "isPrime",
-    "summation",
-]
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "add": ".calc",
+        "subtract": ".calc",
+        "multiply": ".calc",
+        "divide": ".calc",
+        "power": ".adv_calc",
+        "modulus": ".adv_calc",
+        "calculate_bmi": ".bmi",
+        "calculate_bmi_batch": ".bmi",
+        "calculate_bmi_csv": ".bmi",
+        "isPrime": ".prime_checker",
+        "is_prime_array": ".prime_checker",
+        "PrimeIndex": ".prime_index",
+        "prime_count": "._prime_count",
+        "prime_sum": "._prime_count",
+        "factorize": "._factorize",
+        "factorize_many": "._factorize",
+        "binom": ".combinatorics",
+        "binom_mod": ".combinatorics",
+        "binom_many": ".combinatorics",
+        "compile_expression": ".expression",
+        "evaluate_expression": ".expression",
+        "RunningExtrema": ".stream_compare",
+        "TopK": ".stream_compare",
+        "compare_many": ".stream_compare",
+        "is_close": ".stream_compare",
+        "summation": ".sum_natural_nums",
+        "power_sum": ".sum_natural_nums",
+        "range_sum": ".sum_natural_nums",
+        "range_sums": ".sum_natural_nums",
+    },
+)
 
 """
 Scripts like:
@@ -0,0 +1,183 @@
+"""
+Integer factorization built on the primality backend.
+
+Small factors are stripped by trial division over a 2*3*5 wheel. The
+remaining cofactor is split with Pollard-Brent rho, and
+:func:`myutils.math_ops.primality.is_prime` stops the recursion as soon
+as a part is prime. Recent results are kept in a bounded LRU cache.
+"""
+
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from math import gcd
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .primality import is_prime
+
+CACHE_SIZE = 4096
+"""Number of factorizations kept in the LRU cache."""
+
+WHEEL_LIMIT = 1 << 12
+"""Trial division bound before switching to Pollard-Brent rho."""
+
+PARALLEL_MIN_BITS = 60
+"""Batches are only spread over processes if they contain numbers this large."""
+
+PARALLEL_MIN_ITEMS = 64
+"""Batches smaller than this are always factored in-process."""
+
+_WHEEL_STEPS = (4, 2, 4, 2, 4, 6, 2, 6)  # gaps between residues coprime to 30, from 7
+
+
+def _pollard_brent(n: int, rng: random.Random) -> int:
+    """Return a non-trivial factor of the odd composite ``n``."""
+    while True:
+        y = rng.randrange(1, n)
+        c = rng.randrange(1, n)
+        m = 128
+        g = r = q = 1
+
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = gcd(q, n)
+                k += m
+            r *= 2
+
+        if g == n:
+            # The batched product overshot; redo the last batch step by step.
+            while True:
+                ys = (ys * ys + c) % n
+                g = gcd(abs(x - ys), n)
+                if g > 1:
+                    break
+
+        if g != n:
+            return g
+
+
+def _split(n: int, factors: List[int], rng: random.Random) -> None:
+    """Append the prime factors of ``n`` (no small factors) to ``factors``."""
+    stack = [n]
+    while stack:
+        m = stack.pop()
+        if m == 1:
+            continue
+        if is_prime(m):
+            factors.append(m)
+            continue
+        d = _pollard_brent(m, rng)
+        stack.extend((d, m // d))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _factor_pairs(n: int) -> Tuple[Tuple[int, int], ...]:
+    """Return the factorization of ``n > 1`` as sorted (prime, exponent) pairs."""
+    factors: List[int] = []
+
+    for p in (2, 3, 5):
+        while n % p == 0:
+            factors.append(p)
+            n //= p
+
+    p = 7
+    step = 0
+    while p <= WHEEL_LIMIT and p * p <= n:
+        while n % p == 0:
+            factors.append(p)
+            n //= p
+        p += _WHEEL_STEPS[step]
+        step = (step + 1) % 8
+
+    if n > 1:
+        if p * p > n:
+            factors.append(n)
+        else:
+            # Seeded per input so repeated calls take the same path.
+            _split(n, factors, random.Random(n))
+
+    counts: Dict[int, int] = {}
+    for factor in sorted(factors):
+        counts[factor] = counts.get(factor, 0) + 1
+    return tuple(counts.items())
+
+
+def factorize(n: int) -> Dict[int, int]:
+    """
+    Return the prime factorization of a positive integer.
+
+    Args:
+        n (int): The number to factor.
+
+    Returns:
+        dict: Mapping of each prime factor to its exponent, in ascending
+        order of primes. ``factorize(1)`` returns an empty dict.
+
+    Raises:
+        ValueError: If ``n`` is not a positive integer.
+    """
+    n = int(n)
+    if n < 1:
+        raise ValueError("Only positive integers can be factorized")
+    if n == 1:
+        return {}
+    return dict(_factor_pairs(n))
+
+
+def factorize_many(
+    ns: Iterable[int],
+    processes: Optional[int] = None,
+    chunksize: int = 16,
+) -> List[Dict[int, int]]:
+    """
+    Factor a batch of positive integers.
+
+    Duplicate inputs are factored once. Large batches of big numbers are
+    spread over a process pool; everything else runs in-process and
+    shares the LRU cache with :func:`factorize`.
+
+    Args:
+        ns (Iterable[int]): Numbers to factor.
+        processes (int, optional): Worker processes to use. ``None``
+            picks automatically, ``1`` forces in-process work.
+        chunksize (int): Numbers sent to a worker per task.
+
+    Returns:
+        list: One factorization dict per input, in input order.
+
+    Raises:
+        ValueError: If any number is not a positive integer.
+    """
+    numbers = [int(n) for n in ns]
+    if any(n < 1 for n in numbers):
+        raise ValueError("Only positive integers can be factorized")
+
+    unique = list(dict.fromkeys(numbers))
+
+    if processes is None:
+        big = sum(1 for n in unique if n.bit_length() >= PARALLEL_MIN_BITS)
+        processes = (os.cpu_count() or 1) if big >= PARALLEL_MIN_ITEMS else 1
+
+    if processes > 1 and len(unique) > 1:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            results = dict(
+                zip(unique, pool.map(factorize, unique, chunksize=chunksize))
+            )
+    else:
+        results = {n: factorize(n) for n in unique}
+
+    return [dict(results[n]) for n in numbers]
+
+
+def clear_factor_cache() -> None:
+    """Empty the LRU cache used by :func:`factorize`."""
+    _factor_pairs.cache_clear()
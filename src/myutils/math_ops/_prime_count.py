@@ -0,0 +1,139 @@
+"""
+Sublinear prime counting and prime summation.
+
+Both functions use Lucy_Hedgehog's dynamic program. It only tracks the
+O(sqrt x) distinct values of ``x // i``, runs in roughly O(x**0.75) time,
+and keeps its tables in NumPy arrays.
+"""
+
+from math import isqrt
+
+import numpy as np
+
+_EXACT_SUM_LIMIT = 2 * 10**9
+"""Largest x whose prime sum fits the int64 tables without wrapping."""
+
+_SPLIT_SUM_LIMIT = 10**15
+"""Largest x whose prime sum is rebuilt from uint64 and float64 tables."""
+
+
+def _lucy(x: int, small: np.ndarray, large: np.ndarray, weighted: bool) -> None:
+    """
+    Run the Lucy_Hedgehog sieve in place.
+
+    ``small[v]`` starts as the count (or sum) of 2..v for ``v <= sqrt(x)``
+    and ``large[i]`` as the same for ``x // i``. When the loop finishes
+    they hold the count (or sum) of the primes instead.
+    """
+    r = isqrt(x)
+    indices = np.arange(r + 1, dtype=np.int64)
+
+    for p in range(2, r + 1):
+        if small[p] == small[p - 1]:
+            continue  # p is composite
+
+        below = small[p - 1]
+        weight = small.dtype.type(p) if weighted else 1
+        p2 = p * p
+        last = min(r, x // p2)
+        direct = min(last, r // p)
+
+        if direct:
+            large[1 : direct + 1] -= weight * (large[p : direct * p + 1 : p] - below)
+        if last > direct:
+            quotients = x // (indices[direct + 1 : last + 1] * p)
+            large[direct + 1 : last + 1] -= weight * (small[quotients] - below)
+        if p2 <= r:
+            small[p2:] -= weight * (small[indices[p2:] // p] - below)
+
+
+def _triangular(values: np.ndarray, dtype) -> np.ndarray:
+    """Return ``v * (v + 1) / 2`` for int64 ``values`` in ``dtype``."""
+    if dtype == np.float64:
+        values = values.astype(np.float64)
+        return values * (values + 1) / 2
+
+    # Halve the even factor first so wrapping uint64 arithmetic stays exact.
+    values = values.astype(dtype)
+    even = values % 2 == 0
+    result = np.where(even, values // 2, values)
+    result *= np.where(even, values + 1, (values + 1) // 2)
+    return result
+
+
+def _tables(x: int, dtype, weighted: bool):
+    """Return the initial ``small`` and ``large`` tables for :func:`_lucy`."""
+    r = isqrt(x)
+    small = np.arange(r + 1, dtype=np.int64)
+    large = np.zeros(r + 1, dtype=np.int64)
+    large[1:] = x // small[1:]
+
+    if weighted:
+        small = _triangular(small, dtype) - 1
+        large = _triangular(large, dtype) - 1
+    else:
+        small = (small - 1).astype(dtype)
+        large = (large - 1).astype(dtype)
+
+    small[0] = large[0] = 0
+    return small, large
+
+
+def prime_count(x: int) -> int:
+    """
+    Return pi(x), the number of primes less than or equal to ``x``.
+
+    Args:
+        x (int): Upper bound of the count.
+
+    Returns:
+        int: Number of primes ``p <= x``.
+    """
+    x = int(x)
+    if x < 2:
+        return 0
+
+    small, large = _tables(x, np.int64, weighted=False)
+    _lucy(x, small, large, weighted=False)
+    return int(large[1])
+
+
+def prime_sum(x: int) -> int:
+    """
+    Return the sum of all primes less than or equal to ``x``.
+
+    The result is exact. Sums that overflow 64 bits are rebuilt from a
+    wrapping ``uint64`` table and a ``float64`` table of the same values,
+    and very large ``x`` fall back to Python integers.
+
+    Args:
+        x (int): Upper bound of the sum.
+
+    Returns:
+        int: Sum of the primes ``p <= x``.
+    """
+    x = int(x)
+    if x < 2:
+        return 0
+
+    if x <= _EXACT_SUM_LIMIT:
+        small, large = _tables(x, np.int64, weighted=True)
+        _lucy(x, small, large, weighted=True)
+        return int(large[1])
+
+    if x <= _SPLIT_SUM_LIMIT:
+        with np.errstate(over="ignore"):
+            small, large = _tables(x, np.uint64, weighted=True)
+            _lucy(x, small, large, weighted=True)
+        wrapped = int(large[1])
+
+        small, large = _tables(x, np.float64, weighted=True)
+        _lucy(x, small, large, weighted=True)
+        approx = int(large[1])
+
+        # The float error is far below 2**63, so it picks the right wrap.
+        return wrapped + (((approx - wrapped) + (1 << 63)) >> 64 << 64)
+
+    small, large = _tables(x, object, weighted=True)
+    _lucy(x, small, large, weighted=True)
+    return int(large[1])
@@ -0,0 +1,123 @@
+"""
+Shared helpers for the array mode of the calculator functions.
+"""
+
+import math
+from typing import Callable
+
+import numpy as np
+
+ZERO_DIVISION_POLICIES = ("raise", "mask", "nan", "index")
+"""
+How division handles zero divisors:
+
+- ``"raise"``: raise ``ValueError`` (the scalar behaviour)
+- ``"mask"``: return a ``numpy.ma.MaskedArray`` masking those elements;
+  for scalar operands, the result or ``numpy.ma.masked``
+- ``"nan"``: return a float array (a float for scalar operands) with NaN
+  in those elements
+- ``"index"``: return ``(result, indices)`` where ``result`` is as for
+  ``"nan"`` and ``indices`` are the flat positions of the zero divisors
+
+Each policy returns the same type whether or not a zero occurs.
+"""
+
+SCALAR_TYPES = (int, float)
+
+
+def is_array_like(value) -> bool:
+    """Return True for NumPy arrays, sequences and buffer-protocol objects."""
+    if isinstance(value, (np.ndarray, np.generic, list, tuple)):
+        return True
+    if isinstance(value, (str, bytes, bytearray)):
+        return False
+    try:
+        memoryview(value)
+    except TypeError:
+        return False
+    return True
+
+
+def apply(ufunc: np.ufunc, scalar_op: Callable, a, b):
+    """Apply ``ufunc`` to array-like operands, otherwise ``scalar_op``."""
+    if is_array_like(a) or is_array_like(b):
+        return ufunc(np.asarray(a), np.asarray(b))
+    return scalar_op(a, b)
+
+
+def check_zero_policy(on_zero: str) -> None:
+    """
+    Raises:
+        ValueError: If ``on_zero`` is not in :data:`ZERO_DIVISION_POLICIES`.
+    """
+    if on_zero not in ZERO_DIVISION_POLICIES:
+        raise ValueError(f"on_zero must be one of {ZERO_DIVISION_POLICIES}")
+
+
+def divide_scalars(scalar_op: Callable, a, b, on_zero: str):
+    """
+    Apply a division-like ``scalar_op`` to plain numbers with the given
+    zero-divisor policy, returning Python scalars as documented in
+    :data:`ZERO_DIVISION_POLICIES`.
+
+    Raises:
+        ValueError: If ``on_zero`` is ``"raise"`` and ``b`` is zero.
+    """
+    zero = b == 0
+    if zero:
+        if on_zero == "raise":
+            raise ValueError("Cannot divide by zero")
+        if on_zero == "mask":
+            return np.ma.masked
+        result = math.nan
+    else:
+        result = scalar_op(a, b)
+        if on_zero in ("raise", "mask"):
+            return result
+        result = float(result)
+
+    if on_zero == "index":
+        return result, np.flatnonzero(zero)
+    return result
+
+
+def divide_arrays(ufunc: np.ufunc, a, b, on_zero: str):
+    """
+    Apply a division-like ``ufunc`` with the given zero-divisor policy.
+
+    Raises:
+        ValueError: If ``on_zero`` is unknown, or is ``"raise"`` and
+            ``b`` contains a zero.
+    """
+    check_zero_policy(on_zero)
+
+    a = np.asarray(a)
+    b = np.asarray(b)
+    zero = b == 0
+
+    if not zero.any():
+        result = ufunc(a, b)
+        if on_zero == "raise":
+            return result
+        if on_zero == "mask":
+            return np.ma.masked_array(result, mask=np.zeros(np.shape(result), bool))
+        result = np.asarray(result, dtype=np.result_type(result, np.float64))
+        if on_zero == "index":
+            return result, np.zeros(0, dtype=np.intp)
+        return result
+
+    if on_zero == "raise":
+        raise ValueError("Cannot divide by zero")
+
+    result = ufunc(a, np.where(zero, 1, b))
+    zero = np.broadcast_to(zero, np.shape(result))
+
+    if on_zero == "mask":
+        return np.ma.masked_array(result, mask=zero)
+
+    result = np.array(result, dtype=np.result_type(result, np.float64))
+    result[zero] = np.nan
+
+    if on_zero == "index":
+        return result, np.flatnonzero(zero)
+    return result
@@ -1,42 +1,55 @@
-def add(a: float, b: float) -> float:
-    """Return the sum of two numbers."""
-    return a + b
+import operator
 
+import numpy as np
 
-def subtract(a: float, b: float) -> float:
-    """Return the difference of two numbers (a - b)."""
-    return a - b
+from ._vectorize import (
+    SCALAR_TYPES,
+    apply,
+    check_zero_policy,
+    divide_arrays,
+    divide_scalars,
+)
+# The four basic operations are shared with the simple calculator.
+from .calc import add, divide, multiply, subtract  # noqa: F401
 
 
-def multiply(a: float, b: float) -> float:
-    """Return the product of two numbers."""
-    return a * b
-
-
-def divide(a: float, b: float) -> float:
-    """
-    Return the quotient of two numbers (a / b).
-
-    Raises:
-        ValueError: If b is zero.
-    """
-    if b == 0:
-        raise ValueError("Cannot divide by zero")
-    return a / b
+def _float_power(base, exponent):
+    """np.power that, like ``**``, allows negative integer exponents."""
+    base = np.asarray(base)
+    exponent = np.asarray(exponent)
+    integral = base.dtype.kind in "iu" and exponent.dtype.kind in "iu"
+    if integral and (exponent < 0).any():
+        base = base.astype(np.float64)
+    return np.power(base, exponent)
 
 
 def power(base: float, exponent: float) -> float:
-    """Return base raised to the power of exponent."""
-    return base**exponent
+    """Return base raised to the power of exponent, element-wise for arrays."""
+    if type(base) in SCALAR_TYPES and type(exponent) in SCALAR_TYPES:
+        return base**exponent
+    return apply(_float_power, operator.pow, base, exponent)
 
 
-def modulus(a: int, b: int) -> int:
+def modulus(a: int, b: int, on_zero: str = "raise") -> int:
     """
-    Return the remainder of a divided by b.
+    Return the remainder of a divided by b, element-wise for arrays.
+
+    Args:
+        a: Dividend (number or array-like).
+        b: Divisor (number or array-like).
+        on_zero (str): What to do with zero divisors: ``"raise"``,
+            ``"mask"``, ``"nan"`` or ``"index"``. See
+            :data:`myutils.math_ops._vectorize.ZERO_DIVISION_POLICIES`.
 
     Raises:
-        ValueError: If b is zero.
+        ValueError: If ``on_zero`` is unknown, or b is zero and
+            ``on_zero`` is ``"raise"``.
     """
-    if b == 0:
+    if type(a) in SCALAR_TYPES and type(b) in SCALAR_TYPES and on_zero == "raise":
+        if b:
+            return a % b
         raise ValueError("Cannot divide by zero")
-    return a % b
+    check_zero_policy(on_zero)
+    if isinstance(a, SCALAR_TYPES) and isinstance(b, SCALAR_TYPES):
+        return divide_scalars(operator.mod, a, b, on_zero)
+    return divide_arrays(np.remainder, a, b, on_zero)
@@ -1,3 +1,64 @@
+import csv
+from itertools import islice
+from pathlib import Path
+from typing import Iterator, List, NamedTuple, Sequence, Union
+
+import numpy as np
+
+from ..rules import compile_table
+
+BMI_THRESHOLDS = (18.5, 25.0, 30.0, 35.0, 40.0)
+"""Lower BMI bound of every category after the first."""
+
+BMI_CATEGORIES = (
+    "Underweight",
+    "Normal weight",
+    "Overweight",
+    "Class 1 - Obese",
+    "Class 2 - Obese",
+    "Class 3 - Obese",
+)
+"""Category labels, indexed by the category codes of the batch API."""
+
+INVALID_CATEGORY = -1
+"""Category code of rows with a missing or non-positive weight or height."""
+
+BMI_TABLE = compile_table(zip((None, *BMI_THRESHOLDS), BMI_CATEGORIES))
+"""Compiled interval table mapping a BMI value to its category label."""
+
+_LABEL_TABLE = np.array(BMI_CATEGORIES, dtype=object)
+
+
+class BMIBatch(NamedTuple):
+    """
+    BMI results for a batch of people.
+
+    Attributes:
+        bmi (np.ndarray): BMI values rounded to one decimal, NaN for
+            invalid rows.
+        category (np.ndarray): ``int8`` index into :data:`BMI_CATEGORIES`,
+            or :data:`INVALID_CATEGORY`.
+        valid (np.ndarray): False for rows whose weight or height is
+            missing or not positive.
+    """
+
+    bmi: np.ndarray
+    category: np.ndarray
+    valid: np.ndarray
+
+    def labels(self) -> np.ndarray:
+        """
+        Return the category label of every row.
+
+        The array holds references to the shared strings in
+        :data:`BMI_CATEGORIES`, so no string is created per row.
+        Invalid rows get None.
+        """
+        labels = _LABEL_TABLE[np.where(self.valid, self.category, 0)]
+        labels[~self.valid] = None
+        return labels
+
+
 def calculate_bmi(weight_kg: float, height_m: float) -> tuple[float, str]:
     """
     Body mass index (BMI) is a screening tool used to estimate body fat based
@@ -11,23 +72,88 @@ def calculate_bmi(weight_kg: float, height_m: float) -> tuple[float, str]:
         raise ValueError("Weight and height must be positive numbers")
 
     bmi = weight_kg / (height_m**2)
-
-    if bmi < 18.5:
-        category = "Underweight"
-    elif bmi < 25.0:
-        category = "Normal weight"
-    elif bmi < 30.0:
-        category = "Overweight"
-    elif bmi < 35.0:
-        category = "Class 1 - Obese"
-    elif bmi < 40.0:
-        category = "Class 2 - Obese"
-    else:
-        category = "Class 3 - Obese"
+    category = BMI_TABLE.lookup(bmi)
 
     return round(bmi, 1), category
 
 
+def calculate_bmi_batch(weights_kg, heights_m) -> BMIBatch:
+    """
+    Compute BMI values and categories for whole arrays of people.
+
+    Invalid rows (missing, NaN or non-positive values) are flagged in
+    the result instead of raising, so one bad row does not stop the batch.
+
+    :param weights_kg: Array-like of weights in kilograms
+    :param heights_m: Array-like of heights in meters
+    :return: BMIBatch with BMI values, category codes and a validity mask
+    """
+    weights = np.asarray(weights_kg, dtype=np.float64)
+    heights = np.asarray(heights_m, dtype=np.float64)
+
+    valid = (weights > 0) & (heights > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bmi = weights / (heights * heights)
+    bmi[~valid] = np.nan
+
+    category = BMI_TABLE.index_many(bmi).astype(np.int8)
+
+    return BMIBatch(np.round(bmi, 1), category, valid)
+
+
+def _parse_floats(values: List[str]) -> np.ndarray:
+    """Convert CSV fields to floats, using NaN for unparsable ones."""
+    try:
+        return np.array(values, dtype=np.float64)
+    except ValueError:
+        parsed = np.empty(len(values))
+        for i, value in enumerate(values):
+            try:
+                parsed[i] = float(value)
+            except ValueError:
+                parsed[i] = np.nan
+        return parsed
+
+
+def calculate_bmi_csv(
+    csv_path: Union[str, Path],
+    weight_column: str = "weight_kg",
+    height_column: str = "height_m",
+    chunk_size: int = 1_000_000,
+) -> Iterator[BMIBatch]:
+    """
+    Stream BMI results for a CSV file, one chunk of rows at a time.
+
+    Only ``chunk_size`` rows are held in memory at once. Rows with
+    missing or malformed values are reported as invalid in their chunk.
+
+    :param csv_path: Path to a CSV file with a header row
+    :param weight_column: Name of the weight column (kilograms)
+    :param height_column: Name of the height column (meters)
+    :param chunk_size: Number of rows per yielded batch
+    :return: Iterator of BMIBatch results, in file order
+    """
+    with Path(csv_path).open(newline="", encoding="utf-8") as csv_file:
+        reader = csv.reader(csv_file)
+        header: Sequence[str] = next(reader, [])
+        try:
+            weight_index = header.index(weight_column)
+            height_index = header.index(height_column)
+        except ValueError:
+            raise ValueError("CSV file has missing or invalid headers") from None
+
+        width = max(weight_index, height_index) + 1
+        while True:
+            rows = list(islice(reader, chunk_size))
+            if not rows:
+                return
+            rows = [row if len(row) >= width else row + [""] * width for row in rows]
+            yield calculate_bmi_batch(
+                _parse_floats([row[weight_index] for row in rows]),
+                _parse_floats([row[height_index] for row in rows]),
+            )
+
+
 if __name__ == "__main__":
     bmi, category = calculate_bmi(70, 1.75)
     print(bmi)
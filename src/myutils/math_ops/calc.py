@@ -1,28 +1,66 @@
+import operator
+
+import numpy as np
+
+# Absolute imports, so that the menu below also runs as ``python calc.py``.
+from myutils.math_ops._vectorize import (
+    SCALAR_TYPES,
+    apply,
+    check_zero_policy,
+    divide_arrays,
+    divide_scalars,
+)
+
+# Every function also accepts NumPy arrays, sequences or buffer-protocol
+# objects (such as ``array.array``), broadcasting the operands together.
+# Plain int/float operands are checked by exact type first and take the
+# original scalar path before anything else.
+
+
 def add(a: float, b: float) -> float:
-    """Return the sum of two numbers."""
-    return a + b
+    """Return the sum of two numbers, element-wise for arrays."""
+    if type(a) in SCALAR_TYPES and type(b) in SCALAR_TYPES:
+        return a + b
+    return apply(np.add, operator.add, a, b)
 
 
 def subtract(a: float, b: float) -> float:
-    """Return the difference of two numbers (a - b)."""
-    return a - b
+    """Return the difference of two numbers (a - b), element-wise for arrays."""
+    if type(a) in SCALAR_TYPES and type(b) in SCALAR_TYPES:
+        return a - b
+    return apply(np.subtract, operator.sub, a, b)
 
 
 def multiply(a: float, b: float) -> float:
-    """Return the product of two numbers."""
-    return a * b
+    """Return the product of two numbers, element-wise for arrays."""
+    if type(a) in SCALAR_TYPES and type(b) in SCALAR_TYPES:
+        return a * b
+    return apply(np.multiply, operator.mul, a, b)
 
 
-def divide(a: float, b: float) -> float:
+def divide(a: float, b: float, on_zero: str = "raise") -> float:
     """
-    Return the quotient of two numbers (a / b).
+    Return the quotient of two numbers (a / b), element-wise for arrays.
+
+    Args:
+        a: Dividend (number or array-like).
+        b: Divisor (number or array-like).
+        on_zero (str): What to do with zero divisors: ``"raise"``,
+            ``"mask"``, ``"nan"`` or ``"index"``. See
+            :data:`myutils.math_ops._vectorize.ZERO_DIVISION_POLICIES`.
 
     Raises:
-        ValueError: If b is zero.
+        ValueError: If ``on_zero`` is unknown, or b is zero and
+            ``on_zero`` is ``"raise"``.
     """
-    if b == 0:
+    if type(a) in SCALAR_TYPES and type(b) in SCALAR_TYPES and on_zero == "raise":
+        if b:
+            return a / b
         raise ValueError("Cannot divide by zero")
-    return a / b
+    check_zero_policy(on_zero)
+    if isinstance(a, SCALAR_TYPES) and isinstance(b, SCALAR_TYPES):
+        return divide_scalars(operator.truediv, a, b, on_zero)
+    return divide_arrays(np.true_divide, a, b, on_zero)
 
 
 if __name__ == "__main__":
@@ -38,7 +76,8 @@ if __name__ == "__main__":
         1. Addition\n
         2. Subtraction\n
         3. Multiplication\n
-        4. Division"""
+        4. Division\n
+        5. Formula in a and b, e.g. (a + b) * a / b"""
     )
 
     selection = int(input("Enter the serial number of the operation to be performed: "))
@@ -51,5 +90,18 @@ if __name__ == "__main__":
         print(f"{a} x {b} = {multiply(a, b)}")
     elif selection == 4:
         print(f"{a} ÷ {b} = {divide(a, b)}")
+    elif selection == 5:
+        from myutils.math_ops.expression import ExpressionError, evaluate_expression
+
+        formula = input("Enter the formula: ")
+        try:
+            result = evaluate_expression(formula, {"a": a, "b": b})
+        except ExpressionError as e:
+            print(e)
+        else:
+            if len(result.zero_division_rows):
+                print("Cannot divide by zero")
+            else:
+                print(f"{formula} = {result.values}")
     else:
         print("Invalid option selected.")
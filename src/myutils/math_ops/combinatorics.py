@@ -0,0 +1,199 @@
+"""
+Binomial coefficients, exact and modulo a prime.
+
+Modular queries are answered from factorial and inverse-factorial tables
+that are built once per modulus and kept for later calls. When ``n`` is
+at least the modulus, Lucas' theorem reduces the query to table-sized
+digits. :func:`binom_many` answers whole arrays of queries with NumPy.
+"""
+
+from functools import lru_cache
+from math import comb
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+from .primality import is_prime
+
+MAX_TABLE_SIZE = 1 << 22
+"""Largest factorial table kept per modulus (32 MB for both tables)."""
+
+VECTOR_MOD_LIMIT = 1 << 31
+"""Moduli below this keep every table product within int64."""
+
+_tables: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+
+@lru_cache(maxsize=64)
+def _check_modulus(mod: int) -> None:
+    if mod < 2 or not is_prime(mod):
+        raise ValueError("Modulus must be a prime number")
+
+
+def _factorial_tables(mod: int, size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return ``(fact, inv_fact)`` tables modulo ``mod`` with at least ``size``
+    entries, extending the cached tables when needed.
+    """
+    cached = _tables.get(mod)
+    if cached is not None and len(cached[0]) >= size:
+        return cached
+
+    if cached is not None:
+        size = max(size, 2 * len(cached[0]))
+    size = min(mod, MAX_TABLE_SIZE, size)
+    dtype = np.int64 if mod < VECTOR_MOD_LIMIT else object
+
+    fact = [1] * size
+    for i in range(1, size):
+        fact[i] = fact[i - 1] * i % mod
+
+    inv_fact = [1] * size
+    inv_fact[-1] = pow(fact[-1], mod - 2, mod)
+    for i in range(size - 1, 0, -1):
+        inv_fact[i - 1] = inv_fact[i] * i % mod
+
+    tables = (np.array(fact, dtype=dtype), np.array(inv_fact, dtype=dtype))
+    _tables[mod] = tables
+    return tables
+
+
+def _binom_direct(n: int, r: int, mod: int) -> int:
+    """C(n, r) mod ``mod`` for ``r <= n < mod`` without tables, in O(r)."""
+    r = min(r, n - r)
+    numerator = denominator = 1
+    for i in range(r):
+        numerator = numerator * (n - i) % mod
+        denominator = denominator * (i + 1) % mod
+    return numerator * pow(denominator, mod - 2, mod) % mod
+
+
+def binom(n: int, r: int) -> int:
+    """
+    Return the exact binomial coefficient C(n, r).
+
+    Args:
+        n (int): Size of the set.
+        r (int): Number of elements chosen.
+
+    Returns:
+        int: C(n, r), or 0 when ``r < 0`` or ``r > n``.
+    """
+    if r < 0 or n < 0 or r > n:
+        return 0
+    return comb(n, r)
+
+
+def binom_mod(n: int, r: int, mod: int) -> int:
+    """
+    Return C(n, r) modulo a prime.
+
+    Args:
+        n (int): Size of the set.
+        r (int): Number of elements chosen.
+        mod (int): Prime modulus.
+
+    Returns:
+        int: C(n, r) mod ``mod``, or 0 when ``r < 0`` or ``r > n``.
+
+    Raises:
+        ValueError: If ``mod`` is not prime.
+    """
+    _check_modulus(mod)
+    if r < 0 or n < 0 or r > n:
+        return 0
+
+    if n < min(mod, MAX_TABLE_SIZE):
+        fact, inv_fact = _factorial_tables(mod, n + 1)
+        return int(fact[n]) * int(inv_fact[r]) % mod * int(inv_fact[n - r]) % mod
+
+    if n < mod:
+        return _binom_direct(n, r, mod)
+
+    if mod > MAX_TABLE_SIZE:
+        # Lucas digits are below ``mod`` but too large to tabulate.
+        result = 1
+        while n and result:
+            ni, ri = n % mod, r % mod
+            result = result * (_binom_direct(ni, ri, mod) if ri <= ni else 0) % mod
+            n //= mod
+            r //= mod
+        return result
+
+    # Lucas' theorem: multiply the coefficients of the base-mod digits.
+    fact, inv_fact = _factorial_tables(mod, mod)
+    result = 1
+    while n and result:
+        ni, ri = n % mod, r % mod
+        if ri > ni:
+            return 0
+        result = (
+            result * int(fact[ni]) % mod * int(inv_fact[ri]) % mod
+            * int(inv_fact[ni - ri]) % mod
+        )
+        n //= mod
+        r //= mod
+    return result
+
+
+def binom_many(
+    ns: Iterable[int], rs: Iterable[int], mod: Optional[int] = None
+) -> np.ndarray:
+    """
+    Return C(n, r) for every pair of ``ns`` and ``rs`` (broadcast together).
+
+    With a prime ``mod`` below :data:`VECTOR_MOD_LIMIT` the whole batch
+    is answered with table lookups, applying Lucas' theorem digit by
+    digit where ``n`` exceeds the table. Other cases fall back to one
+    call per pair.
+
+    Args:
+        ns (Iterable[int]): Set sizes.
+        rs (Iterable[int]): Numbers of elements chosen.
+        mod (int, optional): Prime modulus.
+
+    Returns:
+        np.ndarray: ``int64`` results modulo ``mod``, or an object array
+        of exact integers when no modulus is given.
+
+    Raises:
+        ValueError: If ``mod`` is not prime.
+    """
+    n, r = np.broadcast_arrays(np.asarray(ns), np.asarray(rs))
+
+    if mod is None:
+        pairs = zip(n.ravel().tolist(), r.ravel().tolist())
+        result = np.empty(n.size, dtype=object)
+        result[:] = [binom(a, b) for a, b in pairs]
+        return result.reshape(n.shape)
+
+    _check_modulus(mod)
+    if (
+        n.dtype.kind not in "iu"
+        or mod >= VECTOR_MOD_LIMIT
+        or (mod > MAX_TABLE_SIZE and n.size and int(n.max()) >= MAX_TABLE_SIZE)
+    ):
+        pairs = zip(n.ravel().tolist(), r.ravel().tolist())
+        flat = [binom_mod(a, b, mod) for a, b in pairs]
+        return np.array(flat, dtype=np.int64).reshape(n.shape)
+
+    n = n.astype(np.int64)
+    r = r.astype(np.int64)
+    result = ((r >= 0) & (n >= 0) & (r <= n)).astype(np.int64)
+    if not result.any():
+        return result
+
+    fact, inv_fact = _factorial_tables(mod, min(mod, int(n.max()) + 1))
+    n = np.where(result == 1, n, 0)
+    r = np.where(result == 1, r, 0)
+
+    while n.any():
+        ni, ri = n % mod, r % mod
+        valid = ri <= ni
+        ri = np.where(valid, ri, 0)
+        term = fact[ni] * inv_fact[ri] % mod * inv_fact[ni - ri] % mod
+        result = result * np.where(valid, term, 0) % mod
+        n //= mod
+        r //= mod
+
+    return result
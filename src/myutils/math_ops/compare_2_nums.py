@@ -1,3 +1,15 @@
+FIRST_GREATER = 1
+SECOND_GREATER = -1
+EQUAL = 0
+
+COMPARE_MESSAGES = {
+    FIRST_GREATER: "first value is greater",
+    SECOND_GREATER: "second value is greater",
+    EQUAL: "values are equal",
+}
+"""Message for each comparison code used by the batch comparators."""
+
+
 def compare_numbers(a: float, b: float) -> tuple[float, str]:
     """
     Comparing two floating point numbers
@@ -11,11 +23,11 @@ def compare_numbers(a: float, b: float) -> tuple[float, str]:
 
     """
     if a > b:
-        return a, "first value is greater"
+        return a, COMPARE_MESSAGES[FIRST_GREATER]
     elif b > a:
-        return b, "second value is greater"
+        return b, COMPARE_MESSAGES[SECOND_GREATER]
     else:
-        return a, "values are equal"
+        return a, COMPARE_MESSAGES[EQUAL]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,244 @@
+"""
+Arithmetic expressions evaluated over whole columns.
+
+An expression such as ``(a + b) * c / d`` is parsed once with :mod:`ast`,
+checked against a small whitelist of node types, and compiled into a
+postfix evaluation plan. The plan applies the calculator functions from
+:mod:`myutils.math_ops.calc` and :mod:`myutils.math_ops.adv_calc` to whole
+arrays, so it inherits their semantics, except that integer powers too
+large for int64 are computed in float64 rather than wrapping around.
+Compiled plans are cached by expression text, and nothing is ever passed
+to ``eval``.
+"""
+
+import ast
+import math
+from functools import lru_cache
+from typing import Mapping, NamedTuple, Tuple
+
+import numpy as np
+
+from .adv_calc import modulus, power
+from .calc import add, divide, multiply, subtract
+
+PLAN_CACHE_SIZE = 256
+"""Number of compiled expressions kept in the plan cache."""
+
+_INT64 = np.iinfo(np.int64)
+_INT64_BITS = 63
+
+
+def _power(base: np.ndarray, exponent: np.ndarray) -> np.ndarray:
+    """
+    :func:`power` that computes integer operands in float64 when a result
+    would not fit int64, instead of letting NumPy wrap it around.
+    """
+    if base.dtype.kind in "iu" and exponent.dtype.kind in "iu":
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bits = np.log2(np.abs(base.astype(np.float64))) * exponent
+        if (bits >= _INT64_BITS).any():
+            base = base.astype(np.float64)
+    return power(base, exponent)
+
+
+_BINARY_OPS = {
+    ast.Add: add,
+    ast.Sub: subtract,
+    ast.Mult: multiply,
+    ast.Div: divide,
+    ast.Pow: _power,
+    ast.Mod: modulus,
+}
+_DIVISIONS = (divide, modulus)
+
+_PUSH_CONST, _PUSH_NAME, _BINARY, _NEGATE = range(4)
+
+
+class ExpressionError(ValueError):
+    """Raised when an expression is malformed, unsupported or lacks inputs."""
+
+
+class ExpressionResult(NamedTuple):
+    """
+    Result of evaluating an expression over columns.
+
+    Attributes:
+        values (np.ndarray): Result for every row, NaN where a division
+            or modulus by zero occurred.
+        zero_division_rows (np.ndarray): Sorted positions (flat indices
+            into ``values``) of the rows where a division or modulus by
+            zero occurred, including rows it was broadcast to.
+    """
+
+    values: np.ndarray
+    zero_division_rows: np.ndarray
+
+
+class CompiledExpression:
+    """
+    A validated expression compiled into a postfix evaluation plan.
+
+    Attributes:
+        text (str): The source expression.
+        variables (tuple): Column names the expression reads, sorted.
+    """
+
+    def __init__(self, text: str, plan: Tuple[tuple, ...], variables: Tuple[str, ...]):
+        self.text = text
+        self.variables = variables
+        self._plan = plan
+
+    def __repr__(self) -> str:
+        return f"CompiledExpression({self.text!r})"
+
+    def evaluate(self, columns: Mapping[str, object]) -> ExpressionResult:
+        """
+        Evaluate the expression over columns of equal (broadcastable) shape.
+
+        Args:
+            columns (Mapping): Column name to NumPy array, sequence or
+                scalar for every variable in the expression.
+
+        Returns:
+            ExpressionResult: Values plus the rows that divided by zero.
+
+        Raises:
+            ExpressionError: If a variable is missing from ``columns``.
+        """
+        missing = [name for name in self.variables if name not in columns]
+        if missing:
+            raise ExpressionError(f"Missing values for: {', '.join(missing)}")
+
+        arrays = {name: np.asarray(columns[name]) for name in self.variables}
+        stack = []
+        zero_masks = []
+
+        for opcode, arg in self._plan:
+            if opcode == _PUSH_CONST:
+                stack.append(arg)
+            elif opcode == _PUSH_NAME:
+                stack.append(arrays[arg])
+            elif opcode == _NEGATE:
+                stack.append(subtract(0, np.asarray(stack.pop())))
+            else:
+                right = np.asarray(stack.pop())
+                left = np.asarray(stack.pop())
+                if arg in _DIVISIONS:
+                    result, rows = arg(left, right, on_zero="index")
+                    if len(rows):
+                        # Rows are flat indices into this division's own
+                        # shape; keep a mask to broadcast to the result.
+                        mask = np.zeros(np.shape(result), dtype=bool)
+                        mask.flat[rows] = True
+                        zero_masks.append(mask)
+                    stack.append(result)
+                else:
+                    stack.append(arg(left, right))
+
+        values = np.asarray(stack.pop())
+        if zero_masks:
+            bad = np.zeros(values.shape, dtype=bool)
+            for mask in zero_masks:
+                bad |= np.broadcast_to(mask, values.shape)
+            rows = np.flatnonzero(bad)
+        else:
+            rows = np.zeros(0, dtype=np.intp)
+        return ExpressionResult(values, rows)
+
+
+def _check_constant(value) -> None:
+    """Reject constants NumPy would not hold as int64 or finite float64."""
+    if isinstance(value, int):
+        if not _INT64.min <= value <= _INT64.max:
+            raise ExpressionError(f"Constant out of range: {value:.6g}")
+    elif not math.isfinite(value):
+        raise ExpressionError(f"Constant out of range: {value}")
+
+
+def _compile_tree(root: ast.AST, plan: list, variables: set) -> None:
+    """
+    Append the postfix plan for ``root`` after validating it.
+
+    Walks the tree with an explicit stack, so long formulas such as a sum
+    of thousands of terms do not hit the recursion limit.
+    """
+    pending = [(root, False)]
+    while pending:
+        node, visited = pending.pop()
+        if visited:
+            if isinstance(node, ast.BinOp):
+                plan.append((_BINARY, _BINARY_OPS[type(node.op)]))
+            elif isinstance(node.op, ast.USub):
+                plan.append((_NEGATE, None))
+        elif isinstance(node, ast.BinOp):
+            if type(node.op) not in _BINARY_OPS:
+                raise ExpressionError(
+                    f"Unsupported operator: {type(node.op).__name__}"
+                )
+            pending.extend(((node, True), (node.right, False), (node.left, False)))
+        elif isinstance(node, ast.UnaryOp) and isinstance(
+            node.op, (ast.UAdd, ast.USub)
+        ):
+            pending.extend(((node, True), (node.operand, False)))
+        elif isinstance(node, ast.Name):
+            variables.add(node.id)
+            plan.append((_PUSH_NAME, node.id))
+        elif (
+            isinstance(node, ast.Constant)
+            and isinstance(node.value, (int, float))
+            and not isinstance(node.value, bool)
+        ):
+            _check_constant(node.value)
+            plan.append((_PUSH_CONST, node.value))
+        else:
+            raise ExpressionError(f"Unsupported syntax: {type(node).__name__}")
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def compile_expression(text: str) -> CompiledExpression:
+    """
+    Parse, validate and compile an arithmetic expression.
+
+    Supported syntax is numbers, variable names, parentheses, unary
+    ``+``/``-`` and the binary operators ``+ - * / ** %``. Results are
+    cached by expression text.
+
+    Args:
+        text (str): The expression, for example ``"(a + b) * c / d"``.
+
+    Returns:
+        CompiledExpression: The reusable evaluation plan.
+
+    Raises:
+        ExpressionError: If the expression is malformed or uses
+            unsupported syntax.
+    """
+    try:
+        tree = ast.parse(text.strip(), mode="eval")
+    except SyntaxError as exc:
+        raise ExpressionError(f"Invalid expression: {exc.msg}") from None
+    except (RecursionError, MemoryError):
+        raise ExpressionError("Expression is too deeply nested") from None
+
+    plan: list = []
+    variables: set = set()
+    _compile_tree(tree.body, plan, variables)
+    return CompiledExpression(text, tuple(plan), tuple(sorted(variables)))
+
+
+def evaluate_expression(text: str, columns: Mapping[str, object]) -> ExpressionResult:
+    """
+    Evaluate an expression over columns, reusing the cached plan.
+
+    Args:
+        text (str): The expression, for example ``"(a + b) * c / d"``.
+        columns (Mapping): Column name to array for every variable.
+
+    Returns:
+        ExpressionResult: Values plus the rows that divided by zero.
+
+    Raises:
+        ExpressionError: If the expression is invalid or a column is
+            missing.
+    """
+    return compile_expression(text).evaluate(columns)
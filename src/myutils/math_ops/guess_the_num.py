@@ -1,33 +1,266 @@
 import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, NamedTuple, Optional
 
+import numpy as np
 
-def guess_the_number(lower_bound: int = 1, upper_bound: int = 100):
+TOO_LOW = -1
+"""Answer when the guess is below the secret number."""
+
+TOO_HIGH = 1
+"""Answer when the guess is above the secret number."""
+
+CORRECT = 0
+"""Answer when the guess is the secret number."""
+
+Strategy = Callable[[int, int, random.Random], int]
+"""
+A guessing strategy: ``strategy(low, high, rng) -> guess``, where
+``[low, high]`` is the range still consistent with earlier answers.
+"""
+
+
+def binary_search_strategy(low: int, high: int, rng: random.Random) -> int:
+    """Guess the middle of the remaining range."""
+    return (low + high) // 2
+
+
+def random_strategy(low: int, high: int, rng: random.Random) -> int:
+    """Guess uniformly at random within the remaining range."""
+    return rng.randint(low, high)
+
+
+def linear_strategy(low: int, high: int, rng: random.Random) -> int:
+    """Guess the smallest number not yet ruled out."""
+    return low
+
+
+class RandomOpponent:
+    """Picks the secret uniformly at random and answers honestly."""
+
+    def __init__(self, lower_bound: int, upper_bound: int, rng: random.Random):
+        self.secret = rng.randint(lower_bound, upper_bound)
+
+    def respond(self, guess: int) -> int:
+        if guess < self.secret:
+            return TOO_LOW
+        if guess > self.secret:
+            return TOO_HIGH
+        return CORRECT
+
+
+class AdversarialOpponent:
     """
-    Play a number guessing game where the user tries to guess
-    a randomly generated number between lower_bound and upper_bound.
+    Never commits to a secret: every answer keeps the larger part of the
+    range that is still consistent, forcing the most attempts possible.
     """
 
-    number = random.randint(lower_bound, upper_bound)
+    def __init__(self, lower_bound: int, upper_bound: int, rng: random.Random):
+        self.low = lower_bound
+        self.high = upper_bound
+
+    def respond(self, guess: int) -> int:
+        if guess < self.low:
+            return TOO_LOW
+        if guess > self.high:
+            return TOO_HIGH
+        if self.low == self.high:
+            return CORRECT
+        if self.high - guess >= guess - self.low:
+            self.low = guess + 1
+            return TOO_LOW
+        self.high = guess - 1
+        return TOO_HIGH
+
+
+OPPONENTS = {"random": RandomOpponent, "adversarial": AdversarialOpponent}
+"""Opponents available to :func:`simulate_games`, by name."""
+
+
+def play_game(
+    strategy: Strategy,
+    opponent,
+    lower_bound: int = 1,
+    upper_bound: int = 100,
+    rng: Optional[random.Random] = None,
+    on_answer: Optional[Callable[[int, int, int], None]] = None,
+    max_attempts: Optional[int] = None,
+) -> int:
+    """
+    Play one game of guess-the-number without any console I/O.
+
+    :param strategy: Callable producing the next guess
+    :param opponent: Object whose ``respond(guess)`` returns TOO_LOW,
+        TOO_HIGH or CORRECT
+    :param lower_bound: Smallest possible secret
+    :param upper_bound: Largest possible secret
+    :param rng: Random generator handed to the strategy
+    :param on_answer: Optional callback ``(guess, answer, attempts)``
+        invoked after every guess
+    :param max_attempts: Give up with RuntimeError after this many guesses
+    :return: Number of attempts needed to find the secret
+    """
+    rng = rng or random.Random()
+    low, high = lower_bound, upper_bound
     attempts = 0
 
     while True:
-        try:
-            # Enter your guess
-            user_input = int(
-                input(f"Enter a number between {lower_bound} and {upper_bound}: ")
-            )
-        except ValueError:
-            print("Please enter a valid integer")
-            continue
-
+        guess = strategy(low, high, rng)
         attempts += 1
+        answer = opponent.respond(guess)
+
+        if on_answer is not None:
+            on_answer(guess, answer, attempts)
+
+        if answer == CORRECT:
+            return attempts
+        if answer == TOO_LOW:
+            low = max(low, guess + 1)
+        else:
+            high = min(high, guess - 1)
+
+        if max_attempts is not None and attempts >= max_attempts:
+            raise RuntimeError(f"No correct guess within {max_attempts} attempts")
 
+
+class SimulationResult(NamedTuple):
+    """
+    Outcome of many simulated games.
+
+    Attributes:
+        histogram (np.ndarray): ``histogram[n]`` is the number of games
+            that took exactly ``n`` attempts.
+        games (int): Number of games played.
+    """
+
+    histogram: np.ndarray
+    games: int
+
+    @property
+    def mean_attempts(self) -> float:
+        """Average number of attempts per game."""
+        attempts = np.arange(len(self.histogram))
+        return float((attempts * self.histogram).sum() / max(self.games, 1))
+
+    @property
+    def max_attempts(self) -> int:
+        """Largest number of attempts any game needed."""
+        return int(np.flatnonzero(self.histogram)[-1]) if self.games else 0
+
+
+def _simulate_batch(args) -> np.ndarray:
+    """Play one batch of games and return its attempts histogram."""
+    strategy, opponent_name, games, lower, upper, seed, max_attempts = args
+    rng = random.Random(seed)
+    opponent_class = OPPONENTS[opponent_name]
+    attempts = [
+        play_game(
+            strategy,
+            opponent_class(lower, upper, rng),
+            lower,
+            upper,
+            rng,
+            max_attempts=max_attempts,
+        )
+        for _ in range(games)
+    ]
+    return np.bincount(attempts)
+
+
+def simulate_games(
+    strategy: Strategy,
+    games: int,
+    lower_bound: int = 1,
+    upper_bound: int = 100,
+    opponent: str = "random",
+    seed: Optional[int] = None,
+    processes: Optional[int] = None,
+    batch_size: int = 10_000,
+    max_attempts: Optional[int] = None,
+) -> SimulationResult:
+    """
+    Simulate many games and collect a histogram of attempts.
+
+    Games run in batches, each with its own RNG derived from ``seed``, so
+    results are reproducible and do not depend on how many processes are
+    used. With ``processes`` greater than 1 the batches are spread over a
+    process pool; ``strategy`` must then be a picklable (module-level)
+    callable.
+
+    :param strategy: Callable producing the next guess
+    :param games: Number of games to play
+    :param lower_bound: Smallest possible secret
+    :param upper_bound: Largest possible secret
+    :param opponent: Name of an opponent in :data:`OPPONENTS`
+    :param seed: Seed for reproducible simulations
+    :param processes: Worker processes; None or 1 runs in-process
+    :param batch_size: Games per batch (and per task sent to a worker)
+    :param max_attempts: Guesses per game before RuntimeError; defaults to
+        the size of the range
+    :return: SimulationResult with the histogram of attempts
+    """
+    if opponent not in OPPONENTS:
+        raise ValueError(f"Unknown opponent: {opponent!r}")
+    if max_attempts is None:
+        max_attempts = upper_bound - lower_bound + 1
+
+    sizes = [batch_size] * (games // batch_size)
+    if games % batch_size:
+        sizes.append(games % batch_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    tasks = [
+        (
+            strategy,
+            opponent,
+            size,
+            lower_bound,
+            upper_bound,
+            int(child.generate_state(1, dtype=np.uint64)[0]),
+            max_attempts,
+        )
+        for size, child in zip(sizes, seeds)
+    ]
+
+    if processes is not None and processes > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            histograms = list(pool.map(_simulate_batch, tasks))
+    else:
+        histograms = [_simulate_batch(task) for task in tasks]
+
+    histogram = np.zeros(max((len(h) for h in histograms), default=1), dtype=np.int64)
+    for h in histograms:
+        histogram[: len(h)] += h
+
+    return SimulationResult(histogram, games)
+
+
+def guess_the_number(lower_bound: int = 1, upper_bound: int = 100):
+    """
+    Play a number guessing game where the user tries to guess
+    a randomly generated number between lower_bound and upper_bound.
+    """
+
+    def ask(low: int, high: int, rng: random.Random) -> int:
+        while True:
+            try:
+                # Enter your guess
+                return int(
+                    input(f"Enter a number between {lower_bound} and {upper_bound}: ")
+                )
+            except ValueError:
+                print("Please enter a valid integer")
+
+    def report(guess: int, answer: int, attempts: int) -> None:
         # See if your guess is too high or too low
-        if user_input < number:
-            print(f"My number is greater than {user_input}")
-        elif user_input > number:
-            print(f"My number is less than {user_input}")
+        if answer == TOO_LOW:
+            print(f"My number is greater than {guess}")
+        elif answer == TOO_HIGH:
+            print(f"My number is less than {guess}")
         else:
             # The app will tell you when you are right, and how many guesses you had
             print(f"Well done! It took you {attempts} attempts to guess this number")
-            break
+
+    rng = random.Random()
+    opponent = RandomOpponent(lower_bound, upper_bound, rng)
+    play_game(ask, opponent, lower_bound, upper_bound, rng, on_answer=report)
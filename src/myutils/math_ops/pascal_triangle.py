@@ -1,36 +1,84 @@
-from math import factorial
+import sys
+from typing import Iterable, Iterator, List, Optional, TextIO
 
+WRITE_BUFFER_SIZE = 1 << 16
+"""Characters collected before each write to the output file."""
 
-def pascal_triangle_using_while(rows: int):
+
+def pascal_rows(rows: int, mod: Optional[int] = None) -> Iterator[List[int]]:
+    """
+    Yield the rows of Pascal's Triangle one at a time.
+
+    Without ``mod`` each row is built with the multiplicative recurrence
+    C(n, r + 1) = C(n, r) * (n - r) / (r + 1), mirrored around its middle.
+    With ``mod`` each row is derived from the previous one by addition,
+    so entries stay below ``mod`` instead of growing into big integers.
+
+    :param rows: Number of rows to generate
+    :param mod: Optional modulus applied to every entry
+    :return: Iterator over the rows, each a list of ints
+    """
+    if mod is not None and mod < 1:
+        raise ValueError("Modulus must be a positive integer")
+
+    if mod is None:
+        for n in range(rows):
+            half = [1]
+            for r in range(n // 2):
+                half.append(half[-1] * (n - r) // (r + 1))
+            yield half + half[n % 2 - 2 :: -1]
+        return
+
+    row = [1 % mod]
+    for _ in range(rows):
+        yield row
+        row = [1 % mod] + [(a + b) % mod for a, b in zip(row, row[1:])] + [1 % mod]
+
+
+def _write_lines(lines: Iterable[str], file: Optional[TextIO]) -> None:
+    """Write lines to ``file`` (default stdout) in large batched chunks."""
+    out = sys.stdout if file is None else file
+    buffer: List[str] = []
+    size = 0
+
+    for line in lines:
+        buffer.append(line)
+        size += len(line)
+        if size >= WRITE_BUFFER_SIZE:
+            out.write("".join(buffer))
+            buffer.clear()
+            size = 0
+
+    if buffer:
+        out.write("".join(buffer))
+
+
+def _triangle_lines(rows: int, mod: Optional[int]) -> Iterator[str]:
+    """Yield the formatted, left-padded lines of the triangle."""
+    for n, row in enumerate(pascal_rows(rows, mod)):
+        yield " " * (rows - n - 1) + " ".join(map(str, row)) + " \n"
+
+
+def pascal_triangle_using_while(
+    rows: int, file: Optional[TextIO] = None, mod: Optional[int] = None
+):
     """
     Print Pascal's Triangle with the given number of rows.
+
+    Rows are written through a single buffered writer to ``file``
+    (stdout by default).
+    """
+    _write_lines(_triangle_lines(rows, mod), file)
+
+
+def pascal_triangle(
+    rows: int, file: Optional[TextIO] = None, mod: Optional[int] = None
+):
+    """
+    Print Pascal's Triangle with the given number of rows.
+
+    Rows are written through a single buffered writer to ``file``
+    (stdout by default), so large triangles can be rendered straight to
+    disk without holding them in memory.
     """
-    n = 0
-    while n < rows:
-        # Print leading spaces
-        space = 1
-        while space < rows - n:
-            print(end=" ")
-            space += 1
-
-        # Print values in the row
-        r = 0
-        while r <= n:
-            ncr = factorial(n) // (factorial(r) * factorial(n - r))
-            print(ncr, end=" ")
-            r += 1
-
-        print()
-        n += 1
-
-
-def pascal_triangle(rows: int):
-    for n in range(rows):
-        for space in range(1, rows - n):
-            print(end=" ")
-
-        for r in range(n + 1):
-            ncr = factorial(n) // (factorial(r) * factorial(n - r))
-            print(ncr, end=" ")
-
-        print("")
+    _write_lines(_triangle_lines(rows, mod), file)
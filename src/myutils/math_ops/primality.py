@@ -0,0 +1,151 @@
+"""
+Fast primality testing for integers of any size.
+
+Numbers are first screened by trial division with small primes. Values
+below 2**64 are then settled by a deterministic Miller-Rabin test with a
+known witness set. Larger values use the Baillie-PSW test, which has no
+known counterexample.
+"""
+
+from math import isqrt
+
+SMALL_PRIMES = (
+    2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67,
+    71, 73, 79, 83, 89, 97, 101, 103, 107, 109, 113, 127, 131, 137, 139, 149,
+    151, 157, 163, 167, 173, 179, 181, 191, 193, 197, 199, 211, 223, 227, 229,
+    233, 239, 241, 251,
+)
+"""Primes used for the trial-division screen."""
+
+_SMALL_PRIME_SET = frozenset(SMALL_PRIMES)
+_TRIAL_LIMIT = SMALL_PRIMES[-1] ** 2
+
+MR_WITNESSES_64 = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)
+"""Miller-Rabin bases that are deterministic for every n < 2**64."""
+
+
+def _strong_probable_prime(n: int, base: int) -> bool:
+    """Return True if odd ``n > 2`` is a strong probable prime to ``base``."""
+    base %= n
+    if base == 0:
+        return True
+
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    x = pow(base, d, n)
+    if x == 1 or x == n - 1:
+        return True
+
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+
+    return False
+
+
+def _jacobi(a: int, n: int) -> int:
+    """Return the Jacobi symbol (a/n) for odd positive ``n``."""
+    a %= n
+    result = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def _strong_lucas_probable_prime(n: int) -> bool:
+    """
+    Strong Lucas probable-prime test with Selfridge's parameters.
+
+    ``n`` must be odd, greater than 2 and not a perfect square.
+    """
+    d = 5
+    while True:
+        jacobi = _jacobi(d, n)
+        if jacobi == -1:
+            break
+        if jacobi == 0 and abs(d) != n:
+            return False
+        d = -d - 2 if d > 0 else -d + 2
+
+    p = 1
+    q = (1 - d) // 4
+
+    k = n + 1
+    s = 0
+    while k % 2 == 0:
+        k //= 2
+        s += 1
+
+    # Compute U_k, V_k and Q^k by walking the bits of k.
+    u, v, qk = 1, p, q % n
+    for bit in bin(k)[3:]:
+        u, v = u * v % n, (v * v - 2 * qk) % n
+        qk = qk * qk % n
+        if bit == "1":
+            u, v = p * u + v, d * u + p * v
+            u = (u + n if u % 2 else u) // 2 % n
+            v = (v + n if v % 2 else v) // 2 % n
+            qk = qk * q % n
+
+    if u == 0 or v == 0:
+        return True
+
+    for _ in range(s - 1):
+        v = (v * v - 2 * qk) % n
+        if v == 0:
+            return True
+        qk = qk * qk % n
+
+    return False
+
+
+def is_prime(n: int) -> bool:
+    """
+    Check whether an integer is prime.
+
+    Small factors are removed by trial division, numbers below 2**64 are
+    decided by deterministic Miller-Rabin, and larger numbers by the
+    Baillie-PSW test.
+
+    Args:
+        n (int): The number to check for primality.
+
+    Returns:
+        bool: True if the number is prime, False otherwise.
+    """
+    n = int(n)
+    if n < 2:
+        return False
+
+    if n in _SMALL_PRIME_SET:
+        return True
+
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return False
+
+    if n < _TRIAL_LIMIT:
+        return True
+
+    if n < 1 << 64:
+        return all(_strong_probable_prime(n, a) for a in MR_WITNESSES_64)
+
+    if not _strong_probable_prime(n, 2):
+        return False
+
+    if isqrt(n) ** 2 == n:
+        return False
+
+    return _strong_lucas_probable_prime(n)
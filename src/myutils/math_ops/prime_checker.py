@@ -1,9 +1,28 @@
+from typing import Iterable
+
+import numpy as np
+
+from .primality import is_prime as _is_prime
+from .prime_sieve import cached_sieve, cached_sieve_limit, sieve_lookup
+
+DEFAULT_SIEVE_LIMIT = 10**8
+"""Largest value answered from the shared sieve (about 6 MB of bits)."""
+
+SIEVE_MIN_LIMIT = 1 << 16
+"""Tables up to this size are always worth building."""
+
+SIEVE_WORK_FACTOR = 256
+"""A sieve is only built up to this many numbers per input element."""
+
+
 def is_prime(n: int) -> bool:
     """
     Check whether a single integer is a prime number.
 
     A prime number is a natural number greater than 1 that has
-    no positive divisors other than 1 and itself.
+    no positive divisors other than 1 and itself. The check is delegated
+    to :func:`myutils.math_ops.primality.is_prime`, which stays fast for
+    64-bit and larger inputs.
 
     Parameters:
         n (int): The number to check for primality.
@@ -11,31 +30,72 @@ def is_prime(n: int) -> bool:
     Returns:
         bool: True if the number is prime, False otherwise.
     """
-    if n <= 1:
-        return False
+    return _is_prime(n)
+
+
+def is_prime_array(
+    numbers: Iterable[int], sieve_limit: int = DEFAULT_SIEVE_LIMIT
+) -> np.ndarray:
+    """
+    Determine primality for a whole batch of integers at once.
+
+    A bit-packed sieve is built once, sized from the largest input, and
+    every value it covers is answered with a vectorized lookup. Values
+    above the sieve ceiling fall back to :func:`is_prime`. The sieve is
+    cached, so later batches within the same range reuse it.
+
+    Parameters:
+        numbers (Iterable[int]): Integers to check for primality.
+        sieve_limit (int): Largest value answered from the sieve.
+
+    Returns:
+        np.ndarray: Boolean array, True where the number is prime.
+    """
+    values = np.asarray(numbers if hasattr(numbers, "__len__") else list(numbers))
+
+    if values.dtype.kind not in "iu":
+        flat = [is_prime(item) for item in values.ravel().tolist()]
+        return np.array(flat, dtype=bool).reshape(values.shape)
+
+    result = np.zeros(values.shape, dtype=bool)
+    if values.size == 0:
+        return result
 
-    for i in range(2, int(n**0.5) + 1):
-        if n % i == 0:
-            return False
+    target = min(int(values.max()), sieve_limit)
+    if target > cached_sieve_limit():
+        target = min(target, max(SIEVE_MIN_LIMIT, SIEVE_WORK_FACTOR * values.size))
+    limit = max(target, cached_sieve_limit())
 
-    return True
+    in_sieve = (values > 1) & (values <= limit)
+    if in_sieve.any():
+        bits = cached_sieve(target)
+        result[in_sieve] = sieve_lookup(bits, values[in_sieve])
 
+    above = values > limit
+    if above.any():
+        result[above] = [is_prime(item) for item in values[above].tolist()]
 
-def isPrime(my_list: list) -> list:
+    return result
+
+
+def isPrime(my_list: list, sieve_limit: int = DEFAULT_SIEVE_LIMIT) -> list:
     """
     Determine whether each integer in a list is a prime number.
 
+    The list is checked in one batch by :func:`is_prime_array`; use that
+    function directly to get a boolean NumPy array instead of tuples.
+
     Parameters:
         my_list (list): A list of integers to check for primality.
+        sieve_limit (int): Largest value answered from the shared sieve.
 
     Returns:
         list: A list of tuples where each tuple contains:
               (number, True) if the number is prime
               (number, False) if the number is not prime
     """
-    result = []
-
-    for item in my_list:
-        result.append((item, is_prime(item)))
+    # Any iterable is accepted; a generator must be read only once.
+    my_list = list(my_list)
+    flags = is_prime_array(my_list, sieve_limit).tolist()
 
-    return result
+    return list(zip(my_list, flags))
@@ -0,0 +1,272 @@
+"""
+Persistent, memory-mapped prime index.
+
+An index file stores the odd-only prime bitmap produced by
+:mod:`myutils.math_ops.prime_sieve` together with a block index of
+cumulative popcounts. Opening the file maps it read-only, so any number
+of processes share a single copy through the page cache and pay almost
+nothing at startup.
+
+File layout (little-endian)::
+
+    header   64 bytes   magic, version, block size, limit, block count
+    index    8 * (blocks + 1) bytes   primes among the odd bits before each block
+    bitmap   block_bytes * blocks     bit i set when 2 * i + 1 is prime
+"""
+
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+
+from .primality import is_prime as _is_prime
+from .prime_sieve import build_sieve
+
+MAGIC = b"MUPRIMEX"
+VERSION = 1
+DEFAULT_BLOCK_BITS = 4096
+"""Odd numbers covered by one popcount block (must be a multiple of 64)."""
+
+_HEADER = struct.Struct("<8sIIQQ")
+_HEADER_SIZE = 64
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint16)
+
+
+def _popcount(data: np.ndarray) -> int:
+    """Return the number of set bits in a ``uint8`` array."""
+    return int(_POPCOUNT[data].sum())
+
+
+class PrimeIndex:
+    """
+    Read-only prime lookups over a memory-mapped bitmap.
+
+    Use :meth:`build` to write an index file and :meth:`open` to map an
+    existing one. Instances can be used as context managers.
+
+    Attributes:
+        limit (int): Largest number covered by the bitmap.
+        block_bits (int): Odd numbers covered by one popcount block.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with self.path.open("rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, block_bits, limit, blocks = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{self.path} is not a prime index file")
+        if version != VERSION:
+            self._mmap.close()
+            raise ValueError(f"Unsupported prime index version: {version}")
+
+        self.limit = limit
+        self.block_bits = block_bits
+        self._block_bytes = block_bits // 8
+        self._index = np.frombuffer(
+            self._mmap, dtype="<u8", count=blocks + 1, offset=_HEADER_SIZE
+        )
+        self._bits = np.frombuffer(
+            self._mmap,
+            dtype=np.uint8,
+            count=blocks * self._block_bytes,
+            offset=_HEADER_SIZE + 8 * (blocks + 1),
+        )
+        self._n_bits = (limit + 1) // 2
+
+    @classmethod
+    def build(
+        cls,
+        path: Union[str, Path],
+        limit: int,
+        block_bits: int = DEFAULT_BLOCK_BITS,
+    ) -> "PrimeIndex":
+        """
+        Sieve primes up to ``limit``, write an index file and open it.
+
+        The file is written next to its destination and renamed into
+        place, so readers never observe a partially written index.
+
+        Args:
+            path (str | Path): Destination of the index file.
+            limit (int): Largest number to cover.
+            block_bits (int): Odd numbers per popcount block.
+
+        Returns:
+            PrimeIndex: The freshly built index, opened read-only.
+
+        Raises:
+            ValueError: If ``limit`` is negative or ``block_bits`` is not
+                a positive multiple of 64.
+        """
+        if limit < 0:
+            raise ValueError("Limit must be a non-negative integer")
+        if block_bits <= 0 or block_bits % 64:
+            raise ValueError("Block size must be a positive multiple of 64")
+
+        block_bytes = block_bits // 8
+        bits = build_sieve(limit)
+        blocks = max(1, -(-len(bits) // block_bytes))
+        padded = np.zeros(blocks * block_bytes, dtype=np.uint8)
+        padded[: len(bits)] = bits
+
+        per_block = _POPCOUNT[padded].reshape(blocks, block_bytes).sum(axis=1)
+        index = np.zeros(blocks + 1, dtype="<u8")
+        np.cumsum(per_block, out=index[1:])
+
+        path = Path(path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with tmp_path.open("wb") as file:
+            file.write(_HEADER.pack(MAGIC, VERSION, block_bits, limit, blocks))
+            file.write(b"\0" * (_HEADER_SIZE - _HEADER.size))
+            file.write(index.tobytes())
+            file.write(padded.tobytes())
+        os.replace(tmp_path, path)
+
+        return cls(path)
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> "PrimeIndex":
+        """Open an existing index file read-only."""
+        return cls(path)
+
+    def close(self) -> None:
+        """Release the memory mapping."""
+        # Drop the array views first; mmap refuses to close while exported.
+        self._index = self._bits = None
+        self._mmap.close()
+
+    def __enter__(self) -> "PrimeIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _check_range(self, a: int, b: int) -> None:
+        if b > self.limit:
+            raise ValueError(f"Upper bound {b} exceeds index limit {self.limit}")
+        if a > b:
+            raise ValueError("Lower bound must not exceed upper bound")
+
+    def _bit(self, i: int) -> bool:
+        return bool((self._bits[i >> 3] >> (i & 7)) & 1)
+
+    def _rank(self, m: int) -> int:
+        """Return the number of set bits among the first ``m`` odd slots."""
+        block, offset = divmod(m, self.block_bits)
+        count = int(self._index[block])
+        if offset:
+            start = block * self._block_bytes
+            full, rest = divmod(offset, 8)
+            count += _popcount(self._bits[start : start + full])
+            if rest:
+                count += bin(int(self._bits[start + full]) & ((1 << rest) - 1)).count(
+                    "1"
+                )
+        return count
+
+    def _odd_primes(self, lo: int, hi: int) -> np.ndarray:
+        """Return odd primes whose bit index lies in ``[lo, hi)``."""
+        if lo >= hi:
+            return np.zeros(0, dtype=np.int64)
+        first, last = lo >> 3, (hi + 7) >> 3
+        flags = np.unpackbits(self._bits[first:last], bitorder="little")
+        flags = flags[lo - first * 8 : hi - first * 8]
+        return 2 * (np.flatnonzero(flags).astype(np.int64) + lo) + 1
+
+    def is_prime(self, n: int) -> bool:
+        """
+        Check whether ``n`` is prime.
+
+        Numbers above the index limit are checked with
+        :func:`myutils.math_ops.primality.is_prime`.
+        """
+        if n > self.limit:
+            return _is_prime(n)
+        if n < 3:
+            return n == 2
+        return n % 2 == 1 and self._bit(n >> 1)
+
+    def next_prime(self, n: int) -> int:
+        """
+        Return the smallest prime strictly greater than ``n``.
+
+        The search continues past the index limit with
+        :func:`myutils.math_ops.primality.is_prime` when necessary.
+        """
+        if n < 2:
+            return 2
+
+        i = (n + 1) >> 1  # first odd slot above n
+        while i < self._n_bits:
+            hi = min(i + self.block_bits, self._n_bits)
+            found = self._odd_primes(i, hi)
+            if len(found):
+                return int(found[0])
+            i = hi
+
+        candidate = max(n + 1, 2 * self._n_bits + 1) | 1
+        while not _is_prime(candidate):
+            candidate += 2
+        return candidate
+
+    def prev_prime(self, n: int) -> Optional[int]:
+        """
+        Return the largest prime strictly smaller than ``n``.
+
+        Returns:
+            int | None: The prime, or None when ``n <= 2``.
+
+        Raises:
+            ValueError: If ``n - 1`` exceeds the index limit.
+        """
+        if n <= 2:
+            return None
+        if n - 1 > self.limit:
+            raise ValueError(f"{n - 1} exceeds index limit {self.limit}")
+        if n == 3:
+            return 2
+
+        hi = n >> 1  # odd slots strictly below n
+        while hi > 1:
+            lo = max(1, hi - self.block_bits)
+            found = self._odd_primes(lo, hi)
+            if len(found):
+                return int(found[-1])
+            hi = lo
+        return 2
+
+    def primes_in(self, a: int, b: int) -> np.ndarray:
+        """
+        Return all primes ``p`` with ``a <= p <= b``.
+
+        Raises:
+            ValueError: If the range is empty or exceeds the index limit.
+        """
+        self._check_range(a, b)
+        odd = self._odd_primes(max(a, 0) >> 1, (b + 1) >> 1)
+        if a <= 2 <= b:
+            return np.concatenate((np.array([2], dtype=np.int64), odd))
+        return odd
+
+    def count_primes(self, a: int, b: int) -> int:
+        """
+        Return the number of primes ``p`` with ``a <= p <= b``.
+
+        Whole blocks are answered from the precomputed popcount index, so
+        only the two partial blocks at the edges are scanned.
+
+        Raises:
+            ValueError: If the range is empty or exceeds the index limit.
+        """
+        self._check_range(a, b)
+        a = max(a, 0)
+        count = self._rank((b + 1) >> 1) - self._rank(a >> 1)
+        if a <= 2 <= b:
+            count += 1
+        return count
@@ -1,3 +1,6 @@
+from .primality import is_prime
+
+
 def isPrime(n: int) -> bool:
     """
     Determine whether a given integer is a prime number.
@@ -11,13 +14,6 @@ def isPrime(n: int) -> bool:
     Returns:
         bool: True if the number is prime, False otherwise.
     """
-    if n == 0 or n == 1:
-        # 0 is not prime
-        # 1 is neither prime nor composite
-        return False
-
-    for i in range(2, n):
-        if n % i == 0:
-            return False
-
-    return True
+    # 0 is not prime, 1 is neither prime nor composite; both are
+    # rejected by the shared primality backend.
+    return is_prime(n)
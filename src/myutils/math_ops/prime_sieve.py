@@ -0,0 +1,133 @@
+"""
+Bit-packed segmented sieve of Eratosthenes.
+
+The sieve only stores odd numbers: bit ``i`` of the table (little-endian
+within each byte) is set when ``2 * i + 1`` is prime. The number 2 is
+handled by the lookup helpers, so a table covering ``0..limit`` needs
+about ``limit / 16`` bytes.
+"""
+
+from math import isqrt
+
+import numpy as np
+
+SEGMENT_SIZE = 1 << 18
+"""Number of odd candidates sieved per segment (a multiple of 8)."""
+
+_cached_limit = -1
+_cached_bits = np.zeros(0, dtype=np.uint8)
+
+
+def small_primes(limit: int) -> np.ndarray:
+    """
+    Return all primes up to and including ``limit``.
+
+    Args:
+        limit (int): Upper bound of the search.
+
+    Returns:
+        np.ndarray: Sorted ``int64`` array of primes.
+    """
+    if limit < 2:
+        return np.zeros(0, dtype=np.int64)
+
+    is_odd_prime = np.ones((limit + 1) // 2, dtype=bool)
+    is_odd_prime[0] = False  # 1 is not prime
+
+    for i in range(1, (isqrt(limit) + 1) // 2):
+        if is_odd_prime[i]:
+            p = 2 * i + 1
+            is_odd_prime[p * p // 2 :: p] = False
+
+    primes = 2 * np.flatnonzero(is_odd_prime).astype(np.int64) + 1
+    return np.concatenate((np.array([2], dtype=np.int64), primes))
+
+
+def build_sieve(limit: int) -> np.ndarray:
+    """
+    Build a bit-packed, odd-only prime table covering ``0..limit``.
+
+    The table is filled one segment at a time, so the only full-size
+    allocation is the packed output itself.
+
+    Args:
+        limit (int): Largest number the table must answer for.
+
+    Returns:
+        np.ndarray: ``uint8`` array where bit ``i`` marks ``2 * i + 1``
+        as prime.
+    """
+    n_bits = (max(limit, 0) + 1) // 2
+    packed = np.zeros((n_bits + 7) // 8, dtype=np.uint8)
+    base = small_primes(isqrt(max(limit, 0)))[1:].tolist()
+
+    for lo in range(0, n_bits, SEGMENT_SIZE):
+        hi = min(lo + SEGMENT_SIZE, n_bits)
+        segment = np.ones(hi - lo, dtype=bool)
+        low_value = 2 * lo + 1
+        high_value = 2 * hi - 1
+
+        for p in base:
+            start = p * p
+            if start > high_value:
+                break
+            if start < low_value:
+                start = -(-low_value // p) * p
+                if start % 2 == 0:
+                    start += p
+            segment[(start >> 1) - lo :: p] = False
+
+        if lo == 0:
+            segment[0] = False  # 1 is not prime
+
+        packed[lo // 8 : (hi + 7) // 8] = np.packbits(segment, bitorder="little")
+
+    return packed
+
+
+def cached_sieve(limit: int) -> np.ndarray:
+    """
+    Return a prime table covering at least ``0..limit``.
+
+    The largest table built so far is kept for the lifetime of the
+    process and reused by later calls that fit inside it.
+
+    Args:
+        limit (int): Largest number the table must answer for.
+
+    Returns:
+        np.ndarray: Bit-packed table as produced by :func:`build_sieve`.
+    """
+    global _cached_limit, _cached_bits
+
+    if limit > _cached_limit:
+        _cached_bits = build_sieve(limit)
+        _cached_limit = limit
+
+    return _cached_bits
+
+
+def cached_sieve_limit() -> int:
+    """Return the limit of the cached prime table, or -1 if none exists."""
+    return _cached_limit
+
+
+def sieve_lookup(bits: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Look up primality for integers covered by a bit-packed table.
+
+    Args:
+        bits (np.ndarray): Table produced by :func:`build_sieve`.
+        values (np.ndarray): Integers between 0 and the table limit.
+
+    Returns:
+        np.ndarray: Boolean array with the same shape as ``values``.
+    """
+    values = np.asarray(values, dtype=np.int64)
+    result = values == 2
+
+    odd = (values & 1) == 1
+    index = values[odd] >> 1
+    result[odd] = ((bits[index >> 3] >> (index & 7).astype(np.uint8)) & 1).astype(bool)
+
+    return result
@@ -0,0 +1,296 @@
+"""
+Streaming comparisons over large sequences of numbers.
+
+Builds on the comparison codes of :mod:`myutils.math_ops.compare_2_nums`:
+``1`` when the first value is greater, ``-1`` when the second is, and
+``0`` when they are equal (optionally within a tolerance). Inputs may be
+any iterable of numbers or NumPy arrays; iterables are consumed in
+fixed-size chunks so memory use stays flat.
+"""
+
+import heapq
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .compare_2_nums import EQUAL, FIRST_GREATER, SECOND_GREATER
+
+CHUNK_SIZE = 1 << 16
+"""Number of values taken from a plain iterable per vectorized step."""
+
+_SIGN_MASK = np.int64(0x7FFFFFFFFFFFFFFF)
+
+
+def _chunks(values) -> Iterator[np.ndarray]:
+    """Yield float64 arrays covering ``values`` in order."""
+    if isinstance(values, np.ndarray):
+        yield values.astype(np.float64, copy=False).ravel()
+        return
+
+    iterator = iter(values)
+    while True:
+        chunk = np.fromiter(islice(iterator, CHUNK_SIZE), dtype=np.float64)
+        if not chunk.size:
+            return
+        yield chunk
+
+
+def _ordered_bits(values: np.ndarray) -> np.ndarray:
+    """Map float64 values to int64 so that adjacent floats differ by 1."""
+    bits = np.ascontiguousarray(values, dtype=np.float64).view(np.int64)
+    return np.where(bits < 0, -(bits & _SIGN_MASK), bits)
+
+
+def ulp_distance(a, b) -> np.ndarray:
+    """
+    Return the number of representable doubles between ``a`` and ``b``.
+
+    :param a: First operand (number or array-like)
+    :param b: Second operand (number or array-like)
+    :return: ``uint64`` distance in units in the last place
+    """
+    ordered_a = _ordered_bits(a)
+    ordered_b = _ordered_bits(b)
+    # Unsigned subtraction in the right order is exact even when the
+    # signed difference would overflow.
+    unsigned_a = ordered_a.view(np.uint64)
+    unsigned_b = ordered_b.view(np.uint64)
+    return np.where(
+        ordered_a >= ordered_b, unsigned_a - unsigned_b, unsigned_b - unsigned_a
+    )
+
+
+def close_mask(a, b, abs_tol: float = 0.0, rel_tol: float = 0.0, ulps: int = 0):
+    """
+    Return a boolean mask of where ``a`` and ``b`` count as equal.
+
+    Values are equal when they compare equal, or their difference is
+    within ``abs_tol``, or within ``rel_tol`` times the larger magnitude,
+    or they are at most ``ulps`` representable doubles apart.
+
+    :param a: First operand (number or array-like)
+    :param b: Second operand (number or array-like)
+    :param abs_tol: Absolute tolerance
+    :param rel_tol: Relative tolerance
+    :param ulps: Maximum distance in units in the last place
+    :return: Boolean NumPy array (0-d for scalar input)
+    """
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    close = a == b
+
+    if abs_tol or rel_tol:
+        with np.errstate(invalid="ignore"):
+            difference = np.abs(a - b)
+            limit = np.maximum(abs_tol, rel_tol * np.maximum(np.abs(a), np.abs(b)))
+            close |= difference <= limit
+    if ulps:
+        finite = np.isfinite(a) & np.isfinite(b)
+        close |= finite & (ulp_distance(a, b) <= ulps)
+
+    return close
+
+
+def is_close(
+    a: float, b: float, abs_tol: float = 0.0, rel_tol: float = 0.0, ulps: int = 0
+) -> bool:
+    """
+    Tolerance-aware equality for two numbers.
+
+    See :func:`close_mask` for the meaning of the tolerances.
+
+    :return: True if the values count as equal
+    """
+    return bool(close_mask(a, b, abs_tol, rel_tol, ulps))
+
+
+def compare_many(
+    a, b, abs_tol: float = 0.0, rel_tol: float = 0.0, ulps: int = 0
+) -> np.ndarray:
+    """
+    Compare two arrays element-wise and return compact comparison codes.
+
+    The batch counterpart of
+    :func:`myutils.math_ops.compare_2_nums.compare_numbers`: instead of a
+    ``(value, message)`` tuple per pair it returns one ``int8`` per pair.
+
+    :param a: First operands (array-like)
+    :param b: Second operands (array-like, broadcast against ``a``)
+    :param abs_tol: Absolute tolerance for equality
+    :param rel_tol: Relative tolerance for equality
+    :param ulps: Maximum ULP distance for equality
+    :return: ``int8`` array with ``FIRST_GREATER`` (1), ``SECOND_GREATER``
+        (-1) or ``EQUAL`` (0) per pair
+    """
+    a, b = np.broadcast_arrays(
+        np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64)
+    )
+
+    codes = np.full(a.shape, EQUAL, dtype=np.int8)
+    codes[a > b] = FIRST_GREATER
+    codes[a < b] = SECOND_GREATER
+    if abs_tol or rel_tol or ulps:
+        codes[close_mask(a, b, abs_tol, rel_tol, ulps)] = EQUAL
+    return codes
+
+
+class RunningExtrema:
+    """
+    Running minimum and maximum, with their positions, over a stream.
+
+    NaN values are counted as seen but never become an extremum. Ties
+    keep the earliest position, matching ``compare_numbers`` which
+    returns the first value when both are equal.
+
+    Attributes:
+        count (int): Number of values seen so far.
+        min (float | None): Smallest value seen, or None.
+        max (float | None): Largest value seen, or None.
+        argmin (int | None): Position of :attr:`min` in the stream.
+        argmax (int | None): Position of :attr:`max` in the stream.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.argmin: Optional[int] = None
+        self.argmax: Optional[int] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"RunningExtrema(count={self.count}, min={self.min}, "
+            f"argmin={self.argmin}, max={self.max}, argmax={self.argmax})"
+        )
+
+    def update(self, values: Iterable[float]) -> "RunningExtrema":
+        """
+        Consume more values from an iterable or a NumPy chunk.
+
+        :param values: Numbers to add to the stream
+        :return: self, so calls can be chained
+        """
+        for chunk in _chunks(values):
+            offset = self.count
+            self.count += chunk.size
+            valid = ~np.isnan(chunk)
+            if not valid.any():
+                continue
+
+            low = int(np.argmin(np.where(valid, chunk, np.inf)))
+            high = int(np.argmax(np.where(valid, chunk, -np.inf)))
+
+            if self.min is None or chunk[low] < self.min:
+                self.min, self.argmin = float(chunk[low]), offset + low
+            if self.max is None or chunk[high] > self.max:
+                self.max, self.argmax = float(chunk[high]), offset + high
+
+        return self
+
+    def merge(self, other: "RunningExtrema") -> "RunningExtrema":
+        """
+        Combine with extrema of a stream that followed this one.
+
+        :param other: Extrema of the next part of the stream
+        :return: self, updated in place
+        """
+        offset = self.count
+        self.count += other.count
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min, self.argmin = other.min, offset + other.argmin
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max, self.argmax = other.max, offset + other.argmax
+        return self
+
+
+class TopK:
+    """
+    Bounded heap keeping the ``k`` largest (or smallest) values of a stream.
+
+    Memory is O(k) no matter how long the stream is. Chunks from NumPy
+    are pre-filtered against the current threshold and reduced with
+    ``np.partition``, so only real candidates touch the heap. Ties keep
+    the earliest position.
+
+    :param k: Number of values to keep
+    :param largest: Keep the largest values (default) or the smallest
+    """
+
+    def __init__(self, k: int, largest: bool = True):
+        if k < 1:
+            raise ValueError("k must be a positive integer")
+        self.k = k
+        self.largest = largest
+        self.count = 0
+        # Entries are (key, -position, value): on equal keys the earliest
+        # position ranks higher and the later one is evicted first.
+        self._heap: List[Tuple[float, int, float]] = []
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def update(self, values: Iterable[float]) -> "TopK":
+        """
+        Consume more values from an iterable or a NumPy chunk.
+
+        NaN values are skipped.
+
+        :param values: Numbers to add to the stream
+        :return: self, so calls can be chained
+        """
+        heap = self._heap
+        for chunk in _chunks(values):
+            offset = self.count
+            self.count += chunk.size
+
+            keys = chunk if self.largest else -chunk
+            candidates = np.flatnonzero(~np.isnan(keys))
+            if len(heap) == self.k:
+                candidates = candidates[keys[candidates] > heap[0][0]]
+            if len(candidates) > self.k:
+                # Keep every key above the k-th largest and, of those equal
+                # to it, the earliest; candidates are in stream order.
+                candidate_keys = keys[candidates]
+                kth = -np.partition(-candidate_keys, self.k - 1)[self.k - 1]
+                keep = candidate_keys > kth
+                ties = np.flatnonzero(candidate_keys == kth)
+                keep[ties[: self.k - np.count_nonzero(keep)]] = True
+                candidates = candidates[keep]
+
+            for i in candidates.tolist():
+                entry = (float(keys[i]), -(offset + i), float(chunk[i]))
+                if len(heap) < self.k:
+                    heapq.heappush(heap, entry)
+                elif entry > heap[0]:
+                    heapq.heapreplace(heap, entry)
+
+        return self
+
+    def items(self) -> List[Tuple[float, int]]:
+        """
+        Return the kept values with their stream positions, best first.
+
+        :return: List of ``(value, position)`` tuples
+        """
+        ranked = sorted(self._heap, reverse=True)
+        return [(value, -position) for _, position, value in ranked]
+
+    def merge(self, other: "TopK") -> "TopK":
+        """
+        Combine with the top-k of a stream that followed this one.
+
+        :param other: TopK of the next part of the stream, same direction
+        :return: self, updated in place
+        """
+        if other.largest != self.largest:
+            raise ValueError("Cannot merge largest and smallest trackers")
+        offset = self.count
+        self.count += other.count
+        for key, position, value in other._heap:
+            entry = (key, position - offset, value)
+            if len(self._heap) < self.k:
+                heapq.heappush(self._heap, entry)
+            elif entry > self._heap[0]:
+                heapq.heapreplace(self._heap, entry)
+        return self
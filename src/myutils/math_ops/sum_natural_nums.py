@@ -1,3 +1,13 @@
+from fractions import Fraction
+from functools import lru_cache
+from math import comb, lcm
+from typing import Tuple
+
+import numpy as np
+
+_INT64_SAFE = 1 << 62
+
+
 def summation(n: int) -> float:
     """
     Calculate the sum of the first n natural numbers.
@@ -9,11 +19,166 @@ def summation(n: int) -> float:
         n (int): A positive integer representing the number of natural numbers.
 
     Returns:
-        float: The sum of the first n natural numbers, rounded to 2 decimal places.
+        int | float: The exact integer sum when ``n`` is an int; for other
+        numbers, the sum rounded to 2 decimal places.
     """
+    if isinstance(n, int):
+        return n * (n + 1) // 2
     return round((n * (n + 1)) / 2, 2)
 
 
+@lru_cache(maxsize=None)
+def _bernoulli(m: int) -> Fraction:
+    """Return the Bernoulli number B_m with the convention B_1 = +1/2."""
+    if m == 0:
+        return Fraction(1)
+    return 1 - sum(
+        Fraction(comb(m, j), m - j + 1) * _bernoulli(j) for j in range(m)
+    )
+
+
+@lru_cache(maxsize=256)
+def faulhaber_coefficients(k: int) -> Tuple[Tuple[int, ...], int]:
+    """
+    Return the integer coefficients of Faulhaber's formula for power k.
+
+    The sum 1**k + 2**k + ... + n**k equals
+    ``sum(c[j] * n**j for j in range(k + 2)) // d``.
+
+    Args:
+        k (int): Non-negative exponent.
+
+    Returns:
+        tuple: ``(c, d)`` with ``c`` ordered from the constant term up.
+    """
+    coefficients = [Fraction(0)] * (k + 2)
+    for j in range(k + 1):
+        coefficients[k + 1 - j] = Fraction(comb(k + 1, j), k + 1) * _bernoulli(j)
+
+    denominator = lcm(*(c.denominator for c in coefficients))
+    scaled = tuple(int(c * denominator) for c in coefficients)
+    return scaled, denominator
+
+
+def power_sum(n: int, k: int = 1) -> int:
+    """
+    Return the exact sum 1**k + 2**k + ... + n**k.
+
+    Args:
+        n (int): Number of terms (0 gives an empty sum).
+        k (int): Non-negative exponent.
+
+    Returns:
+        int: The exact sum.
+
+    Raises:
+        ValueError: If ``k`` is negative.
+    """
+    if k < 0:
+        raise ValueError("Exponent must be a non-negative integer")
+
+    coefficients, denominator = faulhaber_coefficients(k)
+    total = 0
+    for c in reversed(coefficients):
+        total = total * n + c
+    return total // denominator
+
+
+def range_sum(a: int, b: int, k: int = 1, step: int = 1) -> int:
+    """
+    Return the exact sum of ``x**k`` over the progression a, a + step, ... <= b.
+
+    With the default step this is the sum of ``x**k`` for every integer
+    in ``[a, b]``. Negative bounds are allowed.
+
+    Args:
+        a (int): First term.
+        b (int): Inclusive upper bound.
+        k (int): Non-negative exponent.
+        step (int): Positive difference between terms.
+
+    Returns:
+        int: The exact sum, 0 when the progression is empty.
+
+    Raises:
+        ValueError: If ``k`` is negative or ``step`` is not positive.
+    """
+    if step < 1:
+        raise ValueError("Step must be a positive integer")
+    if b < a:
+        return 0
+
+    if step == 1:
+        return power_sum(b, k) - power_sum(a - 1, k)
+
+    # (a + step*i)**k expanded binomially, with i running from 0 to m - 1.
+    m = (b - a) // step + 1
+    total = a**k * m
+    for j in range(1, k + 1):
+        total += comb(k, j) * a ** (k - j) * step**j * power_sum(m - 1, j)
+    return total
+
+
+def range_sums(a, b, k=1) -> np.ndarray:
+    """
+    Answer many :func:`range_sum` queries (with step 1) in one call.
+
+    ``a``, ``b`` and ``k`` are broadcast together. The Faulhaber
+    polynomial for each distinct exponent is evaluated over all matching
+    queries at once, in ``int64`` where the result provably fits and with
+    exact Python integers otherwise.
+
+    Args:
+        a: Array-like of lower bounds.
+        b: Array-like of inclusive upper bounds.
+        k: Array-like of non-negative exponents.
+
+    Returns:
+        np.ndarray: ``int64`` sums, or an object array of exact integers
+        when any result may not fit in 64 bits.
+
+    Raises:
+        ValueError: If any exponent is negative.
+    """
+    a, b, k = np.broadcast_arrays(
+        np.asarray(a, dtype=np.int64),
+        np.asarray(b, dtype=np.int64),
+        np.asarray(k, dtype=np.int64),
+    )
+    if k.size and k.min() < 0:
+        raise ValueError("Exponent must be a non-negative integer")
+
+    results = []
+    exact = False
+    empty = b < a
+
+    for exponent in np.unique(k).tolist():
+        selected = k == exponent
+        upper = b[selected]
+        lower = a[selected] - 1
+        coefficients, denominator = faulhaber_coefficients(exponent)
+
+        magnitude = max(int(np.abs(upper).max()), int(np.abs(lower).max()), 1)
+        bound = sum(abs(c) for c in coefficients) * magnitude ** (exponent + 1)
+        dtype = np.int64 if bound < _INT64_SAFE else object
+        exact = exact or dtype is object
+
+        upper = upper.astype(dtype)
+        lower = lower.astype(dtype)
+        high = np.zeros(upper.shape, dtype=dtype)
+        low = np.zeros(lower.shape, dtype=dtype)
+        for c in reversed(coefficients):
+            high = high * upper + c
+            low = low * lower + c
+        results.append((selected, (high - low) // denominator))
+
+    result = np.zeros(a.shape, dtype=object if exact else np.int64)
+    for selected, values in results:
+        result[selected] = values
+    result[empty] = 0
+    return result
+
+
 if __name__ == "__main__":
     n = int(input("Enter a number: "))
     result = summation(n)
@@ -1,15 +1,12 @@
-from .phonebook_ops import (
-    add_contact,
-    update_contact,
-    delete_contact,
-    get_contact,
-    list_contacts,
-)
+from .._lazy import attach
 
-__all__ = [
-    "add_contact",
-    "update_contact",
-    "delete_contact",
-    "get_contact",
-    "list_contacts",
-]
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "add_contact": ".phonebook_ops",
+        "update_contact": ".phonebook_ops",
+        "delete_contact": ".phonebook_ops",
+        "get_contact": ".phonebook_ops",
+        "list_contacts": ".phonebook_ops",
+    },
+)
@@ -0,0 +1,13 @@
+from .._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "Interval": ".intervals",
+        "CompiledTable": ".intervals",
+        "compile_table": ".intervals",
+        "table_from_spec": ".intervals",
+        "load_table": ".intervals",
+        "clear_table_cache": ".intervals",
+    },
+)
@@ -0,0 +1,283 @@
+"""
+Declarative interval tables compiled into sorted boundary arrays.
+
+A table maps numbers to values through a ladder of intervals, each given
+by its lower bound (inclusive or exclusive) and the value it yields; the
+last interval runs up to an optional upper bound. Numbers outside every
+interval (or NaN) get the table's default.
+
+Tables can be written in Python, JSON or TOML::
+
+    {
+        "intervals": [
+            {"lower": 0, "value": "infant"},
+            {"lower": 5, "lower_inclusive": false, "value": "child"},
+        ],
+        "upper": 10,
+        "default": "invalid",
+    }
+
+Compiling turns the bounds into one sorted array, so a scalar lookup is
+an O(log k) ``bisect`` and a batch lookup is one ``np.searchsorted``.
+Exclusive bounds become the next larger double, which keeps every
+interval half-open on the right. Compiled tables are cached by a hash of
+their content, so building the same table twice is free.
+"""
+
+import hashlib
+import json
+import math
+from bisect import bisect_right
+from pathlib import Path
+from typing import Any, Iterable, Mapping, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+TABLE_CACHE_SIZE = 128
+"""Number of compiled tables kept in the content-hash cache."""
+
+_TABLE_CACHE: dict = {}
+
+
+class Interval(NamedTuple):
+    """
+    One row of an interval table.
+
+    Attributes:
+        lower (float | None): Lower bound of the interval; None means
+            unbounded (only allowed on the first row).
+        value (Any): Value looked up for numbers in the interval.
+        lower_inclusive (bool): Whether ``lower`` itself is inside.
+    """
+
+    lower: Optional[float]
+    value: Any
+    lower_inclusive: bool = True
+
+
+class CompiledTable:
+    """
+    An interval table compiled for fast lookups.
+
+    Use :func:`compile_table` rather than creating instances directly, so
+    identical tables are shared through the cache.
+
+    Attributes:
+        intervals (tuple): The Interval rows, lowest first.
+        values (tuple): The value of every interval, lowest first.
+        default (Any): Value for numbers outside every interval.
+        bounds (tuple): Effective inclusive lower bound of every interval,
+            followed by the exclusive upper bound when there is one.
+        digest (str): Content hash the table is cached under.
+    """
+
+    def __init__(
+        self,
+        intervals: Sequence[Interval],
+        upper: Optional[float],
+        upper_inclusive: bool,
+        default: Any,
+        digest: str,
+    ):
+        self.intervals = tuple(intervals)
+        self.values = tuple(interval.value for interval in self.intervals)
+        self.upper = upper
+        self.upper_inclusive = upper_inclusive
+        self.default = default
+        self.digest = digest
+
+        bounds = [
+            _effective_bound(interval.lower, interval.lower_inclusive)
+            for interval in self.intervals
+        ]
+        if upper is not None:
+            bounds.append(_effective_bound(upper, not upper_inclusive))
+        if any(low >= high for low, high in zip(bounds, bounds[1:])):
+            raise ValueError("Interval bounds must be strictly increasing")
+
+        self.bounds = tuple(bounds)
+        self.bound_array = np.array(bounds, dtype=np.float64)
+        self._value_tables: dict = {}
+
+    def __len__(self) -> int:
+        return len(self.intervals)
+
+    def __repr__(self) -> str:
+        return f"CompiledTable({len(self)} intervals, digest={self.digest[:12]})"
+
+    def index(self, x: float) -> int:
+        """
+        Return the position of the interval containing ``x``.
+
+        :param x: Number to look up
+        :return: Interval index, or -1 when ``x`` is outside every interval
+        """
+        if x != x:
+            return -1
+        position = bisect_right(self.bounds, x) - 1
+        return position if position < len(self.intervals) else -1
+
+    def lookup(self, x: float) -> Any:
+        """
+        Return the value of the interval containing ``x``.
+
+        :param x: Number to look up
+        :return: The interval's value, or the table default
+        """
+        position = self.index(x)
+        return self.values[position] if position >= 0 else self.default
+
+    def index_many(self, xs) -> np.ndarray:
+        """
+        Return the interval index of every number in ``xs``.
+
+        :param xs: Array-like of numbers
+        :return: ``intp`` array of interval indices, -1 outside the table
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        positions = np.searchsorted(self.bound_array, xs, side="right") - 1
+        positions[(positions >= len(self.intervals)) | np.isnan(xs)] = -1
+        return positions
+
+    def lookup_many(self, xs, dtype=None) -> np.ndarray:
+        """
+        Return the value of every number in ``xs``.
+
+        :param xs: Array-like of numbers
+        :param dtype: NumPy dtype of the result; defaults to ``object``
+        :return: Array of interval values, the default outside the table
+        """
+        dtype = np.dtype(object if dtype is None else dtype)
+        table = self._value_tables.get(dtype)
+        if table is None:
+            table = np.array([*self.values, self.default], dtype=dtype)
+            self._value_tables[dtype] = table
+        # Index -1 selects the default stored at the end of the table.
+        return table[self.index_many(xs)]
+
+
+def _effective_bound(bound: Optional[float], inclusive: bool) -> float:
+    """Turn a bound into the smallest number at or above it that is inside."""
+    if bound is None:
+        return -math.inf
+    bound = float(bound)
+    return bound if inclusive else float(np.nextafter(bound, math.inf))
+
+
+def _as_interval(row: Union[Interval, Mapping, Sequence]) -> Interval:
+    if isinstance(row, Interval):
+        return row
+    if isinstance(row, Mapping):
+        return Interval(
+            row.get("lower"), row["value"], row.get("lower_inclusive", True)
+        )
+    return Interval(*row)
+
+
+def _digest(
+    intervals: Sequence[Interval],
+    upper: Optional[float],
+    upper_inclusive: bool,
+    default: Any,
+) -> str:
+    """Hash the content of a table, including the types of its values."""
+
+    def typed(value):
+        return [type(value).__qualname__, value]
+
+    content = [
+        [[row.lower, row.lower_inclusive, typed(row.value)] for row in intervals],
+        upper,
+        upper_inclusive,
+        typed(default),
+    ]
+    text = json.dumps(content, sort_keys=True, default=repr)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def compile_table(
+    intervals: Iterable[Union[Interval, Mapping, Sequence]],
+    upper: Optional[float] = None,
+    upper_inclusive: bool = True,
+    default: Any = None,
+) -> CompiledTable:
+    """
+    Compile an interval table, reusing a cached copy when possible.
+
+    :param intervals: Rows as Interval tuples, ``(lower, value[,
+        lower_inclusive])`` sequences or mappings with the same keys,
+        lowest first
+    :param upper: Upper bound of the last interval, None for unbounded
+    :param upper_inclusive: Whether ``upper`` itself is inside
+    :param default: Value for numbers outside every interval
+    :return: The compiled table
+    :raises ValueError: If there are no rows or the bounds do not increase
+    """
+    rows = [_as_interval(row) for row in intervals]
+    if not rows:
+        raise ValueError("An interval table needs at least one interval")
+
+    digest = _digest(rows, upper, upper_inclusive, default)
+    table = _TABLE_CACHE.get(digest)
+    if table is None:
+        table = CompiledTable(rows, upper, upper_inclusive, default, digest)
+        if len(_TABLE_CACHE) >= TABLE_CACHE_SIZE:
+            del _TABLE_CACHE[next(iter(_TABLE_CACHE))]
+        _TABLE_CACHE[digest] = table
+    return table
+
+
+def table_from_spec(spec: Mapping) -> CompiledTable:
+    """
+    Compile a table from its declarative form.
+
+    :param spec: Mapping with an ``intervals`` list and optional
+        ``upper``, ``upper_inclusive`` and ``default`` keys
+    :return: The compiled table
+    """
+    return compile_table(
+        spec["intervals"],
+        spec.get("upper"),
+        spec.get("upper_inclusive", True),
+        spec.get("default"),
+    )
+
+
+def load_table(path: Union[str, Path]) -> CompiledTable:
+    """
+    Load and compile a table from a JSON or TOML file.
+
+    TOML has no null, so leave out ``lower`` or ``upper`` for an
+    unbounded side. Reading TOML needs Python 3.11+ or the ``tomli``
+    package.
+
+    :param path: Path to a ``.json`` or ``.toml`` file
+    :return: The compiled table
+    :raises ValueError: If the file type is not supported
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+
+    if suffix == ".json":
+        with path.open(encoding="utf-8") as file:
+            return table_from_spec(json.load(file))
+
+    if suffix == ".toml":
+        try:
+            import tomllib
+        except ImportError:  # Python < 3.11
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise ImportError(
+                    "Reading TOML tables requires Python 3.11+ or the tomli package"
+                ) from None
+        with path.open("rb") as file:
+            return table_from_spec(tomllib.load(file))
+
+    raise ValueError(f"Unsupported table file type: {path.suffix!r}")
+
+
+def clear_table_cache() -> None:
+    """Drop every cached compiled table."""
+    _TABLE_CACHE.clear()
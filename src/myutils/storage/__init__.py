@@ -1,3 +1,9 @@
-from .phonebook_storage import load_phonebook, save_phonebook
+from .._lazy import attach
 
-__all__ = ["load_phonebook", "save_phonebook"]
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "load_phonebook": ".phonebook_storage",
+        "save_phonebook": ".phonebook_storage",
+    },
+)
@@ -11,8 +11,6 @@ try:
 except NameError:
     BASE_DIR = Path.cwd() / "data"
 
-BASE_DIR.mkdir(parents=True, exist_ok=True)
-
 DEFAULT_CSV_PATH = BASE_DIR / "phonebook.csv"
 
 
@@ -79,9 +77,10 @@ def save_phonebook(
     phonebook : PhoneBook
         Phonebook dictionary to persist.
     csv_path : Path, optional
-        Path to the CSV file.
+        Path to the CSV file. Missing parent directories are created.
     """
     try:
+        csv_path.parent.mkdir(parents=True, exist_ok=True)
         with csv_path.open(mode="w", newline="", encoding="utf-8") as csv_file:
             fieldnames = ["name", "phone", "email"]
             writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
@@ -1,13 +1,12 @@
-from .email_task import create_emails
-from .data_cleaning import clean_text
-from .text_analyzer import analyze_text
-from .remove_dupes import remove_duplicates
-from .frequency import get_frequency
+from .._lazy import attach
 
-__all__ = [
-    "create_emails",
-    "clean_text",
-    "analyze_text",
-    "remove_duplicates",
-    "get_frequency",
-]
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "create_emails": ".email_task",
+        "clean_text": ".data_cleaning",
+        "analyze_text": ".text_analyzer",
+        "remove_duplicates": ".remove_dupes",
+        "get_frequency": ".frequency",
+    },
+)
@@ -31,9 +31,10 @@ def get_frequency(text: str) -> dict:
     return word_count
 
 
-text = "This is phil's test! The test is simple!"
-"""
-Since punctuation characters are removed entirely (replaced with an empty string), apostrophes do not introduce word boundaries. As a result, "phil's" becomes "phils", and it is counted as a single word rather than being split into "phil" and "s".
-"""
-result = get_frequency(text)
-print(result)
+if __name__ == "__main__":
+    text = "This is phil's test! The test is simple!"
+    """
+    Since punctuation characters are removed entirely (replaced with an empty string), apostrophes do not introduce word boundaries. As a result, "phil's" becomes "phils", and it is counted as a single word rather than being split into "phil" and "s".
+    """
+    result = get_frequency(text)
+    print(result)
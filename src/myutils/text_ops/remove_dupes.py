@@ -54,11 +54,12 @@ def remove_duplicates_using_set(my_list: list) -> list:
     return unique_list
 
 
-my_list = [1, 2, 2, 3, 1, 4, 6, 6]
-
-unique_list_1 = remove_duplicates(my_list)
-print(unique_list_1)
-unique_list_2 = remove_duplicates_using_dict(my_list)
-print(unique_list_2)
-unique_list_3 = remove_duplicates_using_set(my_list)
-print(unique_list_3)
+if __name__ == "__main__":
+    my_list = [1, 2, 2, 3, 1, 4, 6, 6]
+
+    unique_list_1 = remove_duplicates(my_list)
+    print(unique_list_1)
+    unique_list_2 = remove_duplicates_using_dict(my_list)
+    print(unique_list_2)
+    unique_list_3 = remove_duplicates_using_set(my_list)
+    print(unique_list_3)
@@ -35,5 +35,6 @@ def clean_text(text: str) -> str:
     return "".join(cleaned)
 
 
-text = "Hello, world! This is phil’s test — cost: ₹100. Email: test@example.com"
-print(clean_text(text))
+if __name__ == "__main__":
+    text = "Hello, world! This is phil’s test — cost: ₹100. Email: test@example.com"
+    print(clean_text(text))
@@ -21,5 +21,6 @@ def extract_unique_words(text):
     return sorted(unique_words)
 
 
-text = "Python is great, and Python is fun!"
-print(extract_unique_words(text))
+if __name__ == "__main__":
+    text = "Python is great, and Python is fun!"
+    print(extract_unique_words(text))
@@ -5,10 +5,12 @@ Provides Pydantic models for validating user input such as
 email addresses and authentication credentials.
 """
 
-from .email_validator import User as RuleBasedEmailUser
-from .email_validator_re import User as RegexEmailUser
+from .._lazy import attach
 
-__all__ = [
-    "RuleBasedEmailUser",
-    "RegexEmailUser",
-]
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "RuleBasedEmailUser": ".email_validator:User",
+        "RegexEmailUser": ".email_validator_re:User",
+    },
+)
@@ -0,0 +1,62 @@
+import asyncio
+import threading
+
+import pytest
+
+from myutils.auth.auth_service import AuthService, LoginStatus
+from myutils.auth.credential_store import CredentialStore, MemoryBackend, Pbkdf2Hasher
+
+
+class RecordingBackend(MemoryBackend):
+    """Memory backend noting the threads it is called from."""
+
+    def __init__(self):
+        super().__init__()
+        self.threads = set()
+
+    def get(self, username):
+        self.threads.add(threading.get_ident())
+        return super().get(username)
+
+    def __contains__(self, username):
+        self.threads.add(threading.get_ident())
+        return super().__contains__(username)
+
+
+def make_service(backend=None):
+    store = CredentialStore(backend, hasher=Pbkdf2Hasher(iterations=1000))
+    return AuthService(store, max_attempts=5)
+
+
+def test_unknown_user_and_wrong_password_look_the_same():
+    async def scenario():
+        service = make_service()
+        await service.register("alice", "secret1")
+        return (
+            await service.login("alice", "wrong1"),
+            await service.login("mallory", "wrong1"),
+        )
+
+    wrong_password, unknown_user = asyncio.run(scenario())
+
+    assert wrong_password.status is LoginStatus.INVALID_CREDENTIALS
+    assert unknown_user.status is LoginStatus.INVALID_CREDENTIALS
+    assert wrong_password.message == unknown_user.message
+
+
+def test_backend_is_not_called_on_the_event_loop():
+    backend = RecordingBackend()
+
+    async def scenario():
+        service = make_service(backend)
+        await service.register("alice", "secret1")
+        with pytest.raises(ValueError, match="already exists"):
+            await service.register("alice", "secret2")
+        await service.login("alice", "secret1")
+        await service.login("bob", "secret1")
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(scenario())
+
+    assert backend.threads
+    assert loop_thread not in backend.threads
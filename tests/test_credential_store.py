@@ -0,0 +1,39 @@
+import pytest
+
+from myutils.auth.credential_store import (
+    CredentialBackend,
+    PasswordHasher,
+    Pbkdf2Hasher,
+    verify_password,
+)
+
+
+@pytest.mark.parametrize("interface", [PasswordHasher, CredentialBackend])
+def test_interfaces_are_abstract(interface):
+    with pytest.raises(TypeError):
+        interface()
+
+
+def test_backend_missing_a_method_cannot_be_created():
+    class NoDelete(CredentialBackend):
+        def get(self, username):
+            return None
+
+        def add(self, username, password_hash):
+            return False
+
+        def replace(self, username, password_hash, expected=None):
+            return False
+
+        def __len__(self):
+            return 0
+
+    with pytest.raises(TypeError, match="delete"):
+        NoDelete()
+
+
+def test_concrete_hasher_round_trip():
+    encoded = Pbkdf2Hasher(iterations=1000).hash("secret")
+
+    assert verify_password("secret", encoded)
+    assert not verify_password("Secret", encoded)
@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from myutils.math_ops.expression import evaluate_expression
+
+
+@pytest.mark.parametrize("text", ["2 ** 10 ** 20", "2 ** 10 ** 30", "a ** 10 ** 20"])
+def test_integer_power_overflow_is_not_wrapped(text):
+    with np.errstate(over="ignore"):
+        values = evaluate_expression(text, {"a": np.array([2, 3])}).values
+
+    assert np.all(np.isinf(values))
+
+
+def test_integer_power_promotes_only_when_needed():
+    a = np.array([2, 3, -1])
+
+    assert evaluate_expression("a ** 3", {"a": a}).values.tolist() == [8, 27, -1]
+    assert evaluate_expression("a ** 3", {"a": a}).values.dtype == np.int64
+
+    large = evaluate_expression("a ** 40", {"a": a}).values
+    assert large.dtype == np.float64
+    assert large.tolist() == [2.0**40, 3.0**40, 1.0]
+
+
+def test_negative_constant_exponent_gives_floats():
+    values = evaluate_expression("a ** -2", {"a": np.array([2, 4])}).values
+
+    assert values.tolist() == [0.25, 0.0625]
@@ -0,0 +1,18 @@
+import importlib
+import types
+
+import myutils.math_ops as math_ops
+
+
+def test_exports_are_functions_after_their_modules_load():
+    importlib.import_module("myutils.math_ops._prime_count")
+    importlib.import_module("myutils.math_ops._factorize")
+
+    assert not isinstance(math_ops.prime_count, types.ModuleType)
+    assert not isinstance(math_ops.factorize, types.ModuleType)
+    assert math_ops.prime_count(100) == 25
+    assert math_ops.factorize(360) == {2: 3, 3: 2, 5: 1}
+
+
+def test_package_is_a_plain_module():
+    assert type(math_ops) is types.ModuleType
@@ -0,0 +1,36 @@
+import pytest
+from pydantic import ValidationError
+
+from myutils.auth.breach_filter import use_breach_filter
+from myutils.auth.password_strength_checker_re import PASSWORD_REGEX, User
+
+
+@pytest.mark.parametrize(
+    "password",
+    [
+        "ПАРОЛЬпароль1!",  # Cyrillic letters are not [a-z] or [A-Z]
+        "PASSWORDé1!",  # é is not [a-z]
+        "Pass²word!x",  # superscript two is not \d
+    ],
+)
+def test_rejects_what_the_regex_rejects(password):
+    assert PASSWORD_REGEX.match(password) is None
+    with pytest.raises(ValidationError):
+        User(password=password)
+
+
+@pytest.mark.parametrize(
+    "password", ["StrongP@ssw0rd!", "QwErTy12!", "Straße٣Pass!"]
+)
+def test_accepts_what_the_regex_accepts(password):
+    assert PASSWORD_REGEX.match(password) is not None
+    assert User(password=password).password == password
+
+
+def test_breach_filter_applies():
+    use_breach_filter({"StrongP@ssw0rd!"})
+    try:
+        with pytest.raises(ValidationError, match="data breach"):
+            User(password="StrongP@ssw0rd!")
+    finally:
+        use_breach_filter(None)
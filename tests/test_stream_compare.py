@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+
+from myutils.math_ops.stream_compare import TopK
+
+
+def reference_top_k(values, k, largest):
+    order = sorted(
+        range(len(values)),
+        key=lambda i: (-values[i] if largest else values[i], i),
+    )
+    return [(float(values[i]), i) for i in order[:k]]
+
+
+def test_ties_keep_earliest_positions():
+    assert TopK(3).update(np.ones(1000)).items() == [(1.0, 0), (1.0, 1), (1.0, 2)]
+
+
+@pytest.mark.parametrize("largest", [True, False])
+@pytest.mark.parametrize("chunk", [7, 64, 1000])
+def test_matches_stable_sort_with_many_ties(largest, chunk):
+    values = np.random.default_rng(0).integers(0, 5, 1000).astype(np.float64)
+    top = TopK(10, largest=largest)
+    for start in range(0, len(values), chunk):
+        top.update(values[start : start + chunk])
+
+    assert top.items() == reference_top_k(values, 10, largest)
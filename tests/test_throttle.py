@@ -0,0 +1,68 @@
+from myutils.auth.throttle import LoginThrottle
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_throttle(clock, **kwargs):
+    options = dict(user_attempts=3, window=10, idle_timeout=1000, clock=clock)
+    options.update(kwargs)
+    return LoginThrottle(**options)
+
+
+def attempt_at(throttle, clock, when, username="bob", source=None):
+    clock.now = when
+    return throttle.attempt(username, source)
+
+
+def test_attempt_after_idle_windows_is_counted():
+    clock = FakeClock()
+    throttle = make_throttle(clock)
+    attempt_at(throttle, clock, 0)
+
+    decisions = [attempt_at(throttle, clock, t) for t in (25, 25.1, 25.2, 25.3)]
+
+    assert [d.remaining for d in decisions[:3]] == [2, 1, 0]
+    assert [d.allowed for d in decisions] == [True, True, True, False]
+
+
+def test_attempt_after_one_idle_window_is_counted_in_full():
+    clock = FakeClock()
+    throttle = make_throttle(clock)
+    attempt_at(throttle, clock, 0)
+
+    # The attempt at 0 weighs 0.5 at t=15; the new one must count as 1.
+    assert attempt_at(throttle, clock, 15).remaining == 1
+
+
+def test_limit_holds_after_lockout_longer_than_two_windows():
+    clock = FakeClock()
+    throttle = make_throttle(clock, lockout=50)
+    for t in (0, 1, 2):
+        attempt_at(throttle, clock, t)
+    assert not attempt_at(throttle, clock, 3).allowed
+
+    decisions = [attempt_at(throttle, clock, t) for t in (60, 60.1, 60.2, 60.3)]
+
+    assert [d.allowed for d in decisions] == [True, True, True, False]
+
+
+def test_success_refunds_attempt_after_window_rollover():
+    clock = FakeClock()
+    throttle = make_throttle(clock, source_attempts=3)
+    attempt_at(throttle, clock, 9, "amy", "10.0.0.1")
+
+    # The attempt at 9 rolled into the previous window by t=10.5.
+    clock.now = 10.5
+    throttle.succeeded("amy", "10.0.0.1")
+
+    decisions = [
+        attempt_at(throttle, clock, t, user, "10.0.0.1")
+        for t, user in ((10.6, "bob"), (10.7, "eve"))
+    ]
+    assert [d.remaining for d in decisions] == [2, 1]